@@ -9,13 +9,32 @@ Leibniz Institut für Werkstofforientierte Technologien IWT, Bremen, Germany
 from importlib.metadata import version, PackageNotFoundError
 
 from .apply_mesh_tool_to_workpiece import apply_mesh_tool_to_workpiece
+from .apply_mesh_tool_parallel import apply_mesh_tool_parallel
+from .axis_log import AxisLog
 from .combine_surface import combine_surface
 from .export_surface import export_surface
+from .export_surface_binary import (export_surface_gsf, export_surface_raw,
+                                    export_surface_sdf)
 from .gen_surface_mesh import gen_surface_mesh
 from .gen_tool_mesh_with_offsets import gen_tool_mesh_with_offsets
-from .helpers import pairwise, round_up_to_base, default_parameters, get_surface_subset
+from .gen_tool_path import gen_tool_path
+from .height_pyramid import HeightPyramid
+from .import_surface import import_surface
+from .helpers import (pairwise, round_up_to_base, default_parameters,
+                      call_into, get_grid_axes, get_grid_selection, get_grid_spacing,
+                      get_grid_z, get_subset_offset, get_surface_extent, 
+                      get_surface_subset, print_not_engaged, MeshSequence,
+                      AxesMeshSequence)
 from .mesh_tool_fly_cut import MeshToolFlyCut
-from .slice_surface import slice_surface
+from .quantized_heights import QuantizedHeights
+from .read_gcode import read_gcode
+from .regular_surface import RegularSurface
+from .slice_surface import get_tile_slices, slice_surface
+from .surface_patch import SurfacePatch, as_surface
+from .tile_store import TileHeights, TileStore
+from .tool_path import ToolPath
+from .tool_stamp_cache import ToolStampCache
+from .workspace import Workspace
 
 # compatability imports (uncomment these to mimic legacy interface)
 # from .combine_surface import combine_surface as combineSurface  # pylint: disable=W0404
@@ -0,0 +1,441 @@
+# -*- coding: utf-8 -*-
+"""
+Apply a mesh tool to a workpiece in parallel (processes with shared memory or threads).
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author: Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+from concurrent.futures import ThreadPoolExecutor
+import mmap
+import os
+import tempfile
+
+import numpy as np
+from joblib import Parallel, delayed, effective_n_jobs
+
+from .apply_mesh_tool_to_workpiece import apply_mesh_tool_to_workpiece
+from .helpers import (get_grid_axes, get_grid_selection, get_surface_extent,
+                      get_surface_subset)
+from .regular_surface import RegularSurface
+from .slice_surface import get_tile_slices
+from .surface_patch import SurfacePatch
+from .tool_path import ToolPath
+
+
+SPLITS = ('tiles', 'positions')
+BACKENDS = ('processes', 'threads')
+
+
+def apply_mesh_tool_parallel(patch_xyz, tool_pos, tool, x_div=None, y_div=None, 
+                             n_jobs=-1, split='tiles', n_chunks=None, 
+                             backend='processes', **kwargs):
+    """Apply a meshed tool to a surface in parallel.
+
+    With the 'processes' backend the surface heights (and tool positions) are
+    placed in shared memory once, so only tile descriptors and tool parameters
+    are transferred to the worker processes. The workers write to the shared
+    heights, which are returned without copying them back. Heights 
+    memory-mapped from a file (`np.memmap`, e.g. from `gen_surface_mesh(..., 
+    filename=...)`) are shared through their file, so `in_place=True` 
+    modifies them without any copy. The 'threads' backend works on
+    the arrays directly, as most of the time is spent in NumPy ufuncs 
+    releasing the GIL, and avoids the startup of worker processes for short 
+    simulations. The work is either split over the surface or over the tool 
+    path:
+    
+    'tiles': Each worker applies the tool to a tile of the surface (see 
+             `slice_surface`) and writes the result back in place. Each tile
+             is owned by one worker, so no overlapping regions are written 
+             concurrently. A spatial index over the tool path (`ToolPath`)
+             restricts each tile to the tool positions that can reach it, 
+             tiles without such positions are skipped.
+    'positions': Each worker applies a contiguous chunk of the tool path to 
+                 a copy of the region of the surface its footprints cover. As
+                 material removal is a minimum over all tool positions, the 
+                 partial surfaces are merged pairwise (tree reduction) with 
+                 `np.minimum`. This balances long tool paths over small 
+                 surfaces better than tiles.
+
+    Args:
+        patch_xyz (list of arrays or RegularSurface): Surface patches 
+                                                     (X- & Y-Meshes and Z-height).
+        tool_pos (list of arrays or ToolPath): Tool positions to be simulated.
+        tool (tool class): Tool class to apply.
+        x_div (int, optional): No of tiles in X-direction (1st dim., as for 
+                               `slice_surface`). Defaults to None (number of 
+                               jobs).
+        y_div (int, optional): No of tiles in Y-direction (2nd dim., as for 
+                               `slice_surface`). Defaults to None (1).
+        n_jobs (int, optional): Number of worker processes or threads. 
+                                Defaults to -1 (all CPUs).
+        split (str, optional): Split work over 'tiles' of the surface or 
+                               over chunks of tool 'positions'. 
+                               Defaults to 'tiles'.
+        n_chunks (int, optional): Number of chunks of tool positions for 
+                                  split 'positions'. Defaults to None 
+                                  (number of jobs).
+        backend (str, optional): Run workers as 'processes' (joblib with 
+                                 shared memory) or 'threads' 
+                                 (ThreadPoolExecutor). 
+                                 Defaults to 'processes'.
+        **kwargs: Options passed to `apply_mesh_tool_to_workpiece` 
+                  (e.g. kernel or batch_size). With `in_place=True` the 
+                  heights of the surface patch are modified, with 
+                  `verbose=False` tool positions not engaged with the 
+                  surface are not printed (otherwise once for the whole 
+                  surface).
+
+    Raises:
+        ValueError: Unknown split.
+        ValueError: Unknown backend.
+
+    Returns:
+        list of arrays or RegularSurface: Modified surface patches 
+                                          (X- & Y-Meshes and Z-height).
+    """
+    if split not in SPLITS:
+        raise ValueError(f'unknown split {split}, use one of {SPLITS}')
+    if backend not in BACKENDS:
+        raise ValueError(f'unknown backend {backend}, use one of {BACKENDS}')
+    
+    in_place = kwargs.pop('in_place', False)
+    axes = get_grid_axes(patch_xyz)
+    tool_path = ToolPath.from_mesh(tool_pos)
+    lim_z = np.max(patch_xyz[2])
+    if tool_path.lim_z is None or tool_path.lim_z < lim_z:
+        tool_path.build_index(tool, lim_z)
+    if kwargs.pop('verbose', True):
+        tool_path.print_not_engaged(tool, lim_z)
+    kwargs['verbose'] = False
+    
+    if split == 'tiles':
+        tasks = _get_tile_tasks(patch_xyz, axes, tool_path, 
+                                x_div or effective_n_jobs(n_jobs), y_div or 1)
+    else:
+        tasks = _get_position_tasks(patch_xyz, axes, tool_path, 
+                                    n_chunks or effective_n_jobs(n_jobs))
+
+    tool_pos = np.stack([tool_path.x, tool_path.y, tool_path.z])
+    if backend == 'threads':
+        surf_z = patch_xyz[2] if in_place else np.array(patch_xyz[2])
+        mesh_xy = None if axes is not None else (patch_xyz[0], patch_xyz[1])
+        with ThreadPoolExecutor(max_workers=effective_n_jobs(n_jobs)) as pool:
+            partial_z = list(pool.map(
+                lambda task: _apply_region(surf_z, mesh_xy, axes, task[0], 
+                                           tool_pos[:, task[1]], tool, kwargs,
+                                           split == 'tiles'),
+                tasks))
+    else:
+        surf_z, partial_z = _run_shared(patch_xyz, axes, tool_pos, tool, 
+                                        tasks, n_jobs, split, in_place, kwargs)
+
+    if split == 'positions':
+        partials = [(region, part_z) 
+                    for (region, _), part_z in zip(tasks, partial_z)]
+        while len(partials) > 1:
+            partials = [_merge_partials(surf_z, *partials[k:k + 2]) 
+                        for k in range(0, len(partials), 2)]
+        for region, part_z in partials:
+            surf_z[region] = part_z
+
+    if in_place:
+        if surf_z is not patch_xyz[2]:
+            patch_xyz[2][...] = surf_z
+        return patch_xyz
+    
+    if isinstance(patch_xyz, (RegularSurface, SurfacePatch)):
+        return patch_xyz.with_z(surf_z)
+    
+    return [patch_xyz[0], patch_xyz[1], surf_z]
+
+
+def _run_shared(patch_xyz, axes, tool_pos, tool, tasks, n_jobs, split, 
+                in_place, kwargs):
+    """Run tasks in worker processes on a surface in shared memory.
+
+    The shared arrays are memory-mapped files (in /dev/shm if available). 
+    Arrays already mapped from a file are shared through it, all other 
+    arrays are copied once. The heights are written by the workers and 
+    returned as a view of the shared memory.
+
+    Args:
+        patch_xyz (list of arrays or RegularSurface): Surface patches.
+        axes (tuple of arrays): Axes of the surface in X and Y or None.
+        tool_pos (array of float): Tool positions (3 x number of positions).
+        tool (tool class): Tool class to apply.
+        tasks (list of tuples): Regions and indices of tool positions.
+        n_jobs (int): Number of worker processes.
+        split (str): Split of the work ('tiles' or 'positions').
+        in_place (bool): Share the heights of the surface patch themselves if
+                         they are mapped from a writable file.
+        kwargs (dict): Options for `apply_mesh_tool_to_workpiece`.
+
+    Returns:
+        array of float, list: Heights of the surface and partial heights 
+                              of the regions (None for tiles).
+    """
+    if not tasks:
+        return (patch_xyz[2] if in_place else np.array(patch_xyz[2])), []
+    
+    filenames = []
+    try:
+        if in_place and _is_mapped(patch_xyz[2], writable=True):
+            surf_z = patch_xyz[2]
+        else:
+            surf_z = _create_shared(patch_xyz[2], filenames)
+        arrays = {'z': surf_z, 'tool_pos': _share(tool_pos, filenames)}
+        if axes is None:
+            arrays['x'] = _share(patch_xyz[0], filenames)
+            arrays['y'] = _share(patch_xyz[1], filenames)
+        
+        descriptors = {key: (array.filename, array.offset, array.shape, 
+                             array.dtype.str)
+                       for key, array in arrays.items()}
+        partial_z = Parallel(n_jobs=n_jobs)(
+            delayed(_apply_part)(descriptors, region, candidates, axes, tool, 
+                                 kwargs, split == 'tiles')
+            for region, candidates in tasks)
+    finally:
+        # the mappings stay valid after the files are removed
+        for filename in filenames:
+            try:
+                os.remove(filename)
+            except OSError:
+                pass
+    
+    if surf_z is patch_xyz[2]:
+        return surf_z, partial_z
+    return surf_z.view(np.ndarray), partial_z
+
+
+def _get_tile_tasks(patch_xyz, axes, tool_path, x_div, y_div):
+    """Get the tiles of a surface with the tool positions reaching them.
+
+    Args:
+        patch_xyz (list of arrays or RegularSurface): Surface patches.
+        axes (tuple of arrays): Axes of the surface in X and Y or None.
+        tool_path (ToolPath): Tool path with index.
+        x_div (int): No of tiles in X-direction.
+        y_div (int): No of tiles in Y-direction.
+
+    Returns:
+        list of tuples: Tiles (tuple of slices) and indices of tool positions.
+    """
+    tasks = []
+    for tile in get_tile_slices(np.shape(patch_xyz[2]), x_div, y_div):
+        if axes is not None:
+            extent = get_surface_extent(None, (axes[0][tile[1]], axes[1][tile[0]]))
+        else:
+            extent = get_surface_extent([patch_xyz[0][tile], patch_xyz[1][tile]])
+        candidates = tool_path.query(*extent)
+        if candidates.size > 0:
+            tasks.append((tile, candidates))
+    return tasks
+
+
+def _get_position_tasks(patch_xyz, axes, tool_path, n_chunks):
+    """Get chunks of tool positions with the region of the surface they reach.
+
+    Args:
+        patch_xyz (list of arrays or RegularSurface): Surface patches.
+        axes (tuple of arrays): Axes of the surface in X and Y or None.
+        tool_path (ToolPath): Tool path with footprints.
+        n_chunks (int): Number of chunks.
+
+    Returns:
+        list of tuples: Regions (tuple of slices) and indices of tool positions.
+    """
+    engaged = np.flatnonzero(~(np.isnan(tool_path.x_lim[0]) 
+                               | np.isnan(tool_path.y_lim[0])))
+    tasks = []
+    for candidates in np.array_split(engaged, min(n_chunks, max(engaged.size, 1))):
+        if candidates.size == 0:
+            continue
+        limits = ((np.min(tool_path.x_lim[0, candidates]), 
+                   np.max(tool_path.x_lim[1, candidates])),
+                  (np.min(tool_path.y_lim[0, candidates]), 
+                   np.max(tool_path.y_lim[1, candidates])))
+        if axes is not None:
+            region = get_grid_selection(axes, limits)
+        else:
+            _, region = get_surface_subset(patch_xyz, limits)
+        if region is not None:
+            tasks.append((region, candidates))
+    return tasks
+
+
+def _merge_partials(surf_z, partial_a, partial_b=None):
+    """Merge two partial surfaces by their minimum.
+
+    Args:
+        surf_z (array of float): Heights of the original surface.
+        partial_a (tuple): Region (tuple of slices) and heights of 1st part.
+        partial_b (tuple, optional): Region and heights of 2nd part. 
+                                     Defaults to None.
+
+    Returns:
+        tuple: Region (bounding both regions) and merged heights.
+    """
+    if partial_b is None:
+        return partial_a
+    
+    region = tuple(slice(min(sel_a.start, sel_b.start), max(sel_a.stop, sel_b.stop))
+                   for sel_a, sel_b in zip(partial_a[0], partial_b[0]))
+    merged_z = surf_z[region].copy()
+    for part_region, part_z in (partial_a, partial_b):
+        local = tuple(slice(sel.start - outer.start, sel.stop - outer.start)
+                      for sel, outer in zip(part_region, region))
+        np.minimum(merged_z[local], part_z, out=merged_z[local])
+    
+    return region, merged_z
+
+
+def _is_mapped(array, writable=False):
+    """Check if an array is mapped from a file as a whole.
+
+    Args:
+        array (array): Array to check.
+        writable (bool, optional): Require changes to be written to the file.
+                                   Defaults to False.
+
+    Returns:
+        bool: True if the array can be opened from its file by other 
+              processes.
+    """
+    return (isinstance(array, np.memmap) and array.filename is not None 
+            and isinstance(array.base, mmap.mmap) 
+            and array.flags.c_contiguous 
+            and (not writable or array.mode in ('r+', 'w+')))
+
+
+def _share(array, filenames):
+    """Share an array through its file or a copy in shared memory.
+
+    Args:
+        array (array): Array to share.
+        filenames (list of str): Files created for shared memory.
+
+    Returns:
+        np.memmap: Array mapped from a file.
+    """
+    if _is_mapped(array):
+        return array
+    return _create_shared(array, filenames)
+
+
+def _create_shared(array, filenames):
+    """Copy an array to a new memory-mapped file in shared memory.
+
+    Args:
+        array (array): Array to share.
+        filenames (list of str): Files created for shared memory, the new 
+                                 file is appended.
+
+    Returns:
+        np.memmap: Array mapped from the new file.
+    """
+    array = np.asarray(array)
+    directory = '/dev/shm' if os.path.isdir('/dev/shm') else None
+    handle, filename = tempfile.mkstemp(prefix='pysurfsim_', dir=directory)
+    os.close(handle)
+    filenames.append(filename)
+    
+    shared = np.memmap(filename, dtype=array.dtype, mode='w+', 
+                       shape=array.shape)
+    shared[...] = array
+    return shared
+
+
+def _view_shared(descriptor, writable=False):
+    """Get an array view of a memory-mapped file.
+
+    Args:
+        descriptor (tuple): Filename, offset, shape and dtype of the array.
+        writable (bool, optional): Map the file for writing. 
+                                   Defaults to False.
+
+    Returns:
+        array: Array using the mapped file as buffer.
+    """
+    filename, offset, shape, dtype = descriptor
+    return np.memmap(filename, dtype=dtype, mode='r+' if writable else 'r', 
+                     offset=offset, shape=shape).view(np.ndarray)
+
+
+def _apply_part(descriptors, region, candidates, axes, tool, kwargs, in_place):
+    """Apply tool positions to a region of a surface in shared memory.
+
+    Args:
+        descriptors (dict): Files, offsets, shapes and dtypes of the shared 
+                            arrays.
+        region (tuple of slices): Region of the surface.
+        candidates (array of int): Indices of the tool positions to apply.
+        axes (tuple of arrays): Axes of the surface in X and Y or None.
+        tool (tool class): Tool class to apply.
+        kwargs (dict): Options for `apply_mesh_tool_to_workpiece`.
+        in_place (bool): Write the result to the shared surface (tiles owned 
+                         by this worker) or return it (partial surface).
+
+    Returns:
+        array of float: Heights of the region (None if written in place).
+    """
+    surf_z = _view_shared(descriptors['z'], writable=in_place)
+    tool_pos = _view_shared(descriptors['tool_pos'])[:, candidates]
+    mesh_xy = None
+    if axes is None:
+        mesh_xy = (_view_shared(descriptors['x']), 
+                   _view_shared(descriptors['y']))
+    
+    return _apply_region(surf_z, mesh_xy, axes, region, tool_pos, tool, 
+                         kwargs, in_place)
+
+
+def _apply_region(surf_z, mesh_xy, axes, region, tool_pos, tool, kwargs, in_place):
+    """Apply tool positions to a region of a surface.
+
+    Args:
+        surf_z (array of float): Heights of the surface.
+        mesh_xy (tuple of arrays): X- & Y-Meshes of the surface (if no axes).
+        axes (tuple of arrays): Axes of the surface in X and Y or None.
+        region (tuple of slices): Region of the surface.
+        tool_pos (array of float): Tool positions to apply.
+        tool (tool class): Tool class to apply.
+        kwargs (dict): Options for `apply_mesh_tool_to_workpiece`.
+        in_place (bool): Write the result to the surface or return it.
+
+    Returns:
+        array of float: Heights of the region (None if written in place).
+    """
+    if axes is not None:
+        patch = RegularSurface(axes[0][region[1]], axes[1][region[0]], 
+                               surf_z[region])
+    else:
+        patch = [mesh_xy[0][region], mesh_xy[1][region], surf_z[region]]
+
+    part_z = apply_mesh_tool_to_workpiece(patch, tool_pos, tool, 
+                                          in_place=in_place, **kwargs)[2]
+    
+    return None if in_place else part_z
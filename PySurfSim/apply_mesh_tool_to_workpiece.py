@@ -25,56 +25,976 @@ along with this library; if not, write to the Free Software Foundation, Inc.,
           Badgasteiner Straße 2
           28359 Bremen
           Germany
-@version: 1.2
-@date:    2022-03-31
+@version: 1.3
+@date:    2026-10-17
 """
+import tempfile
+
 import numpy as np
-from .helpers import get_surface_subset
+from .helpers import (call_into, get_grid_axes, get_grid_selection, 
+                      get_grid_spacing, get_grid_z, get_surface_extent, 
+                      get_surface_subset, print_not_engaged)
+from .height_pyramid import HeightPyramid
+from .jit_kernels import NUMBA_AVAILABLE, apply_positions
+from .mesh_tool_fly_cut import MeshToolFlyCut
+from .quantized_heights import QuantizedHeights
+from .regular_surface import RegularSurface
+from .surface_patch import SurfacePatch
+from .tile_store import TileStore
+from .tool_path import ToolPath
+from .tool_stamp_cache import ToolStampCache
+from .workspace import Workspace
+
 
+KERNELS = ('mesh', 'separable', 'envelope', 'stamp', 'jit', 'jit_parallel')
+TILE_ORDERS = ('rows', 'hilbert')
+MEMORY_LIMIT = 2**28
+# number of tile sized arrays held at once while applying the tool to a tile
+_TILE_COPIES = 4
+# options of apply_mesh_tool_to_workpiece and their defaults
+_OPTIONS = {'stamp_cache_size': 64, 'batch_size': None, 'memory_limit': None,
+            'out': None, 'in_place': False, 'tile_size': None, 
+            'tile_order': 'rows', 'verbose': True}
 
-def apply_mesh_tool_to_workpiece(patch_xyz, tool_pos, tool):
+
+def apply_mesh_tool_to_workpiece(patch_xyz, tool_pos, tool, kernel='mesh',
+                                 **options):
     """Apply a meshed tool to a surface patch.
 
+    The surface is processed by one of the following execution strategies 
+    (see `_get_strategy`): tile by tile for a TileStore, out-of-core for a 
+    memory limit or memory-mapped / quantized heights, by cache tiles for a 
+    tile size and in memory at once otherwise. The tiles of the first three 
+    are processed in memory with the same kernel.
+
     Args:
-        patch_xyz (list of arrays): Surface patches (X- & Y-Meshes and Z-height).
-        tool_pos (list of arrays): Tool positions to be simulated.
+        patch_xyz (list of arrays, RegularSurface or TileStore): Surface 
+            patches (X- & Y-Meshes and Z-height). The tiles of a TileStore 
+            are read, processed and written one at a time (tiles that have 
+            not been written are skipped).
+        tool_pos (list of arrays or ToolPath): Tool positions to be simulated.
+            For a ToolPath with index (see `ToolPath.build_index`) only the 
+            positions that can reach the surface patch are applied.
         tool (tool class): Tool class to apply.
+        kernel (str, optional): Evaluation of the tool geometry
+            'mesh': evaluate `tool.get_z` on the meshes of each footprint,
+            'separable': evaluate `tool.get_z_separable` on the grid axes 
+                         (`tool.get_z` on their meshes if the tool does not 
+                         provide it, see `get_grid_z`),
+            'envelope': apply the lower envelope of each row (i.e. consecutive 
+                        tool positions sharing Y and Z) at once 
+                        (`tool.get_z_envelope`),
+            'stamp': reuse tool height maps for tool positions at the same 
+                     sub-pixel phase on a uniformly spaced grid (see 
+                     `ToolStampCache`), other positions are evaluated as for 
+                     'separable',
+            'jit': apply all tool positions in a single loop compiled with 
+                   Numba (see `jit_kernels`), heights as for 'separable',
+            'jit_parallel': as 'jit' with bands of rows processed in 
+                            parallel threads.
+            The axes based kernels require a regular grid, otherwise 'mesh' 
+            is used. The compiled kernels require Numba and a MeshToolFlyCut 
+            in float64 (geometry from `kernel_parameters`), otherwise 
+            'separable' is used. Defaults to 'mesh'.
+        **options: Options of the kernels and execution strategies, see 
+                   Keyword Args.
+
+    Keyword Args:
+        stamp_cache_size (int): Maximum number of cached tool stamps for 
+                                kernel 'stamp'. Defaults to 64.
+        batch_size (int or str): Number of tool positions evaluated at once 
+            in a single broadcast `tool.get_z` call (kernels 'mesh' and 
+            'separable' only). 'row' evaluates each row of tool positions at 
+            once. Temporary memory grows with the batch size times the 
+            largest footprint. None applies the positions one by one. 
+            Defaults to None.
+        memory_limit (int): Maximum memory in bytes for surface heights 
+            during the simulation. The heights are loaded, processed and 
+            written back tile by tile in memory order, each tile only with the
+            tool positions reaching it (out-of-core mode). Used for 
+            memory-mapped heights (np.memmap, e.g. `gen_surface_mesh(..., 
+            filename=...)`) and QuantizedHeights (dequantized tile by tile) 
+            with a limit of `MEMORY_LIMIT` if None. Defaults to None.
+        out (array): Array for the resulting heights in out-of-core mode, 
+            e.g. a np.memmap or the input heights themselves. Defaults to None
+            (memory-mapped temporary file for memory-mapped heights, 
+            QuantizedHeights for QuantizedHeights, array in memory otherwise). 
+            For a TileStore, the directory of a new TileStore for the result; 
+            the tiles of the input store are replaced if None.
+        in_place (bool): Modify the heights of the surface patch instead of a
+            copy (or write them back tile by tile in out-of-core mode if 
+            `out` is None). TileStores are always modified in place if `out` 
+            is None. Defaults to False.
+        tile_size (int or tuple of int): Rows and columns of cache tiles. The 
+            tool positions are grouped by the tiles their footprints reach 
+            and each tile is processed with all of its positions at once 
+            while it is held in the CPU cache (e.g. 128 x 128 float64 heights
+            for 128 kB). None processes the tool positions in path order. 
+            Defaults to None.
+        tile_order (str): Order in which cache tiles are processed, 'rows' 
+            (row by row) or 'hilbert' (along a Hilbert curve, keeping 
+            consecutive tiles adjacent). Defaults to 'rows'.
+        verbose (bool): Print the tool positions that are not engaged with 
+            the surface. Tiled modes decide this once for the maximum height 
+            of the whole surface. Defaults to True.
+
+    Raises:
+        TypeError: Unknown option.
+        ValueError: Unknown kernel.
+        ValueError: Invalid batch size or batches used with unsupported kernel.
+        ValueError: Memory limit not positive.
+        ValueError: Tile size not positive or unknown tile order.
+
+    Returns:
+        list of arrays, RegularSurface or TileStore: Modified surface patches 
+                                                    (X- & Y-Meshes and Z-height).
+    """
+    options = _get_options(kernel, options)
+    strategy = _get_strategy(patch_xyz, options)
+    return strategy(patch_xyz, tool_pos, tool, kernel, options)
+
+
+def _get_options(kernel, options):
+    """Check the options of `apply_mesh_tool_to_workpiece`.
+
+    Args:
+        kernel (str): Evaluation of the tool geometry.
+        options (dict): Options given as keyword arguments.
+
+    Raises:
+        TypeError: Unknown option.
+        ValueError: Invalid kernel or option value.
+
+    Returns:
+        dict: All options, defaults for those not given.
+    """
+    unknown = set(options).difference(_OPTIONS)
+    if unknown:
+        raise TypeError('apply_mesh_tool_to_workpiece() got unexpected '
+                        f'keyword arguments {sorted(unknown)}')
+    options = {**_OPTIONS, **options}
+    
+    if kernel not in KERNELS:
+        raise ValueError(f'unknown kernel {kernel}, use one of {KERNELS}')
+    batch_size = options['batch_size']
+    if batch_size is not None:
+        if kernel not in ('mesh', 'separable'):
+            raise ValueError(f'batches are not supported for kernel {kernel}')
+        if batch_size != 'row' and (int(batch_size) != batch_size 
+                                    or batch_size <= 0):
+            raise ValueError('batch size has to be a positive integer or '
+                             f'\'row\' (is {batch_size})')
+    if options['memory_limit'] is not None and options['memory_limit'] <= 0:
+        raise ValueError('memory limit has to be positive (is '
+                         f'{options["memory_limit"]})')
+    if options['tile_size'] is not None and np.min(options['tile_size']) <= 0:
+        raise ValueError('tile size has to be positive (is '
+                         f'{options["tile_size"]})')
+    if options['tile_order'] not in TILE_ORDERS:
+        raise ValueError(f'unknown tile order {options["tile_order"]}, use '
+                         f'one of {TILE_ORDERS}')
+    
+    return options
+
+
+def _get_strategy(patch_xyz, options):
+    """Select the execution strategy for a surface.
+
+    All strategies are called with the surface, the tool positions, the tool,
+    the kernel and the options of `apply_mesh_tool_to_workpiece`.
+
+    Args:
+        patch_xyz (list of arrays, RegularSurface or TileStore): Surface.
+        options (dict): Options of `apply_mesh_tool_to_workpiece`.
 
     Returns:
-        list of arrays: Modified surface patches (X- & Y-Meshes and Z-height).
+        callable: `_apply_tile_store`, `_apply_out_of_core`, 
+                  `_apply_cache_tiles` or `_apply_in_memory`.
     """
-    surf_z = patch_xyz[2].copy()
+    if isinstance(patch_xyz, TileStore):
+        return _apply_tile_store
+    if options['memory_limit'] is not None \
+            or isinstance(patch_xyz[2], (np.memmap, QuantizedHeights)):
+        return _apply_out_of_core
+    if options['tile_size'] is not None:
+        return _apply_cache_tiles
+    return _apply_in_memory
+
 
+def _get_tile_options(options):
+    """Get the options for applying a tool to a single tile in memory.
+
+    Args:
+        options (dict): Options of `apply_mesh_tool_to_workpiece`.
+
+    Returns:
+        dict: Options modifying the heights of the tile in place without 
+              reports of positions not engaged (decided for the whole 
+              surface) and without out-of-core mode.
+    """
+    return dict(options, memory_limit=None, out=None, in_place=True, 
+                verbose=False)
+
+
+def _apply_in_memory(patch_xyz, tool_pos, tool, kernel, options):
+    """Apply a meshed tool to a surface patch held in memory.
+
+    Args:
+        patch_xyz (list of arrays or RegularSurface): Surface patch.
+        tool_pos (list of arrays or ToolPath): Tool positions to be simulated.
+        tool (tool class): Tool class to apply.
+        kernel (str): Evaluation of the tool geometry.
+        options (dict): Options of `apply_mesh_tool_to_workpiece`.
+
+    Returns:
+        list of arrays or RegularSurface: Modified surface patches 
+                                          (X- & Y-Meshes and Z-height).
+    """
+    surf_z = patch_xyz[2] if options['in_place'] else patch_xyz[2].copy()
+    # maxima of surface tiles for local footprint limits
+    pyramid = HeightPyramid(surf_z)
+    # regular grids allow for a footprint lookup on the axes only
+    axes = get_grid_axes(patch_xyz)
+    kernel, grid = _select_kernel(kernel, tool, axes)
+    positions = _get_positions(tool_pos, pyramid, patch_xyz, axes)
+    # scratch buffers for the tool heights of the largest footprint
+    workspace = _create_workspace(tool, positions, pyramid, patch_xyz, axes)
+
+    if options['batch_size'] is not None:
+        for batch in _split_batches(positions, options['batch_size']):
+            _apply_batch(pyramid, patch_xyz, axes, batch, tool, workspace, 
+                         options['verbose'])
+    elif kernel == 'stamp':
+        _apply_stamps(pyramid, axes, grid, positions,
+                      ToolStampCache(tool, grid[2:], 
+                                     maxsize=options['stamp_cache_size']),
+                      workspace, options['verbose'])
+    elif kernel in ('jit', 'jit_parallel'):
+        _apply_jit(pyramid, axes, positions, tool, kernel == 'jit_parallel',
+                   options['verbose'])
+    elif kernel == 'envelope':
+        for row in _split_rows(positions):
+            _apply_row_envelope(pyramid, axes, [row[0], row[1][0], row[2][0]], 
+                                tool, workspace, options['verbose'])
+    elif kernel == 'separable':
+        _apply_grid(pyramid, axes, positions, tool, workspace, 
+                    options['verbose'])
+    else:
+        _apply_meshes(pyramid, patch_xyz, axes, positions, tool, workspace, 
+                      options['verbose'])
+    
+    return _with_heights(patch_xyz, surf_z, options['in_place'])
+
+
+def _select_kernel(kernel, tool, axes):
+    """Fall back to a kernel supported by the surface grid and the tool.
+
+    Args:
+        kernel (str): Requested evaluation of the tool geometry.
+        tool (tool class): Tool class to apply.
+        axes (tuple of arrays): Axes of the surface in X and Y or None.
+
+    Returns:
+        tuple: Kernel to use and uniform grid (see `get_grid_spacing`) for 
+               kernel 'stamp' or None.
+    """
+    if axes is None:
+        return 'mesh', None
+    grid = get_grid_spacing(axes) if kernel == 'stamp' else None
+    if kernel == 'stamp' and grid is None:
+        kernel = 'separable'
+    if kernel in ('jit', 'jit_parallel') and not (
+            NUMBA_AVAILABLE and isinstance(tool, MeshToolFlyCut)
+            and tool.dtype == np.float64):
+        kernel = 'separable'
+    return kernel, grid
+
+
+def _get_positions(tool_pos, pyramid, patch_xyz, axes):
+    """Get the tool positions that can reach a surface patch.
+
+    Args:
+        tool_pos (list of arrays or ToolPath): Tool positions to be simulated.
+        pyramid (HeightPyramid): Pyramid of the surface heights.
+        patch_xyz (list of arrays or RegularSurface): Surface patch.
+        axes (tuple of arrays): Axes of the surface in X and Y or None.
+
+    Returns:
+        list of arrays: Tool positions in X, Y and Z (all positions unless 
+                        `tool_pos` is a ToolPath with index).
+    """
+    positions = [np.ravel(tool_pos_part) for tool_pos_part in tool_pos]
+    if isinstance(tool_pos, ToolPath) and tool_pos.lim_z is not None \
+            and pyramid.max() <= tool_pos.lim_z:
+        candidates = tool_pos.query(*get_surface_extent(patch_xyz, axes))
+        positions = [position[candidates] for position in positions]
+    return positions
+
+
+def _split_batches(positions, batch_size):
+    """Split tool positions into batches evaluated at once.
+
+    Args:
+        positions (list of arrays): Tool positions in X, Y and Z.
+        batch_size (int or str): Number of positions per batch or 'row'.
+
+    Returns:
+        iterator of lists: Tool positions in X, Y and Z for each batch.
+    """
+    if batch_size == 'row':
+        return _split_rows(positions)
+    return ([position[start:start + batch_size] for position in positions]
+            for start in range(0, positions[0].size, batch_size))
+
+
+def _apply_meshes(pyramid, patch_xyz, axes, positions, tool, workspace, 
+                  verbose):
+    """Apply tool positions one by one evaluating `tool.get_z` on meshes.
+
+    Args:
+        pyramid (HeightPyramid): Pyramid of the surface heights (modified in 
+                                 place).
+        patch_xyz (list of arrays or RegularSurface): Surface patch.
+        axes (tuple of arrays): Axes of the surface in X and Y or None.
+        positions (list of arrays): Tool positions in X, Y and Z.
+        tool (tool class): Tool class to apply.
+        workspace (Workspace): Scratch buffers for the tool heights.
+        verbose (bool): Print the tool positions not engaged with the surface.
+    """
+    surf_z = pyramid.surf_z
     # sequentially iterate number of steps in raster direction
-    for tool_center_x, tool_center_y, tool_center_z \
-            in zip(tool_pos[0].flatten(), 
-                   tool_pos[1].flatten(), 
-                   tool_pos[2].flatten()):
+    for tool_center in zip(*positions):
         
-        # caluclate footprint of tool for given height
-        [x_lim, y_lim] = tool.footprint([tool_center_x,
-                                         tool_center_y,
-                                         tool_center_z],
-                                        lim_z=np.max(surf_z))
-        # generate mask with footprint limits
-        if x_lim is None or y_lim is None:
-            print((
-                f'X{tool_center_x:.6f} '
-                f'Y{tool_center_y:.6f} '
-                f'Z{tool_center_z:.6f}: tool not engaged'))
+        # caluclate footprint of tool for local surface height
+        footprint = _get_footprint(tool, list(tool_center), pyramid, 
+                                   patch_xyz, axes, verbose)
+        if footprint is None:
+            continue
+        selection = footprint[2]
+        surf_view = surf_z[selection]
+        tool_z = workspace.get('tool_z', surf_view.shape)
+        subset = [mesh_part[selection] for mesh_part in patch_xyz]
+        call_into(tool.get_z, tool_z, subset, list(tool_center), 
+                  work=[workspace.get('work_x', surf_view.shape),
+                        workspace.get('work_y', surf_view.shape)])
+
+        # save minimum to surface
+        np.minimum(surf_view, tool_z, out=surf_view)
+        pyramid.update(selection)
+
+
+def _apply_grid(pyramid, axes, positions, tool, workspace, verbose):
+    """Apply tool positions one by one evaluating the tool on grid axes.
+
+    Args:
+        pyramid (HeightPyramid): Pyramid of the surface heights (modified in 
+                                 place).
+        axes (tuple of arrays): Axes of the surface in X and Y.
+        positions (list of arrays): Tool positions in X, Y and Z.
+        tool (tool class): Tool class to apply (see `get_grid_z`).
+        workspace (Workspace): Scratch buffers for the tool heights.
+        verbose (bool): Print the tool positions not engaged with the surface.
+    """
+    surf_z = pyramid.surf_z
+    for tool_center in zip(*positions):
+        footprint = _get_footprint(tool, list(tool_center), pyramid, None, 
+                                   axes, verbose)
+        if footprint is None:
+            continue
+        selection = footprint[2]
+        surf_view = surf_z[selection]
+        tool_z = workspace.get('tool_z', surf_view.shape)
+        get_grid_z(tool, axes[0][selection[1]], axes[1][selection[0]],
+                   list(tool_center), out=tool_z)
+        np.minimum(surf_view, tool_z, out=surf_view)
+        pyramid.update(selection)
+
+
+def _with_heights(patch_xyz, surf_z, in_place):
+    """Return a surface patch with new heights.
+
+    Args:
+        patch_xyz (list of arrays or RegularSurface): Surface patch.
+        surf_z (array): Heights of the resulting surface.
+        in_place (bool): The heights of the patch have been modified in place.
+
+    Returns:
+        list of arrays or RegularSurface: The patch itself if modified in 
+                                          place, otherwise a patch of the 
+                                          same type with the heights.
+    """
+    if in_place:
+        return patch_xyz
+    
+    if isinstance(patch_xyz, (RegularSurface, SurfacePatch)):
+        return patch_xyz.with_z(surf_z)
+    
+    return [patch_xyz[0], patch_xyz[1], surf_z]
+
+
+def _apply_out_of_core(patch_xyz, tool_pos, tool, kernel, options):
+    """Apply a meshed tool to a surface tile by tile.
+
+    The tiles fit into the memory limit of the options (`MEMORY_LIMIT` if 
+    None), the resulting heights are written to `out`.
+
+    Args:
+        patch_xyz (list of arrays or RegularSurface): Surface patch.
+        tool_pos (list of arrays or ToolPath): Tool positions to be simulated.
+        tool (tool class): Tool class to apply.
+        kernel (str): Evaluation of the tool geometry.
+        options (dict): Options of `apply_mesh_tool_to_workpiece`.
+
+    Returns:
+        list of arrays or RegularSurface: Modified surface patches 
+                                          (X- & Y-Meshes and Z-height).
+    """
+    surf_z = patch_xyz[2]
+    out = options['out']
+    if out is None and options['in_place']:
+        out = surf_z
+    elif out is None and isinstance(surf_z, np.memmap):
+        out = np.memmap(tempfile.TemporaryFile(), dtype=surf_z.dtype, mode='w+',
+                        shape=surf_z.shape)
+    elif out is None and isinstance(surf_z, QuantizedHeights):
+        out = surf_z.empty_like()
+    elif out is None:
+        out = np.empty_like(surf_z)
+    
+    axes = get_grid_axes(patch_xyz)
+    tool_path = ToolPath.from_mesh(tool_pos)
+    lim_z = np.max(surf_z)
+    if tool_path.lim_z is None or tool_path.lim_z < lim_z:
+        tool_path.build_index(tool, lim_z)
+    if options['verbose']:
+        tool_path.print_not_engaged(tool, lim_z)
+    
+    for tile in _get_memory_tiles(surf_z.shape, surf_z.dtype.itemsize, 
+                                  options['memory_limit'] or MEMORY_LIMIT):
+        tile_z = np.array(surf_z[tile])
+        if axes is not None:
+            patch = RegularSurface(axes[0][tile[1]], axes[1][tile[0]], tile_z)
+        else:
+            patch = [patch_xyz[0][tile], patch_xyz[1][tile], tile_z]
+        out[tile] = apply_mesh_tool_to_workpiece(
+            patch, tool_path, tool, kernel, **_get_tile_options(options))[2]
+    
+    if isinstance(out, np.memmap):
+        out.flush()
+    
+    return _with_heights(patch_xyz, out, out is surf_z)
+
+
+def _apply_cache_tiles(patch_xyz, tool_pos, tool, kernel, options):
+    """Apply a meshed tool to a surface cache tile by cache tile.
+
+    As the resulting surface is the minimum over all tool positions, the 
+    order of the tool positions does not matter and each tile can be 
+    processed with the positions reaching it (found by the spatial index of
+    a `ToolPath`) at once.
+
+    Args:
+        patch_xyz (list of arrays or RegularSurface): Surface patch.
+        tool_pos (list of arrays or ToolPath): Tool positions to be simulated.
+        tool (tool class): Tool class to apply.
+        kernel (str): Evaluation of the tool geometry.
+        options (dict): Options of `apply_mesh_tool_to_workpiece` (cache 
+                        tiles of `tile_size` in `tile_order`).
+
+    Returns:
+        list of arrays or RegularSurface: Modified surface patches 
+                                          (X- & Y-Meshes and Z-height).
+    """
+    surf_z = patch_xyz[2] if options['in_place'] else patch_xyz[2].copy()
+    axes = get_grid_axes(patch_xyz)
+    tool_path = ToolPath.from_mesh(tool_pos)
+    lim_z = np.max(surf_z)
+    if tool_path.lim_z is None or tool_path.lim_z < lim_z:
+        tool_path.build_index(tool, lim_z)
+    if options['verbose']:
+        tool_path.print_not_engaged(tool, lim_z)
+    
+    tile_options = dict(_get_tile_options(options), tile_size=None)
+    for tile in _get_cache_tiles(surf_z.shape, options['tile_size'], 
+                                 options['tile_order']):
+        if axes is not None:
+            patch = RegularSurface(axes[0][tile[1]], axes[1][tile[0]], 
+                                   surf_z[tile])
+        else:
+            patch = [patch_xyz[0][tile], patch_xyz[1][tile], surf_z[tile]]
+        apply_mesh_tool_to_workpiece(patch, tool_path, tool, kernel, 
+                                     **tile_options)
+    
+    return _with_heights(patch_xyz, surf_z, options['in_place'])
+
+
+def _get_cache_tiles(shape, tile_size, tile_order):
+    """Split a height map into cache tiles.
+
+    Args:
+        shape (tuple of int): Shape of the height map.
+        tile_size (int or tuple of int): Rows and columns of the tiles.
+        tile_order (str): Order of the tiles, 'rows' or 'hilbert'.
+
+    Returns:
+        list of tuples of slices: Tiles of the height map.
+    """
+    rows, cols = np.broadcast_to(np.asarray(tile_size, dtype=int), (2,))
+    tile_rows, tile_cols = np.meshgrid(np.arange(0, shape[0], rows), 
+                                       np.arange(0, shape[1], cols), 
+                                       indexing='ij')
+    tile_rows = np.ravel(tile_rows)
+    tile_cols = np.ravel(tile_cols)
+    if tile_order == 'hilbert':
+        order = np.argsort(_get_hilbert_index(tile_cols // cols, 
+                                              tile_rows // rows), kind='stable')
+        tile_rows = tile_rows[order]
+        tile_cols = tile_cols[order]
+    
+    return [(slice(row, min(row + rows, shape[0])), 
+             slice(col, min(col + cols, shape[1])))
+            for row, col in zip(tile_rows, tile_cols)]
+
+
+def _get_hilbert_index(x, y):
+    """Get the distance of grid points along a Hilbert curve.
+
+    Args:
+        x (array of int): Index of the grid points in X.
+        y (array of int): Index of the grid points in Y.
+
+    Returns:
+        array of int: Distance along the Hilbert curve covering the grid.
+    """
+    size = 1
+    while size <= max(np.max(x, initial=0), np.max(y, initial=0)):
+        size *= 2
+    
+    x = np.array(x, dtype=np.int64)
+    y = np.array(y, dtype=np.int64)
+    index = np.zeros_like(x)
+    step = size // 2
+    while step > 0:
+        right = (x & step) > 0
+        top = (y & step) > 0
+        index += step * step * ((3 * right) ^ top)
+        # rotate the quadrant to the orientation of the curve
+        flip = right & ~top
+        x = np.where(flip, size - 1 - x, x)
+        y = np.where(flip, size - 1 - y, y)
+        x, y = np.where(top, x, y), np.where(top, y, x)
+        step //= 2
+    
+    return index
+
+
+def _apply_tile_store(store, tool_pos, tool, kernel, options):
+    """Apply a meshed tool to a surface in a TileStore tile by tile.
+
+    Tiles that have not been written are skipped. The maximum height is taken
+    from the manifest, or from the heights of a written tile if the manifest 
+    has no limits for it.
+
+    Args:
+        store (TileStore): Surface stored in tiles.
+        tool_pos (list of arrays or ToolPath): Tool positions to be simulated.
+        tool (tool class): Tool class to apply.
+        kernel (str): Evaluation of the tool geometry.
+        options (dict): Options of `apply_mesh_tool_to_workpiece` (`out` is 
+                        the directory of the TileStore for the result).
+
+    Returns:
+        TileStore: Modified surface.
+    """
+    if options['out'] is not None:
+        out = TileStore.create(options['out'], store.x_axis, store.y_axis, store.tiles, 
+                               store.dtype, store.compressed, store.quantum)
+    else:
+        out = store
+    
+    indices = [index for index in range(store.n_tiles) 
+               if store.is_written(index)]
+    if not indices:
+        return out
+    
+    # the maximum height is known from the manifest without reading tiles
+    tool_path = ToolPath.from_mesh(tool_pos)
+    lim_z = max(_get_tile_max(store, index) for index in indices)
+    if tool_path.lim_z is None or tool_path.lim_z < lim_z:
+        tool_path.build_index(tool, lim_z)
+    if options['verbose']:
+        tool_path.print_not_engaged(tool, lim_z)
+    
+    tile_options = _get_tile_options(options)
+    with out:
+        for index in indices:
+            out.write_tile(index, apply_mesh_tool_to_workpiece(
+                store.read_tile(index), tool_path, tool, kernel, 
+                **tile_options).z)
+    
+    return out
+
+
+def _get_tile_max(store, index):
+    """Get the maximum height of a written tile of a TileStore.
+
+    Args:
+        store (TileStore): Surface stored in tiles.
+        index (int): Index of the tile.
+
+    Returns:
+        float: Maximum height from the manifest or the heights of the tile.
+    """
+    max_z = store.get_limits(index)[1]
+    if max_z is None:
+        max_z = np.max(store.read_tile(index).z)
+    return max_z
+
+
+def _get_memory_tiles(shape, itemsize, memory_limit):
+    """Split a height map into tiles fitting into a memory limit.
+
+    Tiles are bands of full rows if possible and are returned in memory order.
+
+    Args:
+        shape (tuple of int): Shape of the height map.
+        itemsize (int): Size of a height value in bytes.
+        memory_limit (int): Maximum memory in bytes for surface heights.
+
+    Returns:
+        list of tuples of slices: Tiles of the height map.
+    """
+    tile_size = max(memory_limit // (itemsize * _TILE_COPIES), 1)
+    n_rows, n_cols = shape
+    rows = max(tile_size // n_cols, 1)
+    cols = min(tile_size, n_cols)
+    
+    return [(slice(row, min(row + rows, n_rows)), 
+             slice(col, min(col + cols, n_cols)))
+            for row in range(0, n_rows, rows)
+            for col in range(0, n_cols, cols)]
+
+
+def _split_rows(positions):
+    """Split tool positions into rows of consecutive positions sharing Y and Z.
+
+    Args:
+        positions (list of arrays): Tool positions in X, Y and Z.
+
+    Returns:
+        iterator of lists: Tool positions in X, Y and Z for each row.
+    """
+    if positions[0].size == 0:
+        return iter(())
+    breaks = np.flatnonzero((np.diff(positions[1]) != 0) 
+                            | (np.diff(positions[2]) != 0)) + 1
+    return zip(*(np.split(position, breaks) for position in positions))
+
+
+def _apply_row_envelope(pyramid, axes, row_pos, tool, workspace, verbose):
+    """Apply a row of tool positions sharing Y and Z at once.
+
+    Args:
+        pyramid (HeightPyramid): Pyramid of the surface heights (modified in 
+                                 place).
+        axes (tuple of arrays): Axes of the surface in X and Y.
+        row_pos (list): Tool positions in X (array) and common Y and Z (float).
+        tool (tool class): Tool class to apply.
+        workspace (Workspace): Scratch buffers for the tool heights.
+        verbose (bool): Print the tool positions not engaged with the surface.
+    """
+    surf_z = pyramid.surf_z
+    engaged_x = []
+    x_lims = []
+    y_lims = []
+    for tool_center_x in row_pos[0]:
+        footprint = _get_footprint(tool, [tool_center_x, *row_pos[1:]], 
+                                   pyramid, None, axes, verbose)
+        if footprint is None:
+            continue
+        engaged_x.append(tool_center_x)
+        x_lims.append(footprint[0])
+        y_lims.append(footprint[1])
+
+    if not x_lims:
+        return
+    x_lims = np.transpose(x_lims)
+    # common limits in Y for the largest local height of the row
+    y_lim = max(y_lims, key=lambda lim: lim[1])
+
+    selection = get_grid_selection(
+        axes, ((np.min(x_lims[0]), np.max(x_lims[1])), y_lim))
+    if selection is None:
+        return
+    
+    surf_view = surf_z[selection]
+    tool_z = call_into(tool.get_z_envelope, 
+                       workspace.get('tool_z', surf_view.shape),
+                       axes[0][selection[1]], axes[1][selection[0]],
+                       [engaged_x, row_pos[1], row_pos[2]], x_lims)
+    
+    np.minimum(surf_view, tool_z, out=surf_view)
+    pyramid.update(selection)
+
+
+def _apply_jit(pyramid, axes, positions, tool, parallel, verbose):
+    """Apply all tool positions with a compiled kernel.
+
+    The footprints are computed for the maximum height of the surface, the
+    maxima of the pyramid are not updated (but remain upper bounds).
+
+    Args:
+        pyramid (HeightPyramid): Pyramid of the surface heights (heights 
+                                 modified in place).
+        axes (tuple of arrays): Axes of the surface in X and Y.
+        positions (list of arrays): Tool positions in X, Y and Z.
+        tool (MeshToolFlyCut): Fly-cutter (`kernel_parameters`).
+        parallel (bool): Process bands of rows in parallel threads.
+        verbose (bool): Print the tool positions not engaged with the surface.
+    """
+    lim_z = pyramid.max()
+    r_fly, delta_r_fly, _ = tool.kernel_parameters
+    engaged = lim_z - (positions[2] - (r_fly + delta_r_fly)) > 0
+    if verbose:
+        for tool_center in zip(*(position[~engaged] 
+                                 for position in positions)):
+            print_not_engaged(*tool_center)
+    
+    apply_positions(pyramid.surf_z, axes, 
+                    [position[engaged] for position in positions], 
+                    tool.kernel_parameters, lim_z, parallel=parallel)
+
+
+def _apply_batch(pyramid, patch_xyz, axes, positions, tool, workspace, 
+                 verbose):
+    """Apply several tool positions with a single broadcast tool evaluation.
+
+    The footprints of all positions are padded to a common shape by repeating
+    their last row and column, padded points get an infinite tool height.
+    
+    Args:
+        pyramid (HeightPyramid): Pyramid of the surface heights (modified in 
+                                 place).
+        patch_xyz (list of arrays or RegularSurface): Surface patch.
+        axes (tuple of arrays): Axes of the surface in X and Y or None.
+        positions (list of arrays): Tool positions in X, Y and Z.
+        tool (tool class): Tool class to apply.
+        workspace (Workspace): Scratch buffers for the tool heights.
+        verbose (bool): Print the tool positions not engaged with the surface.
+    """
+    surf_z = pyramid.surf_z
+    engaged = []
+    selections = []
+    for k, tool_center in enumerate(zip(*positions)):
+        footprint = _get_footprint(tool, tool_center, pyramid, patch_xyz, axes,
+                                   verbose)
+        if footprint is None:
             continue
         
-        subset, selection = get_surface_subset(patch_xyz, (x_lim, y_lim))
-        
-        if subset is None:
+        engaged.append(k)
+        selections.append(footprint[2])
+
+    if not engaged:
+        return
+
+    # padded indices of the footprints (batch x rows/columns)
+    index = []
+    valid = []
+    for dim in range(2):
+        start = np.array([selection[dim].start for selection in selections])
+        stop = np.array([selection[dim].stop for selection in selections])
+        dim_index = start[:, np.newaxis] + np.arange(np.max(stop - start))
+        valid.append(dim_index < stop[:, np.newaxis])
+        index.append(np.minimum(dim_index, stop[:, np.newaxis] - 1))
+    rows = index[0][:, :, np.newaxis]
+    cols = index[1][:, np.newaxis, :]
+
+    if axes is not None:
+        target = [axes[0][cols], axes[1][rows]]
+    else:
+        target = [patch_xyz[0][rows, cols], patch_xyz[1][rows, cols]]
+    
+    shape = (len(engaged), rows.shape[1], cols.shape[2])
+    tool_z = call_into(tool.get_z, workspace.get('tool_z', shape), target, 
+                       [np.asarray(position)[engaged][:, np.newaxis, np.newaxis]
+                        for position in positions],
+                       work=[workspace.get('work_x', shape),
+                             workspace.get('work_y', shape)])
+    np.copyto(tool_z, np.inf, 
+              where=~(valid[0][:, :, np.newaxis] & valid[1][:, np.newaxis, :]))
+    
+    if surf_z.flags.c_contiguous:
+        # unbuffered minimum on flat indices is considerably faster
+        np.minimum.at(surf_z.reshape(-1), 
+                      np.ravel(rows * surf_z.shape[1] + cols), np.ravel(tool_z))
+    else:
+        np.minimum.at(surf_z, (rows, cols), tool_z)
+    
+    for selection in selections:
+        pyramid.update(selection)
+
+
+def _apply_stamps(pyramid, axes, grid, positions, cache, workspace, verbose):
+    """Apply tool positions using cached tool stamps.
+
+    Tool positions are anchored at their nearest grid point. Positions whose
+    sub-pixel phase occurs only once are evaluated directly.
+
+    Args:
+        pyramid (HeightPyramid): Pyramid of the surface heights (modified in 
+                                 place).
+        axes (tuple of arrays): Axes of the surface in X and Y.
+        grid (tuple of float): Origin and spacing of the grid in X and Y.
+        positions (list of arrays): Tool positions in X, Y and Z.
+        cache (ToolStampCache): Cache of tool stamps.
+        workspace (Workspace): Scratch buffers for the tool heights.
+        verbose (bool): Print the tool positions not engaged with the surface.
+    """
+    tool = cache.tool
+    surf_z = pyramid.surf_z
+    x_0, y_0, d_x, d_y = grid
+    anchor_x = np.rint((positions[0] - x_0) / d_x)
+    anchor_y = np.rint((positions[1] - y_0) / d_y)
+    phase_x = positions[0] - (x_0 + anchor_x * d_x)
+    phase_y = positions[1] - (y_0 + anchor_y * d_y)
+    # quantized phases identify positions sharing a stamp
+    phase_keys = np.stack((np.rint(phase_x / d_x * 1e9), 
+                           np.rint(phase_y / d_y * 1e9)), axis=1).astype(np.int64)
+    _, phase_index, phase_count = np.unique(phase_keys, axis=0, 
+                                            return_inverse=True, 
+                                            return_counts=True)
+    use_stamp = phase_count[np.ravel(phase_index)] > 1
+
+    for k, tool_center in enumerate(zip(*positions)):
+        footprint = _get_footprint(tool, tool_center, pyramid, None, axes, 
+                                   verbose)
+        if footprint is None:
             continue
+        selection = footprint[2]
+        surf_view = surf_z[selection]
+        tool_z = workspace.get('tool_z', surf_view.shape)
 
-        min_z = np.minimum(
-            surf_z[selection],
-            tool.get_z(subset, [tool_center_x, tool_center_y, tool_center_z])
-        )
+        use_stamp_k = use_stamp[k]
+        if use_stamp_k:
+            # stamps cover the footprint for the maximum height of the surface
+            # to be reused regardless of the local height
+            [x_lim, y_lim] = tool.footprint(tool_center, lim_z=pyramid.max())
+            # extent of unclipped footprint relative to anchor (with margin)
+            extent = (
+                (int(np.ceil((y_lim[0] - y_0) / d_y) - anchor_y[k]) - 1,
+                 int(np.floor((y_lim[1] - y_0) / d_y) - anchor_y[k]) + 1),
+                (int(np.ceil((x_lim[0] - x_0) / d_x) - anchor_x[k]) - 1,
+                 int(np.floor((x_lim[1] - x_0) / d_x) - anchor_x[k]) + 1))
+            row_start = selection[0].start - int(anchor_y[k]) - extent[0][0]
+            row_stop = selection[0].stop - int(anchor_y[k]) - extent[0][0]
+            col_start = selection[1].start - int(anchor_x[k]) - extent[1][0]
+            col_stop = selection[1].stop - int(anchor_x[k]) - extent[1][0]
+            use_stamp_k = row_start >= 0 and col_start >= 0 \
+                and row_stop <= extent[0][1] - extent[0][0] + 1 \
+                and col_stop <= extent[1][1] - extent[1][0] + 1
+            if use_stamp_k:
+                stamp = cache.get((*phase_keys[k], *extent[0], *extent[1]),
+                                  (phase_x[k], phase_y[k]), extent)
+                np.add(stamp[row_start:row_stop, col_start:col_stop],
+                       np.asarray(tool_center[2] - cache.z_offset, 
+                                  dtype=stamp.dtype), out=tool_z)
         
-        # save minimum to surface
-        surf_z[selection] = min_z
+        if not use_stamp_k:
+            get_grid_z(tool, axes[0][selection[1]], axes[1][selection[0]], 
+                       tool_center, out=tool_z)
+        
+        np.minimum(surf_view, tool_z, out=surf_view)
+        pyramid.update(selection)
+
+
+def _create_workspace(tool, positions, pyramid, patch_xyz, axes):
+    """Create scratch buffers for the largest footprint of the tool positions.
+
+    Args:
+        tool (tool class): Tool class to apply.
+        positions (list of arrays): Tool positions in X, Y and Z.
+        pyramid (HeightPyramid): Pyramid of the surface heights.
+        patch_xyz (list of arrays or RegularSurface): Surface patch (only 
+                                                     used without axes).
+        axes (tuple of arrays): Axes of the surface in X and Y or None.
+
+    Returns:
+        Workspace: Scratch buffers of the tool dtype.
+    """
+    size = 0
+    if positions[0].size > 0:
+        # the lowest tool position has the largest footprint
+        lowest = np.argmin(positions[2])
+        [x_lim, y_lim] = tool.footprint(
+            [position[lowest] for position in positions], lim_z=pyramid.max())
+        selection = None
+        if x_lim is not None and y_lim is not None:
+            selection = _get_selection(patch_xyz, axes, (x_lim, y_lim))
+        if selection is not None:
+            # margin for footprints covering one more row or column
+            size = (selection[0].stop - selection[0].start + 1) \
+                * (selection[1].stop - selection[1].start + 1)
+    
+    return Workspace(size, dtype=getattr(tool, 'dtype', float))
+
+
+def _get_footprint(tool, tool_center, pyramid, patch_xyz, axes, verbose=True):
+    """Get the footprint of a tool position limited to the local surface height.
+
+    The footprint for the maximum height of the whole surface is narrowed to
+    the maximum height of the surface tiles it covers. Tool positions above
+    this local height do not cut the surface and are skipped.
+
+    Args:
+        tool (tool class): Tool class to apply.
+        tool_center (list of float): Tool position in X, Y and Z.
+        pyramid (HeightPyramid): Pyramid of the surface heights.
+        patch_xyz (list of arrays or RegularSurface): Surface patch (only 
+                                                     used without axes).
+        axes (tuple of arrays): Axes of the surface in X and Y or None.
+        verbose (bool, optional): Print tool positions above the maximum 
+                                  height of the surface. Defaults to True.
+
+    Returns:
+        tuple: Footprint limits in X and Y and selection of the surface in 
+               rows and columns, None if the tool does not cut the surface.
+    """
+    lim_z = pyramid.max()
+    [x_lim, y_lim] = tool.footprint(tool_center, lim_z=lim_z)
+    if x_lim is None or y_lim is None:
+        if verbose:
+            print_not_engaged(*tool_center)
+        return None
+    
+    selection = _get_selection(patch_xyz, axes, (x_lim, y_lim))
+    if selection is None:
+        return None
+    
+    local_z = pyramid.max(selection)
+    if local_z < lim_z:
+        [x_lim, y_lim] = tool.footprint(tool_center, lim_z=local_z)
+        if x_lim is None or y_lim is None:
+            return None
+        selection = _get_selection(patch_xyz, axes, (x_lim, y_lim))
+        if selection is None:
+            return None
+    
+    return x_lim, y_lim, selection
+
+
+def _get_selection(patch_xyz, axes, limits):
+    """Get the selection of a surface within limits in X and Y.
+
+    Args:
+        patch_xyz (list of arrays or RegularSurface): Surface patch (only 
+                                                     used without axes).
+        axes (tuple of arrays): Axes of the surface in X and Y or None.
+        limits (list of tuples): Limits in X and Y.
+
+    Returns:
+        tuple of slices: Selection in rows and columns or None.
+    """
+    if axes is not None:
+        return get_grid_selection(axes, limits)
     
-    return [patch_xyz[0], patch_xyz[1], surf_z].copy()
+    return get_surface_subset(patch_xyz, limits)[1]
@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+"""
+Measured machine axis logs read in chunks and resampled as tool offsets.
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author: Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+from itertools import islice
+from pathlib import Path
+
+import numpy as np
+from .import_surface import UNITS
+from .tool_path import ToolPath
+
+
+LOG_FORMATS = ('csv', 'raw', 'npy')
+_SUFFIXES = {'.csv': 'csv', '.txt': 'csv', '.raw': 'raw', '.bin': 'raw', 
+             '.dat': 'raw', '.npy': 'npy'}
+
+
+class AxisLog:
+    """Log of machine axis positions or errors read in chunks.
+
+    Each sample of the log holds a key (the time of the sample or an axis 
+    position, increasing) and the logged values, e.g. the errors of the axes
+    or the spindle run-out. Samples are read chunk by chunk and linearly 
+    interpolated onto increasing tool contact times or positions, so logs 
+    larger than the memory are streamed into a tool path.
+
+    Returns:
+        AxisLog: Axis log.
+    """
+    def __init__(self, filename, columns=None, key='t', file_format=None, 
+                 unit='nm', chunk_rows=65536, delimiter=',', dtype='<f8'):
+        """Open an axis log.
+
+        Args:
+            filename (string or path): CSV file (optionally with a header 
+                                       of column names), raw binary file of
+                                       records or .npy file of a 2-D array.
+            columns (list of str, optional): Names of the columns. Defaults 
+                                             to None (header of a CSV file, 
+                                             which is skipped in any case).
+            key (str, optional): Column of the sample times or positions.
+                                 Defaults to 't'.
+            file_format (str, optional): Format of the file ('csv', 'raw' 
+                                         or 'npy'). Defaults to None 
+                                         (derived from the suffix).
+            unit (str, optional): Length unit of the logged values, which 
+                                  are converted to nm (the key is not 
+                                  converted). Defaults to 'nm'.
+            chunk_rows (int, optional): Number of samples read at once. 
+                                        Defaults to 65536.
+            delimiter (str, optional): Delimiter of a CSV file. 
+                                       Defaults to ','.
+            dtype (str, optional): Data type of a raw binary file. 
+                                   Defaults to '<f8'.
+
+        Raises:
+            ValueError: Unknown file format.
+            ValueError: Unknown unit.
+            ValueError: Chunk size 0 or negative
+            ValueError: Columns missing or key not in columns.
+        """
+        self.filename = Path(filename)
+        if file_format is None:
+            file_format = _SUFFIXES.get(self.filename.suffix.lower(), 'csv')
+        if file_format not in LOG_FORMATS:
+            raise ValueError(f'unknown file format {file_format}, '
+                             f'choose from {LOG_FORMATS}')
+        if unit not in UNITS:
+            raise ValueError(f'unknown unit {unit}, choose from {tuple(UNITS)}')
+        if chunk_rows <= 0:
+            raise ValueError('chunk size cannot be 0 or negative '
+                             f'(is {chunk_rows})')
+        
+        self.file_format = file_format
+        self.delimiter = delimiter
+        self.dtype = np.dtype(dtype)
+        self.chunk_rows = int(chunk_rows)
+        self.scale = UNITS[unit] / UNITS['nm']
+        self._header = False
+        if file_format == 'csv':
+            header = self._read_header()
+            columns = header if columns is None else columns
+        if columns is None or key not in columns:
+            raise ValueError(f'key {key} not in columns {columns}')
+        self.columns = tuple(columns)
+        self.key = key
+
+    def chunks(self):
+        """Iterate over chunks of samples.
+
+        Yields:
+            array, float: Samples (rows) of all columns.
+        """
+        n_columns = len(self.columns)
+        if self.file_format == 'csv':
+            with open(self.filename, 'r', encoding='utf-8') as fid:
+                if self._header:
+                    fid.readline()
+                while True:
+                    lines = list(islice(fid, self.chunk_rows))
+                    if not lines:
+                        break
+                    yield np.loadtxt(lines, delimiter=self.delimiter, 
+                                     ndmin=2, usecols=range(n_columns))
+            return
+        
+        if self.file_format == 'npy':
+            samples = np.load(self.filename, mmap_mode='r')
+        else:
+            samples = np.memmap(self.filename, dtype=self.dtype, mode='r')
+        samples = samples.reshape(-1, n_columns)
+        for start in range(0, len(samples), self.chunk_rows):
+            yield np.array(samples[start:start + self.chunk_rows], dtype=float)
+
+    def stream(self, queries, names=None):
+        """Resample the log onto a stream of increasing keys.
+
+        Args:
+            queries (iterable of arrays): Times or positions, increasing from 
+                                          one array to the next.
+            names (list of str, optional): Columns to resample. Defaults to 
+                                           None (all columns except the key).
+
+        Yields:
+            dict of arrays: Interpolated values (nm) of each column.
+        """
+        resampler = _Resampler(self, names)
+        for query in queries:
+            yield resampler(query)
+
+    def resample(self, query, names=None):
+        """Resample the log onto times or positions in any order.
+
+        The result can be used as `tool_offsets` of `gen_tool_mesh_with_offsets`
+        or as offsets of `gen_tool_path`.
+
+        Args:
+            query (array, float): Times or positions.
+            names (list of str, optional): Columns to resample. Defaults to 
+                                           None (all columns except the key).
+
+        Returns:
+            dict of arrays: Interpolated values (nm) in the shape of query.
+        """
+        query = np.asarray(query, dtype=float)
+        order = np.argsort(query, axis=None, kind='stable')
+        values = _Resampler(self, names)(query.ravel()[order])
+        for name, column in values.items():
+            values[name] = np.empty_like(column)
+            values[name][order] = column
+            values[name] = values[name].reshape(query.shape)
+        return values
+
+    def apply(self, tool_path, period=None, t_start=0.0, by='time', axes=None):
+        """Subtract the logged offsets from chunks of a tool path.
+
+        Args:
+            tool_path (iterable): Chunks of the tool path (ToolPaths or lists 
+                                  of X, Y and Z positions, e.g. from 
+                                  `gen_tool_path(..., chunk_size=...)`).
+            period (float, optional): Time between two tool contacts (e.g. 
+                                      one spindle revolution), required if 
+                                      by='time'. Defaults to None.
+            t_start (float, optional): Time of the first tool contact. 
+                                       Defaults to 0.0.
+            by (str, optional): Resample at the contact times ('time') or the
+                                positions of the tool in 'x' or 'y' (must 
+                                increase along the path). Defaults to 'time'.
+            axes (dict, optional): Columns of the offsets in 'x', 'y' and 
+                                   'z'. Defaults to None (columns of these
+                                   names).
+
+        Raises:
+            ValueError: Unknown resampling
+            ValueError: Period missing or 0 or negative
+            ValueError: Column of an offset not in the log
+
+        Returns:
+            generator of ToolPath: Chunks of the tool path with offsets.
+        """
+        if by not in ('time', 'x', 'y'):
+            raise ValueError(f'unknown resampling {by}, choose from '
+                             "('time', 'x', 'y')")
+        if by == 'time' and (period is None or period <= 0):
+            raise ValueError(f'period cannot be 0 or negative (is {period})')
+        if axes is None:
+            axes = {axis: axis for axis in 'xyz' 
+                    if axis in self.columns and axis != self.key}
+        for column in axes.values():
+            if column not in self.columns:
+                raise ValueError(f'column {column} not in {self.columns}')
+        
+        return self._apply(tool_path, period, t_start, by, axes)
+
+    def _apply(self, tool_path, period, t_start, by, axes):
+        """Iterate over chunks of a tool path with offsets (see `apply`).
+
+        Yields:
+            ToolPath: Chunk of the tool path with offsets.
+        """
+        resampler = _Resampler(self, list(axes.values()))
+        n_positions = 0
+        for chunk in tool_path:
+            chunk = ToolPath.from_mesh(chunk)
+            positions = {'x': chunk.x, 'y': chunk.y, 'z': chunk.z}
+            if by == 'time':
+                query = t_start + period * np.arange(
+                    n_positions, n_positions + chunk.x.size)
+            else:
+                query = positions[by]
+            n_positions += chunk.x.size
+            
+            values = resampler(query)
+            yield ToolPath(*[positions[axis] - values[axes[axis]] 
+                             if axis in axes else positions[axis] 
+                             for axis in 'xyz'])
+
+    def _read_header(self):
+        """Read the column names from the first line of a CSV file.
+
+        Returns:
+            list of str: Column names (None if the first line is numeric).
+        """
+        with open(self.filename, 'r', encoding='utf-8') as fid:
+            names = [name.strip() for name in 
+                     fid.readline().split(self.delimiter)]
+        try:
+            np.array(names, dtype=float)
+        except ValueError:
+            self._header = True
+            return names
+        return None
+
+
+class _Resampler:
+    """Linear interpolation of an axis log onto increasing keys.
+
+    Only the samples between the previous and the current keys are kept, 
+    further chunks of the log are read as the keys increase. Keys outside of
+    the log get the first or last logged values.
+    """
+    def __init__(self, log, names=None):
+        if names is None:
+            names = [name for name in log.columns if name != log.key]
+        for name in names:
+            if name not in log.columns:
+                raise ValueError(f'column {name} not in {log.columns}')
+        self.scale = log.scale
+        self.key = log.columns.index(log.key)
+        self.columns = {name: log.columns.index(name) for name in names}
+        self.chunks = log.chunks()
+        self.samples = np.empty((0, len(log.columns)))
+        self.lower = -np.inf
+        self.exhausted = False
+
+    def __call__(self, query):
+        query = np.asarray(query, dtype=float)
+        if query.size == 0:
+            return {name: np.empty(query.shape) for name in self.columns}
+        q_min, q_max = np.min(query), np.max(query)
+        if q_min < self.lower:
+            raise ValueError(f'keys have to increase ({q_min} < {self.lower})')
+        
+        # chunks are collected and concatenated with the kept samples once
+        parts = [self.samples]
+        last = self.samples[-1, self.key] if self.samples.shape[0] else None
+        while not self.exhausted and (last is None or last < q_max):
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                self.exhausted = True
+                break
+            if not chunk.shape[0]:
+                continue
+            if np.any(np.diff(chunk[:, self.key]) < 0) or (
+                    last is not None and chunk[0, self.key] < last):
+                raise ValueError('keys of the log have to increase')
+            parts.append(chunk)
+            last = chunk[-1, self.key]
+        if len(parts) > 1:
+            self.samples = np.concatenate(parts)
+        if not self.samples.size:
+            raise ValueError('no samples in the log')
+        
+        keys = self.samples[:, self.key]
+        values = {name: np.interp(query, keys, self.samples[:, column]) 
+                  * self.scale for name, column in self.columns.items()}
+        
+        # keep the samples from the last one before the largest key
+        start = max(np.searchsorted(keys, q_max, side='right') - 1, 0)
+        if start > 0:
+            self.samples = self.samples[start:]
+            self.lower = self.samples[0, self.key]
+        return values
@@ -25,35 +25,57 @@ along with this library; if not, write to the Free Software Foundation, Inc.,
           Badgasteiner Straße 2
           28359 Bremen
           Germany
-@version: 1.2
-@date:    2022-03-31
+@version: 1.3
+@date:    2026-10-17
 """
+import os
+
 import numpy as np
+from .regular_surface import RegularSurface
+from .surface_patch import SurfacePatch
+from .tile_store import TileStore
 
 
-def combine_surface(sliced_surface, x_div, y_div):
+def combine_surface(sliced_surface, x_div, y_div, tiles=None, out=None):
     """
     Combine several patches to a common surface.
 
     Parameters
     ----------
     sliced_surface : list of list of numpy arrays
-        A list of surface patches (each patch is a list of numpy arrays).
+        A list of surface patches (each patch is a list of numpy arrays, a
+        RegularSurface or a SurfacePatch) or a TileStore (read one tile at 
+        a time).
     x_div : int
         Number of patches in X.
     y_div : int
         Number of patches in Y.
+    tiles : list of tuples of slices, optional
+        Index slices of the patches (see `get_tile_slices`) placing them 
+        within the combined surface. If None, the offsets of RegularSurface 
+        and SurfacePatch patches are used, patches without offset are 
+        arranged by their first X- and Y-coordinates. The default is None.
+    out : array, str or path, optional
+        Array receiving the combined heights (e.g. a np.memmap) or filename 
+        of a memory-mapped file created for them. The patches (or tiles of a
+        TileStore) are written into it one at a time, so a TileStore can be 
+        combined into a file without holding the surface in memory. The 
+        default is None (array in memory).
 
     Raises
     ------
     ValueError
         Dimension mismatch between the number of slices and the dimensions 
         provided.
+    ValueError
+        Shape of `out` does not match the combined surface.
 
     Returns
     -------
     combinedSurface : list of numpy arrays
-        The combined surface (meshes for X and Y and Z heights).
+        The combined surface (meshes for X and Y and Z heights), a 
+        RegularSurface if the patches are RegularSurfaces, a SurfacePatch if
+        they are SurfacePatches or a TileStore.
 
 
     (c)2021,
@@ -61,33 +83,123 @@ def combine_surface(sliced_surface, x_div, y_div):
     Leibniz Institute for Materials Engineering IWT, Bremen, Germany
     v1.0, 2021-10-21: initial release
     v1.1, 2022-03-15: sort list before combination to avoid concurrency issues
+    v1.3, 2026-10-17: support for RegularSurface patches and TileStores, 
+                      patches written into a preallocated surface at their 
+                      offsets (no sorting, input list is not reordered)
     """
-    if len(sliced_surface) != x_div * y_div:
-        raise ValueError
-
-    ndim, _, _ = np.shape(sliced_surface[0])
-    combined_surface = list()
+    is_store = isinstance(sliced_surface, TileStore)
+    n_patches = sliced_surface.n_tiles if is_store else len(sliced_surface)
+    if n_patches != x_div * y_div:
+        raise ValueError(f'number of patches {n_patches} does not match '
+                         f'{x_div} x {y_div} patches')
+    
+    if is_store:
+        combined_z = _allocate(sliced_surface.shape, 
+                               [np.empty((1, 1), sliced_surface.dtype)], out)
+        for index, tile in enumerate(sliced_surface.tiles):
+            combined_z[tile] = sliced_surface.read_tile(index).z
+        return RegularSurface(sliced_surface.x_axis, sliced_surface.y_axis, 
+                              combined_z)
     
-    # get x and y start points of all slices
-    start_points_xy = np.array([(thisslice[0][0, 0], thisslice[1][0, 0]) 
-                               for thisslice in sliced_surface])
-    # build record for sorting
-    record = np.core.records.fromarrays([start_points_xy[:, 0],
-                                      start_points_xy[:, 1]], names='a,b')
-    # sort sliced_surface list according to sorted record
-    sliced_surface[:] = [sliced_surface[i] 
-                        for i in record.argsort().astype(int)]
+    if tiles is not None and len(tiles) != len(sliced_surface):
+        raise ValueError(f'number of tiles {len(tiles)} does not match the '
+                         f'number of patches {len(sliced_surface)}')
+
+    offsets = _get_offsets(sliced_surface, x_div, tiles)
+    shapes = [np.shape(thisslice[2]) for thisslice in sliced_surface]
+    # rows and columns relative to the first patch of the surface
+    origin = np.min(offsets, axis=0)
+    offsets = offsets - origin
+    shape = tuple(np.max(offsets + shapes, axis=0))
     
-    for k in range(ndim):
-        dslice = [d[k] for d in sliced_surface]
+    if all(isinstance(thisslice, RegularSurface) 
+           for thisslice in sliced_surface):
+        # only heights need to be combined, axes are written likewise
+        x_axis = np.empty(shape[1], np.result_type(
+            *[thisslice.x_axis for thisslice in sliced_surface]))
+        y_axis = np.empty(shape[0], np.result_type(
+            *[thisslice.y_axis for thisslice in sliced_surface]))
+        combined_z = _allocate(shape, [thisslice.z 
+                                       for thisslice in sliced_surface], out)
+        for (row, col), thisslice in zip(offsets, sliced_surface):
+            n_rows, n_cols = thisslice.shape
+            x_axis[col:col + n_cols] = thisslice.x_axis
+            y_axis[row:row + n_rows] = thisslice.y_axis
+            combined_z[row:row + n_rows, col:col + n_cols] = thisslice.z
+        return RegularSurface(x_axis, y_axis, combined_z, 
+                              offset=tuple(origin))
+    
+    ndim = len(sliced_surface[0])
+    combined_surface = [_allocate(shape, [d[k] for d in sliced_surface], 
+                                  out if k == 2 else None) 
+                        for k in range(ndim)]
+    for (row, col), (n_rows, n_cols), thisslice in zip(offsets, shapes, 
+                                                       sliced_surface):
+        for k in range(ndim):
+            combined_surface[k][row:row + n_rows, 
+                                col:col + n_cols] = thisslice[k]
+    
+    if all(isinstance(thisslice, SurfacePatch) 
+           for thisslice in sliced_surface):
+        return SurfacePatch(*combined_surface, offset=tuple(origin))
+    return combined_surface
 
-        rows = []  # initialize new list
 
-        for i in range(y_div):
-            # concatenate portion of slided surface
-            combined = np.vstack(dslice[i * x_div:(i + 1) * x_div])
-            rows.append(combined)
+def _allocate(shape, parts, out=None):
+    """Allocate an array for the combination of several parts.
 
-        combined_surface.append(np.hstack(rows))  # combine all rows
+    Args:
+        shape (tuple of int): Shape of the combined array.
+        parts (list of arrays): Parts to be combined.
+        out (array, str or path, optional): Array to use or filename of a 
+            memory-mapped file to create. Defaults to None.
+
+    Raises:
+        ValueError: Shape of `out` does not match.
+
+    Returns:
+        array: Uninitialized array of the common type of the parts.
+    """
+    dtype = np.result_type(*[np.asarray(part[:1, :1]) for part in parts])
+    if out is None:
+        return np.empty(shape, dtype)
+    if isinstance(out, (str, os.PathLike)):
+        return np.memmap(out, dtype=dtype, mode='w+', shape=shape)
+    if np.shape(out) != tuple(shape):
+        raise ValueError(f'shape of out {np.shape(out)} does not match the '
+                         f'combined surface {tuple(shape)}')
+    return out
+
+
+def _get_offsets(sliced_surface, x_div, tiles=None):
+    """Get the row and column of the first height of each patch.
+
+    Args:
+        sliced_surface (list): Surface patches.
+        x_div (int): Number of patches in X.
+        tiles (list of tuples of slices, optional): Index slices of the 
+            patches. Defaults to None.
+
+    Returns:
+        array, int: Row and column of each patch (n x 2).
+    """
+    if tiles is not None:
+        return np.array([(rows.start or 0, cols.start or 0) 
+                         for rows, cols in tiles], dtype=int)
+    if all(hasattr(thisslice, 'offset') for thisslice in sliced_surface):
+        return np.array([thisslice.offset for thisslice in sliced_surface], 
+                        dtype=int)
     
-    return combined_surface
+    # arrange patches by their first X-, then Y-coordinate: blocks of x_div
+    # patches share their columns, patches within a block are stacked in rows
+    start_x = [thisslice[0][0, 0] for thisslice in sliced_surface]
+    start_y = [thisslice[1][0, 0] for thisslice in sliced_surface]
+    order = np.lexsort((start_y, start_x))
+    shapes = np.array([np.shape(sliced_surface[index][2]) for index in order])
+    n_rows = shapes[:x_div, 0]
+    n_cols = shapes[::x_div, 1]
+    
+    offsets = np.empty((len(sliced_surface), 2), dtype=int)
+    offsets[order, 0] = np.tile(np.cumsum(n_rows) - n_rows, len(n_cols))
+    offsets[order, 1] = np.repeat(np.cumsum(n_cols) - n_cols, len(n_rows))
+    return offsets
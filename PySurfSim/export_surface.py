@@ -25,33 +25,45 @@ along with this library; if not, write to the Free Software Foundation, Inc.,
           Badgasteiner Straße 2
           28359 Bremen
           Germany
-@version: 1.2
-@date: 2022-03-31
+@version: 1.3
+@date:    2026-10-17
 """
 import numpy as np
+from joblib import Parallel, delayed, effective_n_jobs
 
 
-def export_surface(filename, surf_mesh):
+def export_surface(filename, surf_mesh, n_jobs=1, block_size=2**20):
     """Export a simulated surface to a SPIP-readable ASCII file.
 
+    The heights are formatted in blocks of whole rows and streamed to the 
+    file, so only one block (per job) is held in memory as text. The heights 
+    can be memory-mapped (np.memmap) or any other source of heights that 
+    provides `shape` and returns arrays for slices of rows (e.g. a tiled 
+    store), then only the rows of one block are read at once.
+
     Args:
         filename (string or path): filename or path to which 
                                    the surface shall be exported as ASCII.
         surf_mesh (list of meshgrids): Meshes of the surface to be exported 
-                                       (X- & Y-meshes plus heights in Z).
+                                       (X- & Y-meshes plus heights in Z) 
+                                       or RegularSurface.
+        n_jobs (int, optional): Number of worker processes formatting blocks 
+                                in parallel. Defaults to 1.
+        block_size (int, optional): Approximate number of heights formatted 
+                                    at once. Defaults to 2**20.
     """
-    with open(filename, 'w', newline='\r\n',
-              encoding='utf-8') as fid:  # open file for writing
-        shape_z = np.shape(surf_mesh)
+    with open(filename, 'w', newline='\r\n', encoding='utf-8',
+              buffering=2**20) as fid:  # open file for writing
+        shape_z = np.shape(surf_mesh[2])
         # Write header
         fid.write('# File Format = ASCII\n')
         fid.write('# Created by Python\n')
         fid.write('# Original file: \n')
         fid.write('# forcecurve = 0\n')
         # number of pixel in X:
-        fid.write(f'# x-pixels = {shape_z[2]}\n')
+        fid.write(f'# x-pixels = {shape_z[1]}\n')
         # number of pixel in Y:
-        fid.write(f'# y-pixels = {shape_z[1]}\n')
+        fid.write(f'# y-pixels = {shape_z[0]}\n')
         # length in X, i.e. last point of meshX:
         fid.write(f'# x-length = {surf_mesh[0][-1][-1]:0.0f}\n')
         # length in Y, i.e. last point of meshY
@@ -66,10 +78,35 @@ def export_surface(filename, surf_mesh):
         fid.write('Operator:  \n')
         fid.write('# Start of Data:\n')
 
-        # iterate over rows and columns of surface
-        for i in range(shape_z[1]):
-            for j in range(shape_z[2]):
-                # write surface point
-                fid.write(f'{surf_mesh[2][i, j]:.8f}\t')
+        # write blocks of rows of the surface
+        rows = max(block_size // max(shape_z[1], 1), 1)
+        blocks = [slice(start, min(start + rows, shape_z[0])) 
+                  for start in range(0, shape_z[0], rows)]
+        n_workers = effective_n_jobs(n_jobs)
+        if n_workers == 1:
+            for block in blocks:
+                fid.write(_format_rows(surf_mesh[2][block]))
+        else:
+            with Parallel(n_jobs=n_workers) as parallel:
+                # format as many blocks as workers at once to limit memory
+                for start in range(0, len(blocks), n_workers):
+                    for text in parallel(
+                            delayed(_format_rows)(np.asarray(surf_mesh[2][block]))
+                            for block in blocks[start:start + n_workers]):
+                        fid.write(text)
+
+
+def _format_rows(rows_z):
+    """Format rows of heights as in SPIP ASCII files.
 
-            fid.write('\n')  # write EOL
+    Args:
+        rows_z (array of float): Heights of the rows.
+
+    Returns:
+        str: Heights with 8 decimals, each followed by a tab, and a line 
+             break after each row.
+    """
+    rows_z = np.asarray(rows_z, dtype=float)
+    row_format = '%.8f\t' * rows_z.shape[1] + '\n'
+    
+    return (row_format * rows_z.shape[0]) % tuple(rows_z.ravel().tolist())
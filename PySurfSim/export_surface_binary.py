@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+Export a simulated surface to binary height-map formats.
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author: Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+import json
+import struct
+from datetime import datetime
+
+import numpy as np
+from .helpers import get_grid_axes, get_grid_spacing
+
+# binary BCR/SDF header: version, manufacturer, creation and modification
+# date, number of points and profiles, x-, y- and z-scale, z-resolution,
+# compression, data type and checksum type
+SDF_HEADER = struct.Struct('<8s10s12s12sHHddddBBB')
+SDF_DATA_TYPES = {'<f4': 3, '<f8': 7}
+# all lengths and heights of the simulation are given in nm
+_NM = 1e-9
+
+
+def export_surface_sdf(filename, surf_mesh, dtype='<f8'):
+    """Export a simulated surface to a binary BCR/SDF file (ISO 25178-71).
+
+    Args:
+        filename (string or path): filename or path to which
+                                   the surface shall be exported.
+        surf_mesh (list of meshgrids): Meshes of the surface to be exported
+                                       (X- & Y-meshes plus heights in Z)
+                                       or RegularSurface.
+        dtype (str, optional): Data type of the heights, little-endian
+                               float32 ('<f4') or float64 ('<f8').
+                               Defaults to '<f8'.
+
+    Raises:
+        ValueError: Unsupported data type.
+        ValueError: Surface is not a uniformly spaced grid.
+        ValueError: Too many points for a BCR/SDF file.
+    """
+    dtype = np.dtype(dtype).newbyteorder('<').str
+    if dtype not in SDF_DATA_TYPES:
+        raise ValueError(f'unsupported data type {dtype}, use one of '
+                         f'{tuple(SDF_DATA_TYPES)}')
+    _, _, d_x, d_y = _get_uniform_grid(surf_mesh)
+    shape_z = np.shape(surf_mesh[2])
+    if max(shape_z) > 0xFFFF:
+        raise ValueError(f'too many points for BCR/SDF (shape {shape_z})')
+
+    date = datetime.now().strftime('%d%m%Y%H%M').encode('ascii')
+    with open(filename, 'wb') as fid:
+        fid.write(SDF_HEADER.pack(b'aBCR-1.0', b'PySurfSim', date, date,
+                                  shape_z[1], shape_z[0], d_x * _NM, d_y * _NM,
+                                  _NM, _NM, 0, SDF_DATA_TYPES[dtype], 0))
+        _write_heights(fid, surf_mesh[2], dtype)
+
+
+def export_surface_gsf(filename, surf_mesh):
+    """Export a simulated surface to a Gwyddion Simple Field (.gsf) file.
+
+    Args:
+        filename (string or path): filename or path to which
+                                   the surface shall be exported.
+        surf_mesh (list of meshgrids): Meshes of the surface to be exported
+                                       (X- & Y-meshes plus heights in Z)
+                                       or RegularSurface.
+
+    Raises:
+        ValueError: Surface is not a uniformly spaced grid.
+    """
+    x_0, y_0, d_x, d_y = _get_uniform_grid(surf_mesh)
+    shape_z = np.shape(surf_mesh[2])
+
+    header = ('Gwyddion Simple Field 1.0\n'
+              f'XRes = {shape_z[1]}\n'
+              f'YRes = {shape_z[0]}\n'
+              f'XReal = {shape_z[1] * d_x!r}\n'
+              f'YReal = {shape_z[0] * d_y!r}\n'
+              f'XOffset = {x_0!r}\n'
+              f'YOffset = {y_0!r}\n'
+              'Title = PySurfSim\n'
+              'XYUnits = nm\n'
+              'ZUnits = nm\n').encode('utf-8')
+    with open(filename, 'wb') as fid:
+        # header is padded with 1 to 4 NUL bytes to a multiple of 4 bytes
+        fid.write(header + b'\0' * (4 - len(header) % 4))
+        _write_heights(fid, surf_mesh[2], '<f4')
+
+
+def export_surface_raw(filename, surf_mesh, dtype='<f8'):
+    """Export a simulated surface to a raw binary file with a JSON sidecar.
+
+    The heights are written row by row as little-endian floats. Shape, data
+    type and grid of the surface are stored in `filename + '.json'`.
+
+    Args:
+        filename (string or path): filename or path to which
+                                   the surface shall be exported.
+        surf_mesh (list of meshgrids): Meshes of the surface to be exported
+                                       (X- & Y-meshes plus heights in Z)
+                                       or RegularSurface.
+        dtype (str, optional): Data type of the heights, little-endian
+                               float32 ('<f4') or float64 ('<f8').
+                               Defaults to '<f8'.
+
+    Raises:
+        ValueError: Unsupported data type.
+        ValueError: Surface is not a uniformly spaced grid.
+    """
+    dtype = np.dtype(dtype).newbyteorder('<').str
+    if dtype not in SDF_DATA_TYPES:
+        raise ValueError(f'unsupported data type {dtype}, use one of '
+                         f'{tuple(SDF_DATA_TYPES)}')
+    x_0, y_0, d_x, d_y = _get_uniform_grid(surf_mesh)
+    shape_z = np.shape(surf_mesh[2])
+
+    with open(filename, 'wb') as fid:
+        _write_heights(fid, surf_mesh[2], dtype)
+
+    sidecar = {'shape': list(shape_z), 'dtype': dtype, 'order': 'C',
+               'x_offset': float(x_0), 'y_offset': float(y_0),
+               'x_spacing': float(d_x), 'y_spacing': float(d_y),
+               'unit': 'nm'}
+    with open(f'{filename}.json', 'w', encoding='utf-8') as fid:
+        json.dump(sidecar, fid, indent=2)
+
+
+def _get_uniform_grid(surf_mesh):
+    """Get origin and spacing of a surface on a uniformly spaced grid.
+
+    Args:
+        surf_mesh (list of meshgrids): Meshes of the surface or RegularSurface.
+
+    Raises:
+        ValueError: Surface is not a uniformly spaced grid.
+
+    Returns:
+        tuple of floats: origin in x and y, spacing in x and y
+    """
+    axes = get_grid_axes(surf_mesh)
+    grid = get_grid_spacing(axes) if axes is not None else None
+    if grid is None:
+        raise ValueError('surface is not a uniformly spaced grid')
+
+    return grid
+
+
+def _write_heights(fid, surf_z, dtype, block_size=2**20):
+    """Write heights row by row from their buffer in blocks of rows.
+
+    Args:
+        fid (file): Binary file to write to.
+        surf_z (array of float): Heights (e.g. memory-mapped).
+        dtype (str): Data type to write.
+        block_size (int, optional): Approximate number of heights written
+                                    at once. Defaults to 2**20.
+    """
+    shape_z = np.shape(surf_z)
+    rows = max(block_size // max(shape_z[1], 1), 1)
+    for start in range(0, shape_z[0], rows):
+        fid.write(np.ascontiguousarray(surf_z[start:start + rows], dtype=dtype))
@@ -25,14 +25,17 @@ along with this library; if not, write to the Free Software Foundation, Inc.,
           Badgasteiner Straße 2
           28359 Bremen
           Germany
-@version: 1.2
-@date:    2022-03-31
+@version: 1.3
+@date:    2026-10-17
 """
 import numpy as np
+from .quantized_heights import QuantizedHeights
+from .regular_surface import RegularSurface
 
 
 def gen_surface_mesh(d_x, d_y, z_height=40.0,
-                     resolution=100.0, fixed_num_points=False):
+                     resolution=100.0, fixed_num_points=False, regular=False,
+                     filename=None, dtype=float, quantum=None):
     """Generate a surface mesh.
 
     Args:
@@ -44,12 +47,28 @@ def gen_surface_mesh(d_x, d_y, z_height=40.0,
                                       Defaults to 100.0.
         fixed_num_points (bool, optional): Use fixed number of points (False) or resolution (True). 
                                            Defaults to False.
+        regular (bool, optional): Return a RegularSurface that only stores the 
+                                  heights instead of full X- & Y-meshes.
+                                  Defaults to False.
+        filename (str, optional): Store the heights of a RegularSurface in a 
+                                  memory-mapped file (np.memmap) instead of 
+                                  memory, implies regular=True. 
+                                  Defaults to None.
+        dtype (dtype, optional): Data type of the heights, e.g. np.float32 
+                                 to halve the memory of the heights (see 
+                                 `MeshToolFlyCut` for the error bound). 
+                                 X- & Y-meshes are always float64.
+                                 Defaults to float.
+        quantum (float, optional): Store the heights of a RegularSurface as 
+                                   int32 counts of this quantum relative to 
+                                   z_height (QuantizedHeights), implies 
+                                   regular=True. Defaults to None.
 
     Raises:
         ValueError: Error if wrong resolution was passed.
 
     Returns:
-        meshgrid: Generated surface mesh.
+        meshgrid or RegularSurface: Generated surface mesh.
     """
     
     r_shape = np.shape(resolution)
@@ -68,6 +87,21 @@ def gen_surface_mesh(d_x, d_y, z_height=40.0,
     else:
         x_vec = np.arange(0.0, d_x + r_x, r_x)
         y_vec = np.arange(0.0, d_y + r_y, r_y)
+    if quantum is not None:
+        return RegularSurface(x_vec, y_vec, QuantizedHeights(
+            np.zeros((len(y_vec), len(x_vec)), dtype=np.int32), quantum, 
+            z_height))
+    if filename is not None:
+        z_mesh = np.memmap(filename, dtype=dtype, mode='w+', 
+                           shape=(len(y_vec), len(x_vec)))
+        z_mesh[...] = z_height
+        z_mesh.flush()
+        return RegularSurface(x_vec, y_vec, z_mesh)
+    if regular:
+        return RegularSurface(x_vec, y_vec, 
+                              np.full((len(y_vec), len(x_vec)), z_height, 
+                                      dtype=dtype))
+    
     mygrid = np.meshgrid(x_vec, y_vec)
-    mygrid.append(np.ones(np.shape(mygrid[0])) * z_height)
+    mygrid.append(np.full(np.shape(mygrid[0]), z_height, dtype=dtype))
     return mygrid
@@ -82,10 +82,9 @@ def gen_tool_mesh_with_offsets(*args):
     # for iP in range(np.min((len(tool_mesh[0]), len(x0_pos_um)))):
     #     tool_mesh[0][iP] = tool_mesh[0][iP] + x0_pos_um[iP] * um2nm
     tool_mesh[0] = tool_mesh[0] + x0_pos
-    for i in range(np.shape(tool_mesh)[2]):
-        # tool_mesh[0][0][iZ] = tool_mesh[0][0][iZ] - x_off_w1_nm[groove][iZ]
-        tool_mesh[0][0][i] = tool_mesh[0][0][i] - tool_offsets['x'][i]
-        tool_mesh[1][0][i] = tool_mesh[1][0][i] - tool_offsets['y'][i]
-        tool_mesh[2][0][i] = tool_mesh[2][0][i] - tool_offsets['z'][i]
+    # offsets of the first row (see gen_tool_path for offsets of all rows)
+    num_x = np.shape(tool_mesh[0])[1]
+    for k, key in enumerate('xyz'):
+        tool_mesh[k][0] -= np.asarray(tool_offsets[key])[:num_x]
     
     return tool_mesh
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+Generate the tool positions of a raster tool path with offsets.
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author: Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+import numpy as np
+from .tool_path import ToolPath
+
+
+def gen_tool_path(lim_x, feed_x, lim_y, raster_y, r_fly, shift_x=0.0, 
+                  shift_y=0.0, offsets=None, chunk_size=None):
+    """Generate the tool positions of a raster tool path with offsets.
+
+    The tool cuts along X with the given feed per revolution, rows are 
+    shifted by the raster in Y. Offsets (e.g. measured run-out or axis 
+    errors) are subtracted from the nominal positions like in 
+    `gen_tool_mesh_with_offsets`, but for every position of the raster.
+
+    Args:
+        lim_x (float): Length of the tool path in X.
+        feed_x (float): Feed per revolution in X.
+        lim_y (float): Width of the tool path in Y.
+        raster_y (float): Distance of the rows in Y (single row if 0).
+        r_fly (float): Nominal tool position in Z (fly-cut radius).
+        shift_x (float, optional): Position of the first revolution in X. 
+                                   Defaults to 0.0.
+        shift_y (float, optional): Position of the first row in Y. 
+                                   Defaults to 0.0.
+        offsets (dict, optional): Offsets in 'x', 'y' and/or 'z', each a 
+            scalar, an array of the revolutions in X (applied to all rows), 
+            an array of all positions (rows x revolutions, may be a 
+            np.memmap) or a callable returning the offsets for arrays of the
+            nominal positions in X and Y. Defaults to None.
+        chunk_size (int, optional): Yield the tool path lazily as ToolPaths
+                                    of at most this many positions (row by 
+                                    row) instead of returning meshes.
+                                    Defaults to None.
+
+    Raises:
+        ValueError: Feed 0 or negative
+        ValueError: Raster negative
+        ValueError: Chunk size 0 or negative
+        ValueError: Shape of the offsets does not match the tool path
+
+    Returns:
+        list of arrays or generator of ToolPath: Meshes of the tool positions
+            in X, Y and Z (rows in Y, revolutions in X) or chunks of the tool
+            path.
+    """
+    if feed_x <= 0:
+        raise ValueError(f'feed cannot be 0 or negative (is {feed_x})')
+    if raster_y < 0:
+        raise ValueError(f'raster cannot be negative (is {raster_y})')
+    if chunk_size is not None and chunk_size <= 0:
+        raise ValueError(f'chunk size cannot be 0 or negative (is {chunk_size})')
+    
+    num_x = int(np.ceil(lim_x / feed_x)) + 1
+    num_y = int(np.ceil(lim_y / raster_y)) + 1 if raster_y > 0 else 1
+    x_axis = np.arange(num_x) * feed_x + shift_x
+    y_axis = np.arange(num_y) * raster_y + shift_y
+    
+    offsets = {} if offsets is None else offsets
+    for key, values in offsets.items():
+        if not callable(values) and np.ndim(values) > 0 and np.shape(
+                values) not in ((num_x,), (num_y, num_x)):
+            raise ValueError(f'shape of the offsets in {key} does not match '
+                             f'the tool path (is {np.shape(values)}, '
+                             f'{num_y} x {num_x} positions)')
+    
+    if chunk_size is not None:
+        return _iter_tool_path(x_axis, y_axis, r_fly, offsets, chunk_size)
+    
+    positions = _get_positions(x_axis, y_axis, r_fly, offsets, 
+                               np.arange(num_x * num_y))
+    return [values.reshape(num_y, num_x) for values in positions]
+
+
+def _iter_tool_path(x_axis, y_axis, r_fly, offsets, chunk_size):
+    """Iterate over chunks of a tool path.
+
+    Args:
+        x_axis (array, float): Nominal positions of the revolutions in X.
+        y_axis (array, float): Nominal positions of the rows in Y.
+        r_fly (float): Nominal tool position in Z.
+        offsets (dict): Offsets in X, Y and Z (see `gen_tool_path`).
+        chunk_size (int): Maximum number of positions in a chunk.
+
+    Yields:
+        ToolPath: Chunk of the tool path.
+    """
+    n_positions = x_axis.size * y_axis.size
+    for start in range(0, n_positions, chunk_size):
+        index = np.arange(start, min(start + chunk_size, n_positions))
+        yield ToolPath(*_get_positions(x_axis, y_axis, r_fly, offsets, index))
+
+
+def _get_positions(x_axis, y_axis, r_fly, offsets, index):
+    """Get tool positions including their offsets.
+
+    Args:
+        x_axis (array, float): Nominal positions of the revolutions in X.
+        y_axis (array, float): Nominal positions of the rows in Y.
+        r_fly (float): Nominal tool position in Z.
+        offsets (dict): Offsets in X, Y and Z (see `gen_tool_path`).
+        index (array, int): Flat indices of the positions (row by row).
+
+    Returns:
+        list of arrays, float: Tool positions in X, Y and Z.
+    """
+    rows, cols = np.divmod(index, x_axis.size)
+    nominal = (x_axis[cols], y_axis[rows])
+    positions = [nominal[0], nominal[1], np.full(index.shape, float(r_fly))]
+    for k, key in enumerate('xyz'):
+        values = offsets.get(key)
+        if values is None:
+            continue
+        if callable(values):
+            values = values(*nominal)
+        elif np.ndim(values) == 1:
+            values = np.asarray(values)[cols]
+        elif np.ndim(values) == 2:
+            values = np.asarray(values)[rows, cols]
+        positions[k] = positions[k] - values
+    return positions
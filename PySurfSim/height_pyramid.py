@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+Hierarchical maxima of surface heights for local footprint limits.
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author: Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+import numpy as np
+
+
+class HeightPyramid:
+    """Maxima of surface heights over tiles and hierarchically merged tiles.
+
+    The lowest level holds the maximum height of each tile of the surface, 
+    each further level the maximum of 2x2 blocks of the level below up to a 
+    single value for the whole surface. The maxima are updated incrementally 
+    for the tiles of a modified region, so the global maximum is available 
+    in constant time and the maximum of a region from the tiles covering it.
+    As heights only decrease during the simulation, stale maxima are upper 
+    bounds and thus still valid limits for tool footprints.
+
+    Returns:
+        HeightPyramid: Height pyramid of the surface.
+    """
+    surf_z = None
+    tile_size = None
+    levels = None
+
+    def __init__(self, surf_z, tile_size=32):
+        """Create the pyramid of a height map.
+
+        Args:
+            surf_z (array of float): Surface heights (referenced, not copied).
+            tile_size (int, optional): Size of the tiles of the lowest level 
+                                       in rows and columns. Defaults to 32.
+
+        Raises:
+            ValueError: Tile size not positive.
+        """
+        if tile_size <= 0:
+            raise ValueError(f'tile size has to be positive (is {tile_size})')
+        
+        self.surf_z = surf_z
+        self.tile_size = int(tile_size)
+        self.levels = [_reduce_blocks(surf_z, self.tile_size)]
+        while self.levels[-1].size > 1:
+            self.levels.append(_reduce_blocks(self.levels[-1], 2))
+
+    def max(self, selection=None):
+        """Get the maximum height of the surface or a region of it.
+
+        Args:
+            selection (tuple of slices, optional): Region of the surface in 
+                rows and columns. Defaults to None (whole surface).
+
+        Returns:
+            float: Upper bound of the heights in the region (maximum of the 
+                   tiles covering it).
+        """
+        if selection is None:
+            return self.levels[-1][0, 0]
+        
+        return np.max(self.levels[0][self._get_blocks(selection)])
+
+    def update(self, selection=None):
+        """Update the maxima after heights of a region have been modified.
+
+        Args:
+            selection (tuple of slices, optional): Modified region of the 
+                surface in rows and columns. Defaults to None (whole surface).
+        """
+        if selection is None:
+            selection = (slice(None), slice(None))
+        
+        blocks = self._get_blocks(selection)
+        region = tuple(slice(block.start * self.tile_size, 
+                             block.stop * self.tile_size) for block in blocks)
+        self.levels[0][blocks] = _reduce_blocks(self.surf_z[region], 
+                                                self.tile_size)
+        for lower, upper in zip(self.levels[:-1], self.levels[1:]):
+            blocks = tuple(slice(block.start // 2, (block.stop + 1) // 2) 
+                           for block in blocks)
+            region = tuple(slice(block.start * 2, block.stop * 2) 
+                           for block in blocks)
+            upper[blocks] = _reduce_blocks(lower[region], 2)
+
+    def _get_blocks(self, selection):
+        """Get the tiles of the lowest level covering a region of the surface.
+
+        Args:
+            selection (tuple of slices): Region in rows and columns.
+
+        Returns:
+            tuple of slices: Tiles in rows and columns.
+        """
+        blocks = []
+        for dim, part in enumerate(selection):
+            start, stop, _ = part.indices(self.surf_z.shape[dim])
+            blocks.append(slice(start // self.tile_size, 
+                                max(-(-stop // self.tile_size), 
+                                    start // self.tile_size + 1)))
+        return tuple(blocks)
+
+
+def _reduce_blocks(values, size):
+    """Get the maxima of blocks of a 2D array.
+
+    Args:
+        values (array): 2D array (not necessarily a multiple of the blocks).
+        size (int): Size of the blocks in rows and columns.
+
+    Returns:
+        array: Maxima of the blocks (last blocks may be smaller).
+    """
+    n_rows, n_cols = values.shape
+    cols = np.arange(0, max(n_cols, 1), size)
+    if values.size == 0:
+        return np.full((-(-max(n_rows, 1) // size), cols.size), -np.inf)
+    
+    # full blocks of rows are reduced on a reshaped view (reduceat along the
+    # first axis is considerably slower), the last block separately
+    full = n_rows // size * size
+    row_max = [np.max(values[:full].reshape(full // size, size, n_cols), 
+                      axis=1)]
+    if full < n_rows:
+        row_max.append(np.max(values[full:], axis=0, keepdims=True))
+    
+    return np.maximum.reduceat(np.concatenate(row_max), cols, axis=1)
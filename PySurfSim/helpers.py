@@ -25,9 +25,11 @@ along with this library; if not, write to the Free Software Foundation, Inc.,
           Badgasteiner Straße 2
           28359 Bremen
           Germany
-@version: 1.2
-@date:    2022-03-31
+@version: 1.3
+@date:    2026-10-17
 """
+import inspect
+from functools import lru_cache
 from itertools import tee
 import numpy as np
 
@@ -78,17 +80,132 @@ def default_parameters():
         'fixed_num_points': True,
         'visualize': True}  # do we want to plot the result?
 
-def get_surface_subset(surf_mesh, limits):
+def get_grid_axes(surf_mesh):
+    """Get the 1-D axes of a rectilinear surface mesh.
+
+    A mesh as created by `np.meshgrid` (and thus by `gen_surface_mesh`) is 
+    fully described by its first row of X and its first column of Y. Surfaces
+    that carry their axes (e.g. `RegularSurface` or `SurfacePatch`) return 
+    them directly.
+
+    Args:
+        surf_mesh (list of meshgrids): the surface (x, y and z meshgrid)
+
+    Returns:
+        tuple of arrays: axes in x (along columns) and y (along rows) or
+                         None if the mesh is not a rectilinear grid with 
+                         strictly increasing axes
+    """
+    if hasattr(surf_mesh, 'axes'):
+        return surf_mesh.axes
+
+    mesh_x = np.asarray(surf_mesh[0])
+    mesh_y = np.asarray(surf_mesh[1])
+    if mesh_x.ndim != 2 or mesh_x.shape != mesh_y.shape or mesh_x.size == 0:
+        return None
+
+    x_axis = mesh_x[0, :]
+    y_axis = mesh_y[:, 0]
+    if np.any(np.diff(x_axis) <= 0) or np.any(np.diff(y_axis) <= 0):
+        return None
+    if not (np.array_equal(mesh_x, np.broadcast_to(x_axis, mesh_x.shape)) and
+            np.array_equal(mesh_y, np.broadcast_to(y_axis[:, np.newaxis],
+                                                   mesh_y.shape))):
+        return None
+
+    return x_axis, y_axis
+
+
+def get_surface_extent(surf_mesh, axes=None):
+    """Get the lateral extent of a surface.
+
+    Args:
+        surf_mesh (list of meshgrids): the surface (x, y and z meshgrid)
+        axes (tuple of arrays, optional): axes of the surface as returned by
+                                          `get_grid_axes`. Defaults to None.
+
+    Returns:
+        tuple of tuples: lower and upper limit in x and y
+    """
+    if axes is not None:
+        return (axes[0][0], axes[0][-1]), (axes[1][0], axes[1][-1])
+    
+    return ((np.min(surf_mesh[0]), np.max(surf_mesh[0])),
+            (np.min(surf_mesh[1]), np.max(surf_mesh[1])))
+
+
+def get_grid_spacing(axes, rtol=1e-9):
+    """Get origin and spacing of a uniformly spaced grid.
+
+    Args:
+        axes (tuple of arrays): strictly increasing axes in x and y
+        rtol (float, optional): tolerance of the grid points relative to the 
+                                spacing. Defaults to 1e-9.
+
+    Returns:
+        tuple of floats: origin in x and y, spacing in x and y or None if 
+                         the axes are not uniformly spaced
+    """
+    grid = []
+    for axis in axes:
+        if len(axis) < 2:
+            return None
+        spacing = (axis[-1] - axis[0]) / (len(axis) - 1)
+        if not np.allclose(axis, axis[0] + np.arange(len(axis)) * spacing,
+                           rtol=0.0, atol=rtol * spacing):
+            return None
+        grid.append((axis[0], spacing))
+
+    return grid[0][0], grid[1][0], grid[0][1], grid[1][1]
+
+
+def get_grid_selection(axes, limits):
+    """Get the slices of a regular grid within given limits.
+
+    Args:
+        axes (tuple of arrays): strictly increasing axes in x and y
+        limits (list of tuples): limits in x and y
+
+    Returns:
+        tuple of slices: slice of subset in y (rows) and x (columns) or 
+                         None if no grid point is within the limits
+    """
+    x_axis, y_axis = axes
+    col_start = np.searchsorted(x_axis, limits[0][0], side='left')
+    col_stop = np.searchsorted(x_axis, limits[0][1], side='right')
+    row_start = np.searchsorted(y_axis, limits[1][0], side='left')
+    row_stop = np.searchsorted(y_axis, limits[1][1], side='right')
+
+    if col_start >= col_stop or row_start >= row_stop:
+        return None
+
+    return (slice(row_start, row_stop), slice(col_start, col_stop))
+
+
+def get_surface_subset(surf_mesh, limits, axes=None):
     """Extract a subset from a surface at given limits
 
     Args:
         surf_mesh (list of meshgrids): the original surface (x, y and z meshgrid)
         limits (list of tuples): limits in x and y
+        axes (tuple of arrays, optional): axes of the surface as returned by
+                                          `get_grid_axes`. If given, the subset 
+                                          is found by a binary search on the 
+                                          axes instead of masking the whole 
+                                          mesh. Defaults to None.
 
     Returns:
         list of meshgrids: subset meshgrid
         tuple of slices: slice of subset in x and y
     """
+    if axes is not None:
+        selection = get_grid_selection(axes, limits)
+
+        if selection is None:
+            return None, None
+
+        return [mesh_part[selection] for mesh_part in surf_mesh], selection
+
     span = np.nonzero(np.bitwise_and.reduce((
         surf_mesh[0] >= limits[0][0],
         surf_mesh[0] <= limits[0][1],
@@ -105,4 +222,151 @@ def get_surface_subset(surf_mesh, limits):
     selection = (slice(x_span[0], x_span[1] + 1), slice(y_span[0], y_span[1] + 1))
 
     return [mesh_part[selection] for mesh_part in surf_mesh], selection
-    
\ No newline at end of file
+
+
+def get_subset_offset(offset, selection, shape):
+    """Get the offset of a subset of a surface patch.
+
+    Args:
+        offset (tuple of int): Row and column of the patch in its surface.
+        selection (tuple of slices): Slices of the subset in rows and columns.
+        shape (tuple of int): Shape of the patch.
+
+    Returns:
+        tuple of int: Row and column of the subset in the surface.
+    """
+    return tuple(start + part.indices(size)[0] 
+                 for start, part, size in zip(offset, selection, shape))
+
+
+def call_into(method, out, *args, **buffers):
+    """Call a tool method writing its result into a buffer.
+
+    Methods accepting an `out` argument (e.g. of `MeshToolFlyCut`) evaluate
+    into the buffer directly, further buffers (e.g. `work`) are only passed 
+    if accepted. Methods of the original tool interface without `out` are 
+    called with the positional arguments and the result is copied into the 
+    buffer.
+
+    Args:
+        method (callable): Tool method, e.g. `tool.get_z`.
+        out (array): Buffer for the result.
+        *args: Arguments of the method.
+        **buffers: Optional scratch buffers of the method.
+
+    Returns:
+        array: The buffer holding the result.
+    """
+    keywords = _get_keywords(getattr(method, '__func__', method))
+    if keywords is not None and 'out' not in keywords:
+        out[...] = method(*args)
+        return out
+    
+    buffers = {name: buffer for name, buffer in buffers.items() 
+               if keywords is None or name in keywords}
+    return method(*args, out=out, **buffers)
+
+
+def get_grid_z(tool, x_axis, y_axis, tool_pos, out=None):
+    """Evaluate a tool on the grid spanned by two axes.
+
+    Tools providing `get_z_separable` are evaluated on the axes directly, 
+    other tools by `get_z` on the meshes of the axes.
+
+    Args:
+        tool (tool class): Tool class to evaluate.
+        x_axis (array of float): Grid axis in X.
+        y_axis (array of float): Grid axis in Y.
+        tool_pos (list of float): Position of the tool center.
+        out (array, optional): Buffer for the result. Defaults to None.
+
+    Returns:
+        array of float: Tool heights on the grid (rows along Y).
+    """
+    if hasattr(tool, 'get_z_separable'):
+        method, args = tool.get_z_separable, (x_axis, y_axis, tool_pos)
+    else:
+        method, args = tool.get_z, (np.meshgrid(x_axis, y_axis), tool_pos)
+    if out is None:
+        return method(*args)
+    return call_into(method, out, *args)
+
+
+def print_not_engaged(tool_center_x, tool_center_y, tool_center_z):
+    """Print a tool position not engaged with the surface.
+
+    Args:
+        tool_center_x (float): Position of the tool center in X.
+        tool_center_y (float): Position of the tool center in Y.
+        tool_center_z (float): Position of the tool center in Z.
+    """
+    print((
+        f'X{tool_center_x:.6f} '
+        f'Y{tool_center_y:.6f} '
+        f'Z{tool_center_z:.6f}: tool not engaged'))
+
+
+
+class MeshSequence:
+    """Base class indexed and iterated like the list [X, Y, Z].
+
+    Subclasses provide the meshes (or positions) as attributes `x`, `y` and 
+    `z`, so they can be used wherever the list returned by `gen_surface_mesh`
+    is expected.
+    """
+    __slots__ = ()
+    # provided by the subclasses (annotations only, no class attributes)
+    x: np.ndarray
+    y: np.ndarray
+    z: np.ndarray
+
+    def __len__(self):
+        return 3
+
+    def __getitem__(self, key):
+        return (self.x, self.y, self.z)[key]
+
+    def __iter__(self):
+        return iter((self.x, self.y, self.z))
+
+
+class AxesMeshSequence(MeshSequence):
+    """Base class of surfaces on a rectilinear grid given by their axes.
+
+    Subclasses provide the axes as attributes `x_axis` and `y_axis`, the 
+    shape of the height map and the heights `z`. The X- and Y-meshes are 
+    created on demand.
+    """
+    __slots__ = ()
+    x_axis: np.ndarray
+    y_axis: np.ndarray
+    shape: tuple
+
+    @property
+    def x(self):  # pylint: disable=C0103
+        """array of float: Read-only X-mesh (broadcast view, no copy)."""
+        return np.broadcast_to(self.x_axis, self.shape)
+
+    @property
+    def y(self):  # pylint: disable=C0103
+        """array of float: Read-only Y-mesh (broadcast view, no copy)."""
+        return np.broadcast_to(self.y_axis[:, np.newaxis], self.shape)
+
+
+@lru_cache(maxsize=None)
+def _get_keywords(function):
+    """Get the names of the arguments of a function.
+
+    Args:
+        function (callable): Function (or unbound method).
+
+    Returns:
+        frozenset of str: Argument names, None if any keyword is accepted.
+    """
+    try:
+        parameters = inspect.signature(function).parameters.values()
+    except (TypeError, ValueError):
+        return frozenset()
+    if any(parameter.kind == parameter.VAR_KEYWORD for parameter in parameters):
+        return None
+    return frozenset(parameter.name for parameter in parameters)
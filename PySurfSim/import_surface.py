@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+"""
+Import a measured or simulated surface from height-map files.
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author: Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+import json
+from pathlib import Path
+
+import numpy as np
+from .export_surface_binary import SDF_DATA_TYPES, SDF_HEADER
+from .regular_surface import RegularSurface
+
+
+FILE_FORMATS = ('ascii', 'sdf', 'gsf', 'raw')
+# data types of binary BCR/SDF files
+SDF_DTYPES = {0: '<u1', 1: '<u2', 2: '<u4', 4: '<i1', 5: '<i2', 6: '<i4',
+              **{value: key for key, value in SDF_DATA_TYPES.items()}}
+# length units in m, lengths and heights are converted to nm (unit of the 
+# simulation)
+UNITS = {'m': 1.0, 'mm': 1e-3, 'um': 1e-6, 'µm': 1e-6, 'nm': 1e-9}
+_SUFFIXES = {'.asc': 'ascii', '.txt': 'ascii', '.sdf': 'sdf', '.gsf': 'gsf',
+             '.raw': 'raw', '.bin': 'raw', '.dat': 'raw'}
+
+
+def import_surface(filename, file_format=None, mmap=False, block_rows=1024):
+    """Import a surface from a height-map file.
+
+    Supported are SPIP ASCII files (as written by `export_surface`), binary 
+    BCR/SDF, Gwyddion Simple Field (.gsf) and raw binary files with a JSON 
+    sidecar (as written by `export_surface_raw`). The headers are parsed 
+    into the axes of the grid and the heights are loaded in bulk, so the 
+    returned surface can directly be used by `apply_mesh_tool_to_workpiece`.
+    Lengths and heights are converted to nm.
+
+    Args:
+        filename (string or path): filename or path of the file to import.
+        file_format (str, optional): Format of the file ('ascii', 'sdf', 
+                                     'gsf' or 'raw'). Defaults to None 
+                                     (derived from the suffix).
+        mmap (bool, optional): Memory-map the heights of binary files 
+                               (read-only np.memmap) instead of loading them.
+                               Heights that have to be converted (integer 
+                               data or other units than nm) are always loaded.
+                               Defaults to False.
+        block_rows (int, optional): Number of rows of an ASCII file parsed 
+                                    at once. Defaults to 1024.
+
+    Raises:
+        ValueError: Unknown file format.
+        ValueError: Invalid file header.
+
+    Returns:
+        RegularSurface: Imported surface.
+    """
+    if file_format is None:
+        file_format = _SUFFIXES.get(Path(filename).suffix.lower(), 'raw')
+    if file_format not in FILE_FORMATS:
+        raise ValueError(f'unknown file format {file_format}, '
+                         f'use one of {FILE_FORMATS}')
+
+    if file_format == 'ascii':
+        return _import_ascii(filename, block_rows)
+    if file_format == 'sdf':
+        return _import_sdf(filename, mmap)
+    if file_format == 'gsf':
+        return _import_gsf(filename, mmap)
+    return _import_raw(filename, mmap)
+
+
+def _import_ascii(filename, block_rows):
+    """Import a SPIP ASCII file.
+
+    Args:
+        filename (string or path): filename or path of the file to import.
+        block_rows (int): Number of rows parsed at once.
+
+    Raises:
+        ValueError: Invalid file header.
+
+    Returns:
+        RegularSurface: Imported surface.
+    """
+    header = {}
+    with open(filename, 'r', encoding='utf-8') as fid:
+        for line in fid:
+            if line.startswith('# Start of Data:'):
+                break
+            if line.startswith('#'):
+                key, _, value = line[1:].partition('=')
+                header[key.strip()] = value.strip()
+        else:
+            raise ValueError(f'no data found in {filename}')
+
+        try:
+            shape_z = (int(header['y-pixels']), int(header['x-pixels']))
+        except (KeyError, ValueError) as err:
+            raise ValueError(f'invalid header in {filename}') from err
+        
+        surf_z = np.empty(shape_z)
+        for start in range(0, shape_z[0], block_rows):
+            rows = surf_z[start:start + block_rows]
+            # each value is followed by a tab, skip the empty last column
+            rows[...] = np.loadtxt(fid, delimiter='\t', max_rows=len(rows),
+                                   usecols=range(shape_z[1]), ndmin=2)
+    
+    # the length is given by the last point of the grid
+    x_axis = np.linspace(0.0, float(header.get('x-length', 0.0)), shape_z[1]) \
+        + float(header.get('x-offset', 0.0))
+    y_axis = np.linspace(0.0, float(header.get('y-length', 0.0)), shape_z[0]) \
+        + float(header.get('y-offset', 0.0))
+    
+    return RegularSurface(x_axis, y_axis, surf_z)
+
+
+def _import_sdf(filename, mmap):
+    """Import a binary BCR/SDF file.
+
+    Args:
+        filename (string or path): filename or path of the file to import.
+        mmap (bool): Memory-map the heights.
+
+    Raises:
+        ValueError: Invalid file header.
+
+    Returns:
+        RegularSurface: Imported surface.
+    """
+    with open(filename, 'rb') as fid:
+        header = SDF_HEADER.unpack(fid.read(SDF_HEADER.size))
+    (version, _, _, _, x_res, y_res, x_scale, y_scale, z_scale, _, 
+     compression, data_type, _) = header
+    if version not in (b'aBCR-1.0', b'aISO-1.0') or compression != 0 \
+            or data_type not in SDF_DTYPES:
+        raise ValueError(f'invalid or unsupported header in {filename}')
+    
+    surf_z = _load_heights(filename, SDF_DTYPES[data_type], (y_res, x_res), 
+                           SDF_HEADER.size, z_scale / UNITS['nm'], mmap)
+    
+    return RegularSurface(np.arange(x_res) * (x_scale / UNITS['nm']),
+                          np.arange(y_res) * (y_scale / UNITS['nm']), surf_z)
+
+
+def _import_gsf(filename, mmap):
+    """Import a Gwyddion Simple Field file.
+
+    Args:
+        filename (string or path): filename or path of the file to import.
+        mmap (bool): Memory-map the heights.
+
+    Raises:
+        ValueError: Invalid file header.
+
+    Returns:
+        RegularSurface: Imported surface.
+    """
+    with open(filename, 'rb') as fid:
+        header = b''
+        while b'\0' not in header:
+            chunk = fid.read(4096)
+            if not chunk:
+                raise ValueError(f'invalid header in {filename}')
+            header += chunk
+    header = header[:header.index(b'\0')]
+    lines = header.decode('utf-8').splitlines()
+    if not lines or lines[0] != 'Gwyddion Simple Field 1.0':
+        raise ValueError(f'invalid header in {filename}')
+    fields = {key.strip(): value.strip() 
+              for key, _, value in (line.partition('=') for line in lines[1:])}
+    
+    try:
+        shape_z = (int(fields['YRes']), int(fields['XRes']))
+        xy_unit = UNITS[fields.get('XYUnits', 'm')] / UNITS['nm']
+        z_unit = UNITS[fields.get('ZUnits', 'm')] / UNITS['nm']
+    except (KeyError, ValueError) as err:
+        raise ValueError(f'invalid header in {filename}') from err
+    
+    # header is padded with 1 to 4 NUL bytes to a multiple of 4 bytes
+    offset = len(header) + 4 - len(header) % 4
+    surf_z = _load_heights(filename, '<f4', shape_z, offset, z_unit, mmap)
+    
+    x_axis = (np.arange(shape_z[1]) * (float(fields.get('XReal', 1.0)) / shape_z[1])
+              + float(fields.get('XOffset', 0.0))) * xy_unit
+    y_axis = (np.arange(shape_z[0]) * (float(fields.get('YReal', 1.0)) / shape_z[0])
+              + float(fields.get('YOffset', 0.0))) * xy_unit
+    
+    return RegularSurface(x_axis, y_axis, surf_z)
+
+
+def _import_raw(filename, mmap):
+    """Import a raw binary file with JSON sidecar.
+
+    Args:
+        filename (string or path): filename or path of the file to import.
+        mmap (bool): Memory-map the heights.
+
+    Raises:
+        ValueError: Invalid sidecar.
+
+    Returns:
+        RegularSurface: Imported surface.
+    """
+    with open(f'{filename}.json', 'r', encoding='utf-8') as fid:
+        sidecar = json.load(fid)
+    
+    try:
+        shape_z = tuple(sidecar['shape'])
+        unit = UNITS[sidecar.get('unit', 'nm')] / UNITS['nm']
+        surf_z = _load_heights(filename, sidecar['dtype'], shape_z, 0, unit, mmap)
+        x_axis = (np.arange(shape_z[1]) * sidecar['x_spacing'] 
+                  + sidecar.get('x_offset', 0.0)) * unit
+        y_axis = (np.arange(shape_z[0]) * sidecar['y_spacing'] 
+                  + sidecar.get('y_offset', 0.0)) * unit
+    except (KeyError, TypeError) as err:
+        raise ValueError(f'invalid sidecar of {filename}') from err
+    
+    return RegularSurface(x_axis, y_axis, surf_z)
+
+
+def _load_heights(filename, dtype, shape, offset, scale, mmap):
+    """Load or memory-map the heights of a binary file.
+
+    Args:
+        filename (string or path): filename or path of the file.
+        dtype (str): Data type of the heights.
+        shape (tuple of int): Shape of the heights.
+        offset (int): Offset of the heights in the file in bytes.
+        scale (float): Factor converting the heights to nm.
+        mmap (bool): Memory-map the heights if no conversion is required.
+
+    Returns:
+        array of float: Heights in nm.
+    """
+    if mmap and scale == 1.0 and np.dtype(dtype).kind == 'f':
+        return np.memmap(filename, dtype=dtype, mode='r', offset=offset, 
+                         shape=shape)
+    
+    surf_z = np.fromfile(filename, dtype=dtype, count=int(np.prod(shape)), 
+                         offset=offset).reshape(shape).astype(float)
+    if scale != 1.0:
+        surf_z *= scale
+    
+    return surf_z
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+Optional Numba-compiled kernels applying all tool positions at once.
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author: Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+import math
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# the kernels are compiled if Numba is installed, otherwise `apply_mesh_tool_
+# to_workpiece` falls back to the NumPy kernels
+NUMBA_AVAILABLE = numba is not None
+_prange = numba.prange if NUMBA_AVAILABLE else range
+
+
+def _jit(parallel=False):
+    """Compile a function with Numba if available (plain Python otherwise)."""
+    if not NUMBA_AVAILABLE:
+        return lambda function: function
+    return numba.njit(cache=True, nogil=True, parallel=parallel)
+
+
+def apply_positions(surf_z, axes, positions, parameters, lim_z, 
+                    parallel=False, n_bands=None):
+    """Apply tool positions to a surface on a regular grid in compiled loops.
+
+    Footprints, grid selections and the minimum of surface and tool heights 
+    are computed for all tool positions in a single call without returning 
+    to Python. The tool heights equal those of `MeshToolFlyCut.get_z_separable`
+    in float64. Without Numba the loops run as (slow) plain Python.
+
+    Args:
+        surf_z (array of float): Surface heights (modified in place).
+        axes (tuple of arrays): Axes of the surface in X and Y.
+        positions (list of arrays): Tool positions in X, Y and Z.
+        parameters (tuple of float): Kernel parameters of the tool 
+                                     (r_fly, delta_r_fly, r_eps, see 
+                                     `MeshToolFlyCut.kernel_parameters`).
+        lim_z (float): Maximum height of the surface.
+        parallel (bool, optional): Process bands of rows in parallel threads
+                                   (`numba.prange`), each band with all tool 
+                                   positions reaching it. Defaults to False.
+        n_bands (int, optional): Number of bands of rows for the parallel 
+                                 kernel. Defaults to None (4 per thread).
+    """
+    r_fly, delta_r_fly, r_eps = parameters
+    x_axis = np.ascontiguousarray(axes[0], dtype=float)
+    y_axis = np.ascontiguousarray(axes[1], dtype=float)
+    pos_x, pos_y, pos_z = (np.ascontiguousarray(position, dtype=float)
+                           for position in positions)
+    if not parallel:
+        _apply_rows(surf_z, x_axis, y_axis, pos_x, pos_y, pos_z, r_fly + 
+                    delta_r_fly, r_eps, float(lim_z), 0, surf_z.shape[0])
+        return
+    
+    if n_bands is None:
+        n_bands = 4 * (numba.get_num_threads() if NUMBA_AVAILABLE else 1)
+    bands = np.linspace(0, surf_z.shape[0], 
+                        min(n_bands, max(surf_z.shape[0], 1)) + 1).astype(np.int64)
+    _apply_bands(surf_z, x_axis, y_axis, pos_x, pos_y, pos_z, 
+                 r_fly + delta_r_fly, r_eps, float(lim_z), bands)
+
+
+@_jit()
+def _sag(dist, radius):
+    """Sag of a circle as in `MeshToolFlyCut.get_sag`."""
+    dist_sq = dist * dist
+    return dist_sq / (radius + math.sqrt(radius * radius - dist_sq))
+
+
+@_jit()
+def _apply_rows(surf_z, x_axis, y_axis, pos_x, pos_y, pos_z, r_1, r_2, lim_z,
+                row_min, row_max):
+    """Apply all tool positions to the rows row_min to row_max of a surface.
+
+    Args:
+        surf_z (array of float): Surface heights (modified in place).
+        x_axis (array of float): Axis of the surface in X.
+        y_axis (array of float): Axis of the surface in Y.
+        pos_x (array of float): Tool positions in X.
+        pos_y (array of float): Tool positions in Y.
+        pos_z (array of float): Tool positions in Z.
+        r_1 (float): First radius of the tool (r_fly + delta_r_fly).
+        r_2 (float): Second radius of the tool (r_eps).
+        lim_z (float): Maximum height of the surface.
+        row_min (int): First row to process.
+        row_max (int): Row after the last row to process.
+    """
+    sag_x = np.empty(x_axis.size)
+    for k in range(pos_x.size):
+        # footprint as in `MeshToolFlyCut.footprint`
+        height = lim_z - (pos_z[k] - r_1)
+        if not height > 0:
+            continue
+        half_x = math.sqrt(height * (2 * r_1 - height))
+        half_y = math.sqrt(height * (2 * r_2 - height))
+        # grid selection as in `get_grid_selection`
+        col_start = np.searchsorted(x_axis, -half_x + pos_x[k], side='left')
+        col_stop = np.searchsorted(x_axis, half_x + pos_x[k], side='right')
+        row_start = max(np.searchsorted(y_axis, -half_y + pos_y[k], 
+                                        side='left'), row_min)
+        row_stop = min(np.searchsorted(y_axis, half_y + pos_y[k], 
+                                       side='right'), row_max)
+        if col_start >= col_stop or row_start >= row_stop:
+            continue
+        
+        apex = pos_z[k] - r_1
+        for col in range(col_start, col_stop):
+            sag_x[col] = _sag(x_axis[col] - pos_x[k], r_1)
+        for row in range(row_start, row_stop):
+            sag_y = _sag(y_axis[row] - pos_y[k], r_2)
+            for col in range(col_start, col_stop):
+                tool_z = (sag_x[col] + sag_y) + apex
+                if tool_z < surf_z[row, col]:
+                    surf_z[row, col] = tool_z
+
+
+@_jit(parallel=True)
+def _apply_bands(surf_z, x_axis, y_axis, pos_x, pos_y, pos_z, r_1, r_2, lim_z,
+                 bands):
+    """Apply all tool positions to bands of rows of a surface in parallel.
+
+    Each band is only written by one thread, so no rows are modified 
+    concurrently and the result equals the serial kernel.
+
+    Args:
+        surf_z (array of float): Surface heights (modified in place).
+        x_axis (array of float): Axis of the surface in X.
+        y_axis (array of float): Axis of the surface in Y.
+        pos_x (array of float): Tool positions in X.
+        pos_y (array of float): Tool positions in Y.
+        pos_z (array of float): Tool positions in Z.
+        r_1 (float): First radius of the tool (r_fly + delta_r_fly).
+        r_2 (float): Second radius of the tool (r_eps).
+        lim_z (float): Maximum height of the surface.
+        bands (array of int): Limits of the bands of rows.
+    """
+    for band in _prange(bands.size - 1):  # pylint: disable=E1133
+        _apply_rows(surf_z, x_axis, y_axis, pos_x, pos_y, pos_z, r_1, r_2, 
+                    lim_z, bands[band], bands[band + 1])
@@ -25,8 +25,8 @@ along with this library; if not, write to the Free Software Foundation, Inc.,
           Badgasteiner Straße 2
           28359 Bremen
           Germany
-@version: 1.2
-@date:    2022-03-31
+@version: 1.3
+@date:    2026-10-17
 """
 import numpy as np
 
@@ -34,19 +34,43 @@ import numpy as np
 class MeshToolFlyCut:
     """Class for a fly-cutting tool.
 
+    The tool heights are computed relative to the tool apex (lowest point of
+    the tool, `z_m - (r_fly + delta_r_fly)`) as the sum of the sags of both 
+    radii, `d^2 / (r + sqrt(r^2 - d^2))`. This avoids the cancellation of 
+    the huge radii and tool center heights in `-sqrt(r^2 - d^2) + z_m`, so 
+    the tool can also be evaluated in float32 (`dtype=np.float32`). Then the
+    distances to the tool center and the apex height are formed in float64 
+    and only rounded once, the sags and their sum with the apex height are 
+    computed in float32. The error of the tool heights is below 4 ulp of the
+    height, i.e. below 1 pm for heights |z| < 4 um (a float32 surface adds 
+    half an ulp when storing the heights).
+
     Returns:
         MeshToolFlyCut: Class for a flycutting tool.
     """
     r_fly = None
     delta_r_fly = None
     r_eps = None
+    dtype = None
     
     def __init__(self, **kwargs):
         self.r_fly = kwargs.get('r_fly', 70e6)
         self.delta_r_fly = kwargs.get('delta_r_fly', 0.0)
         self.r_eps = kwargs.get('r_eps', 0.762e6)
+        self.dtype = np.dtype(kwargs.get('dtype', np.float64))
+    
+    @property
+    def apex_offset(self):
+        """float: Distance of the tool apex below the tool center point."""
+        return self.r_fly + self.delta_r_fly
     
-    def get_z(self, target_mesh, tool_pos):
+    @property
+    def kernel_parameters(self):
+        """tuple of float: Parameters of the tool geometry (r_fly, delta_r_fly,
+        r_eps) for compiled kernels (see `jit_kernels`)."""
+        return float(self.r_fly), float(self.delta_r_fly), float(self.r_eps)
+    
+    def get_z(self, target_mesh, tool_pos, out=None, work=None):
         """Tool geometry of a fly-cutter over a given surface.
 
         Args:
@@ -54,6 +78,11 @@ class MeshToolFlyCut:
                                                        e.g- X and Y meshes of a surface 
                                                        (only array pos [0] and [1] is considered).
             tool_pos (list of numpy arrays): Postion of the tool center points in X, Y and Z.
+            out (array of float, optional): Array of the tool dtype for the 
+                                            tool heights. Defaults to None.
+            work (list of arrays, optional): Two scratch arrays of the shape 
+                                             and dtype of `out` (required 
+                                             with `out`). Defaults to None.
 
         Returns:
             array of float:  Tool height map.
@@ -67,14 +96,138 @@ class MeshToolFlyCut:
     
         # $$z_T = -\sqrt{(r_{fly}+\Delta r_{fly})^2 - (x-x_M)^2}
         #         - \sqrt{r_{\epsilon}^2-(y-y_M)^2} + r_\epsilon + z_M$$
-        z_t = - np.sqrt((self.r_fly + self.delta_r_fly)**2 - (mesh_x - x_m)**2) \
-              - np.sqrt(self.r_eps**2 - (mesh_y - y_m)**2) + self.r_eps + z_m
+        # evaluated as sags relative to the apex z_M - (r_fly + Delta r_fly)
+        if out is not None:
+            sag_x = self.get_sag(np.subtract(mesh_x, x_m, out=out), 
+                                 self.apex_offset, out=out, work=work[0])
+            sag_y = self.get_sag(np.subtract(mesh_y, y_m, out=work[0]), 
+                                 self.r_eps, out=work[0], work=work[1])
+            return np.add(np.add(sag_x, sag_y, out=out), self.get_apex(z_m), 
+                          out=out)
+        
+        z_t = (self.get_sag(mesh_x - x_m, self.apex_offset) 
+               + self.get_sag(mesh_y - y_m, self.r_eps)) + self.get_apex(z_m)
     
-        # remove imagionary part, i.e. values outside of tool footprint
-        # zT(imag(zT)~=0) = NaN
+        # values outside of tool footprint are NaN
     
         return z_t
 
+    def get_z_separable(self, x_axis, y_axis, tool_pos, out=None):
+        """Tool geometry of a fly-cutter over a regular grid.
+
+        The tool height is the sum of a term depending on X only and a term 
+        depending on Y only. Both are evaluated on the axes and combined as 
+        an outer sum, which yields the same values as `get_z` on the 
+        corresponding meshgrid with only 1-D square roots.
+
+        Args:
+            x_axis (array of float): support points in X (columns of height map).
+            y_axis (array of float): support points in Y (rows of height map).
+            tool_pos (list of float): Postion of the tool center point in X, Y and Z.
+            out (array of float, optional): Array for the tool heights. 
+                                            Defaults to None.
+
+        Returns:
+            array of float: Tool height map with shape (len(y_axis), len(x_axis)).
+        """
+        sag_x, sag_y = self.get_profiles(x_axis, y_axis, tool_pos)
+
+        return _add_outer(sag_x, sag_y, self.get_apex(tool_pos[2]), out)
+
+    def get_profiles(self, x_axis, y_axis, tool_pos):
+        """Sags of the fly-cutter geometry along the axes.
+
+        Args:
+            x_axis (array of float): support points in X.
+            y_axis (array of float): support points in Y.
+            tool_pos (list of float): Postion of the tool center point in X, Y and Z.
+
+        Returns:
+            array of float, array of float: sags of r_fly + delta_r_fly over 
+                                            x - x_m and of r_eps over y - y_m
+        """
+        sag_x = self.get_sag(x_axis - tool_pos[0], self.apex_offset)
+        sag_y = self.get_sag(y_axis - tool_pos[1], self.r_eps)
+
+        return sag_x, sag_y
+
+    def get_sag(self, dist, radius, out=None, work=None):
+        """Sag of a circle, i.e. its height above its lowest point.
+
+        The sag `r - sqrt(r^2 - d^2)` is computed as `d^2 / (r + sqrt(r^2 - d^2))`
+        without cancellation.
+
+        Args:
+            dist (array of float): Lateral distance d from the center.
+            radius (float): Radius r of the circle.
+            out (array of float, optional): Array of the tool dtype for the 
+                                            sags, may be `dist` itself. 
+                                            Defaults to None.
+            work (array of float, optional): Scratch array of the shape and 
+                                             dtype of `out` (required with 
+                                             `out`). Defaults to None.
+
+        Returns:
+            array of float: Sag (NaN for distances larger than the radius).
+        """
+        radius = self.dtype.type(radius)
+        if out is not None:
+            dist_sq = np.multiply(dist, dist, out=work)
+            np.sqrt(np.subtract(radius * radius, dist_sq, out=out), out=out)
+            return np.divide(dist_sq, np.add(radius, out, out=out), out=out)
+        
+        dist = np.asarray(dist).astype(self.dtype, copy=False)
+        dist_sq = dist * dist
+
+        return dist_sq / (radius + np.sqrt(radius * radius - dist_sq))
+
+    def get_apex(self, z_m):
+        """Height of the tool apex, i.e. its lowest point.
+
+        Args:
+            z_m (float or array of float): Height of the tool center point.
+
+        Returns:
+            float or array of float: Height of the apex.
+        """
+        return np.asarray(z_m - self.apex_offset).astype(self.dtype, copy=False)
+
+    def get_z_envelope(self, x_axis, y_axis, tool_pos, x_lims, out=None):
+        """Lower envelope of the tool for several positions in a feed row.
+
+        All positions share their Y and Z position, so the minimum of the tool
+        heights over the row only depends on the minimum of the sags in X.
+        Each position only contributes within its footprint limits in X, 
+        outside of all footprints the envelope is infinite.
+
+        Args:
+            x_axis (array of float): support points in X.
+            y_axis (array of float): support points in Y.
+            tool_pos (list): Postions of the tool center points in X (array) 
+                             and the common position in Y and Z (float).
+            x_lims (list of arrays): lower and upper footprint limits in X 
+                                     for each position.
+            out (array of float, optional): Array for the tool heights. 
+                                            Defaults to None.
+
+        Returns:
+            array of float: Minimum tool height map with shape 
+                            (len(y_axis), len(x_axis)).
+        """
+        col_start = np.searchsorted(x_axis, x_lims[0], side='left')
+        col_stop = np.searchsorted(x_axis, x_lims[1], side='right')
+
+        env_x = np.full(np.shape(x_axis), np.inf, dtype=self.dtype)
+        for x_m, start, stop in zip(tool_pos[0], col_start, col_stop):
+            if start >= stop:
+                continue
+            sag_x = self.get_sag(x_axis[start:stop] - x_m, self.apex_offset)
+            np.minimum(env_x[start:stop], sag_x, out=env_x[start:stop])
+
+        sag_y = self.get_sag(y_axis - tool_pos[1], self.r_eps)
+
+        return _add_outer(env_x, sag_y, self.get_apex(tool_pos[2]), out)
+
     def footprint(self, tool_pos, lim_z=40.0):
         """Get tool footprint.
 
@@ -85,14 +238,15 @@ class MeshToolFlyCut:
         Returns:
             float, float: limits of tool engagement in x and y
         """
-        r_1 = self.r_fly + self.delta_r_fly  # first radius
+        r_1 = self.apex_offset  # first radius
         r_2 = self.r_eps  # second radius
 
-        # calculate max height according to r1
-        height = -(tool_pos[2] - r_1 - lim_z)  
+        # calculate max height above the apex
+        height = lim_z - (tool_pos[2] - r_1)
         if height > 0:
-            sqrt_x = np.sqrt(2 * r_1 * height - height**2)
-            sqrt_y = np.sqrt(2 * r_2 * height - height**2)
+            # half chord of a circle at a given sag without cancellation
+            sqrt_x = np.sqrt(height * (2 * r_1 - height))
+            sqrt_y = np.sqrt(height * (2 * r_2 - height))
             # calc. X limits
             x_lim = (-sqrt_x + tool_pos[0], sqrt_x + tool_pos[0])  
             # calc. Y limits
@@ -102,3 +256,48 @@ class MeshToolFlyCut:
             y_lim = None
 
         return x_lim, y_lim
+
+    def footprints(self, tool_pos, lim_z=40.0):
+        """Get tool footprints for several tool positions at once.
+
+        Args:
+            tool_pos (list of arrays, float): Positions of the tool in x,y,z
+            lim_z (float, optional): Limiting height in z. Defaults to 40.0.
+
+        Returns:
+            array, array: limits of tool engagement in x and y with shape 
+                          (2, number of positions), NaN where the tool is 
+                          not engaged
+        """
+        r_1 = self.apex_offset  # first radius
+        r_2 = self.r_eps  # second radius
+
+        # calculate max height above the apex
+        height = lim_z - (np.asarray(tool_pos[2], dtype=float) - r_1)
+        height[height <= 0] = np.nan
+        sqrt_x = np.sqrt(height * (2 * r_1 - height))
+        sqrt_y = np.sqrt(height * (2 * r_2 - height))
+        
+        x_lim = np.stack((-sqrt_x + tool_pos[0], sqrt_x + tool_pos[0]))
+        y_lim = np.stack((-sqrt_y + tool_pos[1], sqrt_y + tool_pos[1]))
+
+        return x_lim, y_lim
+
+
+def _add_outer(profile_x, profile_y, offset, out=None):
+    """Outer sum of profiles in X (columns) and Y (rows) plus an offset.
+
+    Args:
+        profile_x (array of float): Profile along the columns.
+        profile_y (array of float): Profile along the rows.
+        offset (float): Offset added to the outer sum.
+        out (array of float, optional): Array for the result. Defaults to None.
+
+    Returns:
+        array of float: Sum with shape (len(profile_y), len(profile_x)).
+    """
+    if out is None:
+        return (profile_x[np.newaxis, :] + profile_y[:, np.newaxis]) + offset
+    
+    np.add(profile_x[np.newaxis, :], profile_y[:, np.newaxis], out=out)
+    return np.add(out, offset, out=out)
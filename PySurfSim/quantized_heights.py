@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+Surface heights stored as integer counts of a height quantum.
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author: Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+import numpy as np
+
+
+class QuantizedHeights:
+    """Surface heights stored as integer counts of a quantum.
+
+    The heights are `base + counts * quantum` with counts stored as int32 
+    (or int16), e.g. with a quantum of 1 pm (1e-3 nm) int32 counts cover 
+    +/- 2.1 mm around the base height at half the memory of float64 heights.
+    Heights are rounded to the nearest multiple of the quantum when stored, 
+    i.e. the rounding error is at most half a quantum.
+    
+    Indexing returns dequantized float64 heights and assigning quantizes 
+    them, so the heights can be used as Z of a RegularSurface, e.g. by 
+    `apply_mesh_tool_to_workpiece` (processed tile by tile) and the 
+    exporters.
+
+    Returns:
+        QuantizedHeights: Quantized surface heights.
+    """
+    counts = None
+    quantum = None
+    base = None
+
+    def __init__(self, counts, quantum=1e-3, base=0.0):
+        """Create heights from integer counts.
+
+        Args:
+            counts (array of int): Counts of the quantum relative to the base.
+            quantum (float, optional): Height quantum. Defaults to 1e-3 (1 pm).
+            base (float, optional): Base height. Defaults to 0.0.
+
+        Raises:
+            ValueError: Counts are not integers or quantum not positive.
+        """
+        if not np.issubdtype(np.asarray(counts).dtype, np.signedinteger):
+            raise ValueError('counts have to be signed integers '
+                             f'(are {np.asarray(counts).dtype})')
+        if quantum <= 0:
+            raise ValueError(f'quantum has to be positive (is {quantum})')
+        
+        self.counts = counts
+        self.quantum = float(quantum)
+        self.base = float(base)
+
+    @classmethod
+    def from_heights(cls, z, quantum=1e-3, base=None, dtype=np.int32):
+        """Quantize surface heights.
+
+        Args:
+            z (array of float): Surface heights.
+            quantum (float, optional): Height quantum. Defaults to 1e-3 (1 pm).
+            base (float, optional): Base height. Defaults to None (maximum 
+                                    height, as material is only removed).
+            dtype (dtype, optional): Data type of the counts. 
+                                     Defaults to np.int32.
+
+        Returns:
+            QuantizedHeights: Quantized surface heights.
+        """
+        if base is None:
+            base = np.max(z)
+        heights = cls(np.empty(np.shape(z), dtype=dtype), quantum, base)
+        heights[...] = z
+        
+        return heights
+
+    @property
+    def shape(self):
+        """tuple of int: Shape of the height map."""
+        return self.counts.shape
+
+    @property
+    def dtype(self):
+        """dtype: Data type of the dequantized heights."""
+        return np.dtype(float)
+
+    @property
+    def ndim(self):
+        """int: Number of dimensions."""
+        return self.counts.ndim
+
+    @property
+    def nbytes(self):
+        """int: Memory of the counts in bytes."""
+        return self.counts.nbytes
+
+    def __len__(self):
+        return len(self.counts)
+
+    def __array__(self, dtype=None):
+        return np.asarray(self.dequantize(self.counts), dtype=dtype)
+
+    def __getitem__(self, key):
+        return self.dequantize(self.counts[key])
+
+    def __setitem__(self, key, value):
+        self.counts[key] = self.quantize(value)
+
+    def min(self, axis=None, out=None):
+        """Minimum height (see `np.min`)."""
+        return self.dequantize(self.counts.min(axis=axis, out=out))
+
+    def max(self, axis=None, out=None):
+        """Maximum height (see `np.max`)."""
+        return self.dequantize(self.counts.max(axis=axis, out=out))
+
+    def copy(self):
+        """Copy of the heights.
+
+        Returns:
+            QuantizedHeights: Heights with copied counts.
+        """
+        return QuantizedHeights(self.counts.copy(), self.quantum, self.base)
+
+    def empty_like(self):
+        """Uninitialized heights with the same shape and quantization.
+
+        Returns:
+            QuantizedHeights: Uninitialized heights.
+        """
+        return QuantizedHeights(np.empty_like(self.counts), self.quantum, 
+                                self.base)
+
+    def quantize(self, z):
+        """Convert heights to counts (rounded to the nearest count).
+
+        Args:
+            z (array of float): Heights.
+
+        Raises:
+            ValueError: Heights out of the range of the counts.
+
+        Returns:
+            array of int: Counts.
+        """
+        counts = np.rint((np.asarray(z, dtype=float) - self.base) / self.quantum)
+        limits = np.iinfo(self.counts.dtype)
+        if counts.size > 0 and (np.min(counts) < limits.min 
+                                or np.max(counts) > limits.max):
+            raise ValueError(f'heights out of range of {self.counts.dtype} '
+                             f'counts with quantum {self.quantum} around '
+                             f'base {self.base}')
+        
+        return counts.astype(self.counts.dtype)
+
+    def dequantize(self, counts):
+        """Convert counts to heights.
+
+        Args:
+            counts (array of int): Counts.
+
+        Returns:
+            array of float: Heights.
+        """
+        return self.base + counts * self.quantum
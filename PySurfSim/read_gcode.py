@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+"""
+Read the tool positions of an NC program (ISO G-code) in chunks.
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author: Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+import re
+from itertools import islice
+
+import numpy as np
+from .tool_path import ToolPath
+
+
+# work coordinate systems selected by G54 to G59
+WORK_OFFSETS = ('G54', 'G55', 'G56', 'G57', 'G58', 'G59')
+# lengths of G20 (inch) and G21 (mm) in nm (unit of the simulation)
+_UNITS = {20: 25.4e6, 21: 1e6}
+_COMMENTS = re.compile(r'\([^)\n]*\)|;[^\n]*')
+# number of a word: optional sign, digits and at most one decimal point
+_NUMBER = r'[+-]?(?:\d+\.?\d*|\.\d+)'
+# numbers of valid words
+_VALUES = re.compile(rf'[A-Z][ \t]*({_NUMBER})')
+# characters outside of words (% marks the start and end of the program)
+_BLANK_CHARS = b' \t\r\n%'
+# words (letter and any number) and other characters to report errors
+_TOKENS = re.compile(r'([A-Z])[ \t]*([^A-Z\s]*)|([^A-Z\s]+)')
+
+
+def read_gcode(filename, spacing=None, work_offsets=None, block_lines=65536,
+               chunk_size=None):
+    """Read the tool positions of an NC program in chunks.
+
+    Supported is the subset of ISO G-code used for fly-cutting: rapid (G0)
+    and linear moves (G1), absolute (G90) and incremental (G91) 
+    coordinates, inch (G20) and mm (G21), work offsets (G54 to G59), feed 
+    (F, per minute) and spindle speed (S, per minute). Other words are 
+    ignored. Blocks are parsed chunk by chunk and the linear moves are 
+    discretized into tool contact positions (one per revolution of the 
+    spindle, the phase is carried over from one move to the next), rapid 
+    moves do not cut. The program starts at the origin of G54. Positions 
+    are converted to nm.
+
+    Args:
+        filename (string or path): filename or path of the NC program.
+        spacing (float, optional): Distance of the contact positions along
+                                   the linear moves in nm. Defaults to None
+                                   (feed per revolution F / S).
+        work_offsets (dict, optional): Offsets in X, Y and Z (nm) of the work
+                                       coordinate systems, e.g. {'G54': (0.0,
+                                       0.0, r_fly)}. Defaults to None (no 
+                                       offsets).
+        block_lines (int, optional): Number of blocks (lines) parsed at once.
+                                     Defaults to 65536.
+        chunk_size (int, optional): Maximum number of positions of a chunk.
+                                    Defaults to None (positions of the 
+                                    parsed blocks).
+
+    Raises:
+        ValueError: Spacing 0 or negative
+        ValueError: Block or chunk size 0 or negative
+        ValueError: Unknown work coordinate system
+        ValueError: Unsupported motion (e.g. circular moves G2/G3)
+        ValueError: Feed or spindle speed missing for a linear move
+        ValueError: Malformed number or unsupported syntax in a block
+
+    Returns:
+        generator of ToolPath: Chunks of the tool contact positions.
+    """
+    if spacing is not None and spacing <= 0:
+        raise ValueError(f'spacing cannot be 0 or negative (is {spacing})')
+    if block_lines <= 0:
+        raise ValueError('block size cannot be 0 or negative '
+                         f'(is {block_lines})')
+    if chunk_size is not None and chunk_size <= 0:
+        raise ValueError(f'chunk size cannot be 0 or negative (is {chunk_size})')
+    
+    offsets = np.zeros((len(WORK_OFFSETS), 3))
+    for name, offset in ({} if work_offsets is None else work_offsets).items():
+        if name not in WORK_OFFSETS:
+            raise ValueError(f'unknown work coordinate system {name}, '
+                             f'choose from {WORK_OFFSETS}')
+        offsets[WORK_OFFSETS.index(name)] = offset
+    
+    return _read_blocks(filename, spacing, offsets, block_lines, chunk_size)
+
+
+def _read_blocks(filename, spacing, offsets, block_lines, chunk_size):
+    """Iterate over chunks of the tool contact positions (see `read_gcode`).
+
+    Yields:
+        ToolPath: Chunk of the tool contact positions.
+    """
+    # modal state at the end of the previous blocks, the program starts at 
+    # the origin of the active work coordinate system
+    state = {'position': np.zeros(3), 'machine': offsets[0].copy(), 
+             'motion': 0, 'distance': 90, 'units': 21, 'work': 54, 
+             'feed': np.nan, 'speed': np.nan, 'phase': 0.0}
+    with open(filename, 'r', encoding='utf-8') as fid:
+        while True:
+            lines = list(islice(fid, block_lines))
+            if not lines:
+                break
+            positions = _get_positions(lines, spacing, offsets, state)
+            step = len(positions) if chunk_size is None else chunk_size
+            for start in range(0, len(positions), max(step, 1)):
+                yield ToolPath(*positions[start:start + step].T)
+
+
+def _get_positions(lines, spacing, offsets, state):
+    """Get the tool contact positions of several blocks.
+
+    Args:
+        lines (list of str): Blocks of the NC program.
+        spacing (float): Distance of the contact positions (None for F / S).
+        offsets (array, float): Offsets of the work coordinate systems.
+        state (dict): Modal state, updated to the end of the blocks.
+
+    Raises:
+        ValueError: Unsupported motion
+        ValueError: Feed or spindle speed missing for a linear move
+
+    Returns:
+        array, float: Contact positions in X, Y and Z (n x 3).
+    """
+    line, letters, values = _parse_words(lines)
+    n_lines = len(lines)
+    
+    # modal G-codes of each block
+    is_g = letters == 'G'
+    modes = {}
+    for group, codes in (('motion', (0, 1, 2, 3)), ('distance', (90, 91)),
+                         ('units', (20, 21)), ('work', (54, 55, 56, 57, 58, 59))):
+        mask = is_g & np.isin(values, codes)
+        modes[group] = _fill(_get_words(mask, line, values, n_lines), 
+                             state[group])
+    if np.any(np.isin(modes['motion'], (2, 3))):
+        raise ValueError('unsupported motion (circular moves G2/G3)')
+    scale = np.where(modes['units'] == 20, _UNITS[20], _UNITS[21])
+    
+    # programmed positions in absolute or incremental coordinates
+    position = np.empty((n_lines, 3))
+    for k, axis in enumerate('XYZ'):
+        value = _get_words(letters == axis, line, values, n_lines) * scale
+        given = ~np.isnan(value)
+        absolute = given & (modes['distance'] == 90)
+        increments = np.cumsum(np.where(given & ~absolute, value, 0.0))
+        last = np.maximum.accumulate(np.where(absolute, np.arange(n_lines), -1))
+        position[:, k] = np.where(
+            last >= 0, value[last] + increments - increments[last], 
+            state['position'][k] + increments)
+    machine = position + offsets[modes['work'].astype(int) - 54]
+    
+    previous = np.empty_like(machine)
+    previous[0] = state['machine']
+    previous[1:] = machine[:-1]
+    
+    # revolutions of the spindle during the linear moves
+    cutting = modes['motion'] == 1
+    length = np.linalg.norm(machine - previous, axis=1)
+    if spacing is None:
+        feed = _fill(_get_words(letters == 'F', line, values, n_lines) * scale, 
+                     state['feed'])
+        speed = _fill(_get_words(letters == 'S', line, values, n_lines), 
+                      state['speed'])
+        state['feed'], state['speed'] = feed[-1], speed[-1]
+        moving = cutting & (length > 0)
+        if np.any(np.isnan(feed[moving]) | ~(speed[moving] > 0)):
+            raise ValueError('feed and spindle speed required for linear moves'
+                             ' (or spacing)')
+        spacing = np.where(moving, feed / np.where(moving, speed, 1.0), 1.0)
+    revolutions = np.where(cutting, length / spacing, 0.0)
+    total = state['phase'] + np.cumsum(revolutions)
+    before = np.concatenate(([state['phase']], total[:-1]))
+    
+    # contacts at full revolutions within each move
+    n_contacts = (np.floor(total) - np.floor(before)).astype(int)
+    move = np.repeat(np.arange(n_lines), n_contacts)
+    index = np.arange(move.size) - np.repeat(np.cumsum(n_contacts) 
+                                             - n_contacts, n_contacts)
+    fraction = (np.floor(before[move]) + 1 + index - before[move]) \
+        / revolutions[move]
+    contacts = previous[move] + fraction[:, None] * (machine[move] 
+                                                     - previous[move])
+    
+    state['position'] = position[-1]
+    state['machine'] = machine[-1]
+    state['phase'] = total[-1] - np.floor(total[-1])
+    for group, mode in modes.items():
+        state[group] = mode[-1]
+    return contacts
+
+
+def _parse_words(lines):
+    """Parse the words of several blocks.
+
+    Args:
+        lines (list of str): Blocks of the NC program.
+
+    Raises:
+        ValueError: Malformed number (e.g. X1.2.3 or a letter without number)
+        ValueError: Unsupported syntax (e.g. parameters #1=2)
+
+    Returns:
+        array of int, array of str, array of float: Block, letter and number 
+            of each word.
+    """
+    text = _COMMENTS.sub('', ''.join(lines).upper())
+    chars = np.frombuffer(text.encode('ascii', 'replace'), dtype=np.uint8)
+    numbers = _VALUES.findall(text)
+    # all other characters have to belong to the letters and numbers of words
+    if len(numbers) + sum(map(len, numbers)) != np.count_nonzero(
+            ~np.isin(chars, np.frombuffer(_BLANK_CHARS, np.uint8))):
+        _check_words(lines)
+    
+    is_letter = (chars >= ord('A')) & (chars <= ord('Z'))
+    is_newline = chars == ord('\n')
+    values = np.array(numbers, dtype=float)
+    line = (np.cumsum(is_newline) - is_newline)[is_letter]
+    letters = chars[is_letter].view('S1').astype(str)
+    return line, letters, values
+
+
+def _check_words(lines):
+    """Report the first invalid word of several blocks.
+
+    Args:
+        lines (list of str): Blocks of the NC program.
+
+    Raises:
+        ValueError: Malformed number (e.g. X1.2.3 or a letter without number)
+        ValueError: Unsupported syntax (e.g. parameters #1=2)
+        ValueError: Other invalid words
+    """
+    for block in lines:
+        text = _COMMENTS.sub('', block.upper())
+        for letter, number, other in _TOKENS.findall(text):
+            if other and other != '%':
+                raise ValueError(f'unsupported syntax {other!r} in block '
+                                 f'{block.strip()!r}')
+            if letter and re.fullmatch(_NUMBER, number) is None:
+                raise ValueError(f'malformed number in word '
+                                 f'{letter + number!r} of block '
+                                 f'{block.strip()!r}')
+    raise ValueError(f'invalid words in blocks {lines[0].strip()!r} to '
+                     f'{lines[-1].strip()!r}')
+
+
+def _get_words(mask, line, values, n_lines):
+    """Get the values of a word in each block.
+
+    Args:
+        mask (array, bool): Words to get.
+        line (array, int): Block of each word.
+        values (array, float): Value of each word.
+        n_lines (int): Number of blocks.
+
+    Returns:
+        array, float: Value of the last word of each block (NaN if none).
+    """
+    words = np.full(n_lines, np.nan)
+    words[line[mask]] = values[mask]
+    return words
+
+
+def _fill(words, initial):
+    """Fill blocks without a modal word with the previous value.
+
+    Args:
+        words (array, float): Value of each block (NaN if not given).
+        initial (float): Value before the first block.
+
+    Returns:
+        array, float: Modal value of each block.
+    """
+    last = np.maximum.accumulate(np.where(np.isnan(words), -1, 
+                                          np.arange(len(words))))
+    return np.where(last >= 0, words[last], initial)
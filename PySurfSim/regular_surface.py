@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+Surface on a regular grid that only stores its heights.
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author: Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+import numpy as np
+from .helpers import (AxesMeshSequence, get_grid_axes, get_grid_spacing, 
+                      get_subset_offset)
+
+
+class RegularSurface(AxesMeshSequence):
+    """Surface on a rectilinear grid that only stores its heights.
+
+    The X- and Y-meshes are not stored but created on demand as read-only
+    broadcast views of the axes. Indexing and iteration behave like the list
+    [X, Y, Z] returned by `gen_surface_mesh`, so a RegularSurface can be used
+    wherever such a list is expected. Patches of a larger surface keep their
+    offset (first row and column) within it.
+
+    Returns:
+        RegularSurface: Surface defined by its axes and heights.
+    """
+    __slots__ = ('x_axis', 'y_axis', 'z', 'offset')
+
+    def __init__(self, x_axis, y_axis, z, offset=(0, 0)):
+        """Create a surface from its axes and heights.
+
+        Args:
+            x_axis (array, float): Strictly increasing support points in X 
+                                   (along the columns of z).
+            y_axis (array, float): Strictly increasing support points in Y 
+                                   (along the rows of z).
+            z (array, float): Surface heights with shape (len(y_axis), len(x_axis)).
+            offset (tuple of int, optional): Row and column of the first 
+                                             height within the surface this 
+                                             is a patch of. Defaults to (0, 0).
+
+        Raises:
+            ValueError: Shape of heights does not match the axes.
+        """
+        self.x_axis = np.asarray(x_axis)
+        self.y_axis = np.asarray(y_axis)
+        self.z = z
+        self.offset = tuple(int(index) for index in offset)
+        
+        if np.shape(z) != (self.y_axis.size, self.x_axis.size):
+            raise ValueError(f'shape of z {np.shape(z)} does not match axes '
+                             f'({self.y_axis.size}, {self.x_axis.size})')
+
+    @classmethod
+    def from_mesh(cls, surf_mesh):
+        """Create a surface from a list of meshgrids.
+
+        Args:
+            surf_mesh (list of meshgrids): X- & Y-meshes plus heights in Z.
+
+        Raises:
+            ValueError: Meshes do not form a rectilinear grid.
+
+        Returns:
+            RegularSurface: Surface sharing the heights of the meshes.
+        """
+        axes = get_grid_axes(surf_mesh)
+        if axes is None:
+            raise ValueError('meshes do not form a rectilinear grid')
+        x_axis, y_axis = axes
+        
+        return cls(x_axis.copy(), y_axis.copy(), surf_mesh[2])
+
+    @property
+    def shape(self):
+        """tuple of int: Shape of the height map (rows in Y, columns in X)."""
+        return (self.y_axis.size, self.x_axis.size)
+
+    @property
+    def axes(self):
+        """tuple of arrays: Axes in X and Y."""
+        return self.x_axis, self.y_axis
+
+    @property
+    def origin(self):
+        """tuple of float: Position of the first height in X and Y."""
+        return float(self.x_axis[0]), float(self.y_axis[0])
+
+    @property
+    def spacing(self):
+        """tuple of float: Uniform spacing in X and Y (None if not uniform)."""
+        grid = get_grid_spacing(self.axes)
+        return None if grid is None else grid[2:]
+
+    def subset(self, selection):
+        """Get a part of the surface.
+
+        Args:
+            selection (tuple of slices): Slices along rows (Y) and columns (X).
+
+        Returns:
+            RegularSurface: Surface part sharing memory with this surface.
+        """
+        return RegularSurface(self.x_axis[selection[1]], 
+                              self.y_axis[selection[0]], 
+                              self.z[selection], 
+                              get_subset_offset(self.offset, selection, 
+                                                self.shape))
+
+    def with_z(self, z):
+        """Get a surface on the same grid with different heights.
+
+        Args:
+            z (array, float): New surface heights.
+
+        Returns:
+            RegularSurface: Surface sharing the axes with this surface.
+        """
+        return RegularSurface(self.x_axis, self.y_axis, z, self.offset)
+
+    def to_mesh(self):
+        """Expand the surface to a list of full meshgrids.
+
+        Returns:
+            list of arrays: X- & Y-meshes and Z-height.
+        """
+        return [np.array(self.x), np.array(self.y), self.z]
@@ -25,22 +25,23 @@ along with this library; if not, write to the Free Software Foundation, Inc.,
           Badgasteiner Straße 2
           28359 Bremen
           Germany
-@version: 1.2
-@date:    2022-03-31
+@version: 1.3
+@date:    2026-10-17
 """
 import numpy as np
 from PySurfSim.helpers import pairwise
+from PySurfSim.regular_surface import RegularSurface
+from PySurfSim.surface_patch import SurfacePatch
+from PySurfSim.tile_store import TileStore
 
 
-def slice_surface(surface_to_slice, x_div, y_div):
-    """Split a meshed surface into smaller patches.
+def get_tile_slices(shape, x_div, y_div):
+    """Get the index slices of the patches of a surface.
 
     Args:
-        surface_to_slice (list of arrays, float): A list of 3 numpy arrays 
-            (X, Y and Z) with X and Y defining the surface grid and Z 
-            defining the height at each point of the grid.
-        x_div (int): No of patches in X-direction.
-        y_div (int): No of patches in Y-direction.
+        shape (tuple of int): Shape of the surface heights.
+        x_div (int): No of patches in X-direction (1st dim.).
+        y_div (int): No of patches in Y-direction (2nd dim.).
 
     Raises:
         ValueError: Division in x 0 or negative
@@ -49,17 +50,16 @@ def slice_surface(surface_to_slice, x_div, y_div):
         ValueError: More divisions than length in y
 
     Returns:
-        list of arrays, float: A list of xDiv*yDiv patches
-            containing slices of the original meshed surface.
+        list of tuples of slices: A list of xDiv*yDiv slices in the order 
+            of the patches returned by `slice_surface`.
     """
     if x_div <= 0:
         raise ValueError(f'division in x cannot be 0 or negative (is {x_div})')
     if y_div <= 0:
         raise ValueError(f'division in y cannot be 0 or negative (is {y_div})')
 
-    sliced_surface = []
     # get dim. of surface to slice
-    [_, x_len, y_len] = np.shape(surface_to_slice)
+    [x_len, y_len] = shape
     
     if x_div > x_len:
         raise ValueError(f'more divisions than length in x ({x_div} > {x_len})')
@@ -71,9 +71,53 @@ def slice_surface(surface_to_slice, x_div, y_div):
     # create divions in 2nd dim.
     div_b = np.floor(np.linspace(0, y_len, y_div + 1)).astype(int)
 
-    for (b_1, b_2) in pairwise(div_b):    
-        for (a_1, a_2) in pairwise(div_a):
-            thisslice = [sliceElement[a_1:a_2, b_1:b_2]
+    return [(slice(a_1, a_2), slice(b_1, b_2))
+            for (b_1, b_2) in pairwise(div_b)
+            for (a_1, a_2) in pairwise(div_a)]
+
+
+def slice_surface(surface_to_slice, x_div, y_div, store=None):
+    """Split a meshed surface into smaller patches.
+
+    Args:
+        surface_to_slice (list of arrays, float): A list of 3 numpy arrays 
+            (X, Y and Z) with X and Y defining the surface grid and Z 
+            defining the height at each point of the grid, a 
+            RegularSurface, a SurfacePatch or a TileStore (read one patch at 
+            a time).
+        x_div (int): No of patches in X-direction.
+        y_div (int): No of patches in Y-direction.
+        store (str or path, optional): Directory of a TileStore to which the 
+            patches are written one at a time instead of returning them.
+            Defaults to None.
+
+    Raises:
+        ValueError: Division in x 0 or negative
+        ValueError: Division in y 0 or negative
+        ValueError: More divisions than length in x
+        ValueError: More divisions than length in y
+
+    Returns:
+        list of arrays, float: A list of xDiv*yDiv patches
+            containing slices of the original meshed surface (RegularSurface 
+            patches if a RegularSurface or TileStore was sliced, SurfacePatches
+            if a SurfacePatch was sliced, both with their offsets within the
+            surface), or the TileStore if a store was given. Lists of arrays
+            are placed by `combine_surface` using the slices of 
+            `get_tile_slices` or their first coordinates.
+    """
+    tiles = get_tile_slices(np.shape(surface_to_slice[2]), x_div, y_div)
+    if store is not None:
+        return TileStore.from_surface(store, surface_to_slice, tiles)
+    
+    sliced_surface = []
+
+    for tile in tiles:
+        if isinstance(surface_to_slice, 
+                      (RegularSurface, SurfacePatch, TileStore)):
+            thisslice = surface_to_slice.subset(tile)
+        else:
+            thisslice = [sliceElement[tile]
                          for sliceElement in surface_to_slice]
-            sliced_surface.append(thisslice)
+        sliced_surface.append(thisslice)
     return sliced_surface
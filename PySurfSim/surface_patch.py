@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+Lightweight container of a surface patch given by meshes.
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author: Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+import numpy as np
+from .helpers import (MeshSequence, get_grid_axes, get_grid_spacing, 
+                      get_subset_offset)
+
+
+class SurfacePatch(MeshSequence):
+    """Surface patch given by X-, Y- and Z-meshes on any grid.
+
+    The meshes are referenced, not copied, and indexing and iteration behave 
+    like the list [X, Y, Z] returned by `gen_surface_mesh`. Shape, origin, 
+    spacing and the offset of the patch within its surface are available 
+    without stacking the meshes, the axes of rectilinear meshes are only 
+    determined once.
+
+    Returns:
+        SurfacePatch: Surface patch referencing its meshes.
+    """
+    __slots__ = ('x', 'y', 'z', 'offset', '_axes')
+
+    def __init__(self, x, y, z, offset=(0, 0)):  # pylint: disable=C0103
+        """Create a surface patch from its meshes.
+
+        Args:
+            x (array, float): X-mesh.
+            y (array, float): Y-mesh.
+            z (array, float): Surface heights.
+            offset (tuple of int, optional): Row and column of the first 
+                                             height within the surface this 
+                                             is a patch of. Defaults to (0, 0).
+
+        Raises:
+            ValueError: Shapes of the meshes differ.
+        """
+        if not np.shape(x) == np.shape(y) == np.shape(z):
+            raise ValueError('shapes of the meshes differ '
+                             f'({np.shape(x)}, {np.shape(y)}, {np.shape(z)})')
+        self.x = x
+        self.y = y
+        self.z = z
+        self.offset = tuple(int(index) for index in offset)
+        # axes are determined once, wrapped in a tuple as they may be None
+        self._axes = None
+
+    @property
+    def shape(self):
+        """tuple of int: Shape of the height map (rows in Y, columns in X)."""
+        return np.shape(self.z)
+
+    @property
+    def axes(self):
+        """tuple of arrays: Axes in X and Y (None if not rectilinear)."""
+        if self._axes is None:
+            self._axes = (get_grid_axes([self.x, self.y]),)
+        return self._axes[0]
+
+    @property
+    def origin(self):
+        """tuple of float: Position of the first height in X and Y."""
+        return float(self.x[0, 0]), float(self.y[0, 0])
+
+    @property
+    def spacing(self):
+        """tuple of float: Uniform spacing in X and Y (None if not uniform)."""
+        grid = get_grid_spacing(self.axes) if self.axes is not None else None
+        return None if grid is None else grid[2:]
+
+    def subset(self, selection):
+        """Get a part of the surface patch.
+
+        Args:
+            selection (tuple of slices): Slices along rows (Y) and columns (X).
+
+        Returns:
+            SurfacePatch: Patch sharing memory with this patch.
+        """
+        return SurfacePatch(self.x[selection], self.y[selection], 
+                            self.z[selection], 
+                            get_subset_offset(self.offset, selection, 
+                                              self.shape))
+
+    def with_z(self, z):
+        """Get a patch on the same grid with different heights.
+
+        Args:
+            z (array, float): New surface heights.
+
+        Returns:
+            SurfacePatch: Patch sharing the X- and Y-meshes with this patch.
+        """
+        patch = SurfacePatch(self.x, self.y, z, self.offset)
+        patch._axes = self._axes  # pylint: disable=W0212
+        return patch
+
+    def to_mesh(self):
+        """Get the meshes as a list.
+
+        Returns:
+            list of arrays: X- & Y-meshes and Z-height.
+        """
+        return [self.x, self.y, self.z]
+
+
+def as_surface(surface):
+    """Get a surface container for a surface given as list of meshes.
+
+    Args:
+        surface (list of arrays, RegularSurface, SurfacePatch or TileStore): 
+            Surface (X- & Y-meshes and Z-height).
+
+    Returns:
+        RegularSurface, SurfacePatch or TileStore: The surface itself if it is
+            a surface container, a SurfacePatch referencing the meshes 
+            otherwise.
+    """
+    if hasattr(surface, 'subset') and hasattr(surface, 'shape'):
+        return surface
+    
+    return SurfacePatch(surface[0], surface[1], surface[2])
@@ -0,0 +1,488 @@
+# -*- coding: utf-8 -*-
+"""
+Chunked store of a surface as a directory of compressed tiles.
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author: Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+from .helpers import AxesMeshSequence, get_grid_axes, get_subset_offset
+from .quantized_heights import QuantizedHeights
+from .regular_surface import RegularSurface
+
+
+class TileStore(AxesMeshSequence):
+    """Surface stored as a directory of tiles with a manifest.
+
+    Each tile of the surface heights is stored in its own (compressed) .npz 
+    or .npy file, the axes are stored in `axes.npz`. The manifest 
+    (`manifest.json`) holds the grid metadata and, for each tile, its index 
+    range, lateral bounds and minimum and maximum height. It is rewritten 
+    after each written tile by default, so a store is reusable after a 
+    crashed run. Writing many tiles within a `with` block (or with 
+    `flush=False` and a final `flush`) rewrites it only once; tiles written 
+    before a crash are still readable, their limits are then missing.
+    With a height quantum, tiles are stored as int16 counts of the quantum 
+    relative to the maximum of the tile (int32 if the range of the tile 
+    requires it, see `QuantizedHeights`).
+    
+    The heights are only read tile by tile. Like a RegularSurface, the store 
+    can be indexed like the list [X, Y, Z], where Z is a read-only view 
+    loading the tiles required for the requested rows and columns, so it 
+    can e.g. directly be exported.
+
+    Returns:
+        TileStore: Surface stored in tiles.
+    """
+    MANIFEST = 'manifest.json'
+    AXES = 'axes.npz'
+    path = None
+    manifest = None
+    x_axis = None
+    y_axis = None
+
+    def __init__(self, path):
+        """Open an existing tile store.
+
+        Args:
+            path (str or path): Directory of the tile store.
+
+        Raises:
+            ValueError: No tile store in the directory.
+        """
+        self.path = Path(path)
+        if not (self.path / self.MANIFEST).is_file():
+            raise ValueError(f'no tile store in {path}')
+        with open(self.path / self.MANIFEST, 'r', encoding='utf-8') as fid:
+            self.manifest = json.load(fid)
+        with np.load(self.path / self.AXES) as axes:
+            self.x_axis = axes['x_axis']
+            self.y_axis = axes['y_axis']
+        self._cache = (None, None)
+        self._deferred = False
+        self._modified = False
+
+    def __enter__(self):
+        self._deferred = True
+        return self
+
+    def __exit__(self, *exc_info):
+        self._deferred = False
+        self.flush()
+
+    @classmethod
+    def create(cls, path, x_axis, y_axis, tiles, dtype=float, compressed=True,
+               quantum=None):
+        """Create an empty tile store.
+
+        The tiles have to be written (`write_tile`) before they can be read.
+
+        Args:
+            path (str or path): Directory of the tile store (created if 
+                                required, must not contain a tile store).
+            x_axis (array, float): Support points in X (columns).
+            y_axis (array, float): Support points in Y (rows).
+            tiles (list of tuples of slices): Rows and columns of each tile, 
+                                              e.g. from `get_tile_slices`.
+            dtype (dtype, optional): Data type of the heights. 
+                                     Defaults to float.
+            compressed (bool, optional): Store tiles as compressed .npz 
+                                         (True) or .npy files (False). 
+                                         Defaults to True.
+            quantum (float, optional): Store tiles as integer counts of this
+                                       height quantum (rounding error of 
+                                       half a quantum). Defaults to None.
+
+        Raises:
+            ValueError: Directory already contains a tile store.
+
+        Returns:
+            TileStore: Created tile store.
+        """
+        path = Path(path)
+        if (path / cls.MANIFEST).is_file():
+            raise ValueError(f'{path} already contains a tile store')
+        path.mkdir(parents=True, exist_ok=True)
+        
+        x_axis = np.asarray(x_axis)
+        y_axis = np.asarray(y_axis)
+        np.savez(path / cls.AXES, x_axis=x_axis, y_axis=y_axis)
+        suffix = '.npz' if compressed else '.npy'
+        manifest = {
+            'shape': [y_axis.size, x_axis.size],
+            'dtype': np.dtype(dtype).str,
+            'compressed': compressed,
+            'quantum': quantum,
+            'tiles': [{'file': f'tile_{index:05d}{suffix}',
+                       'rows': [rows.start, rows.stop],
+                       'cols': [cols.start, cols.stop],
+                       'bounds': [[float(x_axis[cols.start]), 
+                                   float(x_axis[cols.stop - 1])],
+                                  [float(y_axis[rows.start]), 
+                                   float(y_axis[rows.stop - 1])]],
+                       'min': None, 'max': None}
+                      for index, (rows, cols) in enumerate(
+                          _get_slices(tile, (y_axis.size, x_axis.size)) 
+                          for tile in tiles)]}
+        _write_manifest(path / cls.MANIFEST, manifest)
+        
+        return cls(path)
+
+    @classmethod
+    def from_surface(cls, path, surf_mesh, tiles, compressed=True, quantum=None):
+        """Store a surface in tiles.
+
+        Args:
+            path (str or path): Directory of the tile store.
+            surf_mesh (list of meshgrids or RegularSurface): Surface on a 
+                                                              rectilinear grid.
+            tiles (list of tuples of slices): Rows and columns of each tile.
+            compressed (bool, optional): Store tiles as compressed .npz 
+                                         files. Defaults to True.
+            quantum (float, optional): Store tiles as integer counts of this
+                                       height quantum. Defaults to None.
+
+        Raises:
+            ValueError: Surface is not on a rectilinear grid.
+
+        Returns:
+            TileStore: Created tile store.
+        """
+        axes = get_grid_axes(surf_mesh)
+        if axes is None:
+            raise ValueError('surface is not on a rectilinear grid')
+        
+        store = cls.create(path, axes[0], axes[1], tiles, 
+                           np.asarray(surf_mesh[2][:1, :1]).dtype, compressed,
+                           quantum)
+        with store:
+            for index, tile in enumerate(store.tiles):
+                store.write_tile(index, surf_mesh[2][tile])
+        
+        return store
+
+    @property
+    def shape(self):
+        """tuple of int: Shape of the height map (rows in Y, columns in X)."""
+        return tuple(self.manifest['shape'])
+
+    @property
+    def dtype(self):
+        """dtype: Data type of the heights."""
+        return np.dtype(self.manifest['dtype'])
+
+    @property
+    def compressed(self):
+        """bool: Tiles are stored as compressed .npz files."""
+        return self.manifest['compressed']
+
+    @property
+    def quantum(self):
+        """float: Height quantum of the tiles (None if not quantized)."""
+        return self.manifest.get('quantum')
+
+    @property
+    def axes(self):
+        """tuple of arrays: Axes in X and Y."""
+        return self.x_axis, self.y_axis
+
+    @property
+    def tiles(self):
+        """list of tuples of slices: Rows and columns of each tile."""
+        return [(slice(*tile['rows']), slice(*tile['cols'])) 
+                for tile in self.manifest['tiles']]
+
+    @property
+    def z(self):
+        """TileHeights: Read-only view of the heights loading tiles on access."""
+        return TileHeights(self)
+
+    @property
+    def n_tiles(self):
+        """int: Number of tiles."""
+        return len(self.manifest['tiles'])
+
+    def get_limits(self, index):
+        """Get minimum and maximum height of a tile from the manifest.
+
+        Args:
+            index (int): Index of the tile.
+
+        Returns:
+            float, float: Minimum and maximum height (None if not written).
+        """
+        tile = self.manifest['tiles'][index]
+        return tile['min'], tile['max']
+
+    def is_written(self, index):
+        """Check if the heights of a tile have been written.
+
+        Args:
+            index (int): Index of the tile.
+
+        Returns:
+            bool: True if the file of the tile exists.
+        """
+        return (self.path / self.manifest['tiles'][index]['file']).is_file()
+
+    def read_tile(self, index):
+        """Read a tile.
+
+        Args:
+            index (int): Index of the tile.
+
+        Returns:
+            RegularSurface: Tile of the surface.
+        """
+        rows, cols = self.tiles[index]
+        return RegularSurface(self.x_axis[cols], self.y_axis[rows], 
+                              self._load(index), 
+                              offset=get_subset_offset((0, 0), self.tiles[index],
+                                                       self.shape))
+
+    def write_tile(self, index, z, flush=True):
+        """Write the heights of a tile and update the manifest.
+
+        Args:
+            index (int): Index of the tile.
+            z (array, float): Heights of the tile.
+            flush (bool, optional): Rewrite the manifest file (not within a 
+                                    `with` block). Defaults to True.
+
+        Raises:
+            ValueError: Shape of the heights does not match the tile.
+        """
+        tile = self.manifest['tiles'][index]
+        rows, cols = self.tiles[index]
+        z = np.asarray(z, dtype=self.dtype)
+        if z.shape != (rows.stop - rows.start, cols.stop - cols.start):
+            raise ValueError(f'shape of z {z.shape} does not match tile '
+                             f'{index} ({rows.stop - rows.start}, '
+                             f'{cols.stop - cols.start})')
+        
+        data = z
+        if self.quantum is not None:
+            try:
+                heights = QuantizedHeights.from_heights(z, self.quantum, 
+                                                        dtype=np.int16)
+            except ValueError:
+                heights = QuantizedHeights.from_heights(z, self.quantum)
+            data = heights.counts
+            tile['base'] = heights.base
+            z = heights
+        
+        filename = self.path / tile['file']
+        if filename.suffix == '.npz':
+            np.savez_compressed(filename, z=data)
+        else:
+            np.save(filename, data)
+        tile['min'] = float(np.min(z))
+        tile['max'] = float(np.max(z))
+        self._modified = True
+        self._cache = (None, None)
+        if flush and not self._deferred:
+            self.flush()
+
+    def flush(self):
+        """Write the manifest if tiles were written since the last flush."""
+        if self._modified:
+            _write_manifest(self.path / self.MANIFEST, self.manifest)
+            self._modified = False
+
+    def patches(self):
+        """Iterate over the tiles.
+
+        Yields:
+            int, RegularSurface: Index and tile of the surface.
+        """
+        for index in range(self.n_tiles):
+            yield index, self.read_tile(index)
+
+    def subset(self, selection):
+        """Get a part of the surface in memory.
+
+        Args:
+            selection (tuple of slices): Slices along rows (Y) and columns (X).
+
+        Returns:
+            RegularSurface: Surface part.
+        """
+        return RegularSurface(self.x_axis[selection[1]], 
+                              self.y_axis[selection[0]], 
+                              self.z[selection], 
+                              offset=get_subset_offset((0, 0), selection, 
+                                                       self.shape))
+
+    def to_surface(self):
+        """Read the whole surface into memory.
+
+        Returns:
+            RegularSurface: Surface combined from all tiles.
+        """
+        return self.subset((slice(None), slice(None)))
+
+    def _load(self, index):
+        """Load the heights of a tile (the last loaded tile is cached).
+
+        Args:
+            index (int): Index of the tile.
+
+        Raises:
+            ValueError: Tile has not been written.
+
+        Returns:
+            array of float: Heights of the tile.
+        """
+        if self._cache[0] == index:
+            return self._cache[1].copy()
+        
+        filename = self.path / self.manifest['tiles'][index]['file']
+        if not filename.is_file():
+            raise ValueError(f'tile {index} has not been written')
+        if filename.suffix == '.npz':
+            with np.load(filename) as data:
+                z = data['z']
+        else:
+            z = np.load(filename)
+        if self.quantum is not None:
+            z = QuantizedHeights(z, self.quantum, 
+                                 self.manifest['tiles'][index]['base'])[...]
+        self._cache = (index, z)
+        
+        return z.copy()
+
+
+class TileHeights:
+    """Read-only view of the heights of a TileStore.
+
+    Indexing with slices (or integers) of rows and columns loads only the 
+    tiles overlapping the requested part.
+    """
+    store = None
+
+    def __init__(self, store):
+        self.store = store
+
+    @property
+    def shape(self):
+        """tuple of int: Shape of the height map."""
+        return self.store.shape
+
+    @property
+    def dtype(self):
+        """dtype: Data type of the heights."""
+        return self.store.dtype
+
+    @property
+    def ndim(self):
+        """int: Number of dimensions."""
+        return 2
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __array__(self, dtype=None):
+        return np.asarray(self[:, :], dtype=dtype)
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            key = (key, slice(None))
+        rows, cols = _get_slices(key, self.shape)
+        
+        part_z = np.empty((rows.stop - rows.start, cols.stop - cols.start), 
+                          dtype=self.dtype)
+        for index, (tile_rows, tile_cols) in enumerate(self.store.tiles):
+            row_start = max(rows.start, tile_rows.start)
+            row_stop = min(rows.stop, tile_rows.stop)
+            col_start = max(cols.start, tile_cols.start)
+            col_stop = min(cols.stop, tile_cols.stop)
+            if row_start >= row_stop or col_start >= col_stop:
+                continue
+            part_z[row_start - rows.start:row_stop - rows.start, 
+                   col_start - cols.start:col_stop - cols.start] = \
+                self.store._load(index)[  # pylint: disable=W0212
+                    row_start - tile_rows.start:row_stop - tile_rows.start,
+                    col_start - tile_cols.start:col_stop - tile_cols.start]
+        
+        # integers drop their dimension
+        return part_z[tuple(0 if isinstance(k, (int, np.integer)) else slice(None)
+                            for k in key)]
+
+
+def _get_slices(key, shape):
+    """Convert an index of rows and columns into slices with step 1.
+
+    Args:
+        key (tuple): Integers or slices of rows and columns.
+        shape (tuple of int): Shape of the indexed array.
+
+    Raises:
+        IndexError: Index out of range or slice with step other than 1.
+
+    Returns:
+        slice, slice: Slices of rows and columns.
+    """
+    return _get_slice(key[0], shape[0]), _get_slice(key[1], shape[1])
+
+
+def _get_slice(key, size):
+    """Convert an index along one dimension into a slice with step 1.
+
+    Args:
+        key (int or slice): Index.
+        size (int): Size of the dimension.
+
+    Raises:
+        IndexError: Index out of range or slice with step other than 1.
+
+    Returns:
+        slice: Slice with step 1.
+    """
+    if isinstance(key, (int, np.integer)):
+        if not -size <= key < size:
+            raise IndexError(f'index {key} is out of range for size {size}')
+        key = slice(key % size, key % size + 1)
+    start, stop, step = key.indices(size)
+    if step != 1:
+        raise IndexError('only slices with step 1 are supported')
+    return slice(start, max(start, stop))
+
+
+def _write_manifest(filename, manifest):
+    """Write a manifest (atomically replacing an existing one).
+
+    Args:
+        filename (path): Filename of the manifest.
+        manifest (dict): Manifest.
+    """
+    temp_filename = filename.with_suffix('.tmp')
+    with open(temp_filename, 'w', encoding='utf-8') as fid:
+        json.dump(manifest, fid, indent=1)
+    os.replace(temp_filename, filename)
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""
+Tool path with a spatial index over the tool footprints.
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author: Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+import numpy as np
+
+from .helpers import MeshSequence, print_not_engaged
+
+
+class ToolPath(MeshSequence):
+    """Tool positions in columnar arrays with a spatial index.
+
+    The bounding boxes of the tool footprints are computed once for a limiting
+    height. Tool positions are sorted into buckets of a regular grid by their
+    center, so the positions that can touch a given surface tile are found 
+    without checking the whole path. Indexing returns the positions in X, Y 
+    and Z like the list of meshes used for tool positions otherwise.
+
+    Returns:
+        ToolPath: Tool path with spatial index.
+    """
+    x = None
+    y = None
+    z = None
+    lim_z = None
+    x_lim = None
+    y_lim = None
+
+    def __init__(self, x, y, z):
+        """Create a tool path.
+
+        Args:
+            x (array of float): Tool positions in X.
+            y (array of float): Tool positions in Y.
+            z (array of float): Tool positions in Z.
+
+        Raises:
+            ValueError: Number of positions in X, Y and Z differ.
+        """
+        self.x = np.ravel(np.asarray(x, dtype=float))
+        self.y = np.ravel(np.asarray(y, dtype=float))
+        self.z = np.ravel(np.asarray(z, dtype=float))
+        if not self.x.size == self.y.size == self.z.size:
+            raise ValueError('number of positions in x, y and z differ '
+                             f'({self.x.size}, {self.y.size}, {self.z.size})')
+        self._index = None
+
+    @classmethod
+    def from_mesh(cls, tool_pos):
+        """Create a tool path from meshes of tool positions.
+
+        Args:
+            tool_pos (list of arrays): Tool positions in X, Y and Z.
+
+        Returns:
+            ToolPath: Tool path (positions in flattened order).
+        """
+        if isinstance(tool_pos, ToolPath):
+            return tool_pos
+        return cls(tool_pos[0], tool_pos[1], tool_pos[2])
+
+    @property
+    def size(self):
+        """int: Number of tool positions."""
+        return self.x.size
+
+    def subset(self, indices):
+        """Get selected tool positions.
+
+        Args:
+            indices (array of int or slice): Indices of the tool positions.
+
+        Returns:
+            ToolPath: Tool path with selected positions (without index).
+        """
+        return ToolPath(self.x[indices], self.y[indices], self.z[indices])
+
+    def build_index(self, tool, lim_z, bucket_size=None):
+        """Compute the footprint bounding boxes and the bucket index.
+
+        Args:
+            tool (tool class): Tool class providing `footprint` (or 
+                               `footprints` for all positions at once).
+            lim_z (float): Limiting height of the surface in z. Bounding boxes 
+                           are valid for surfaces not exceeding this height.
+            bucket_size (tuple of float, optional): Size of the buckets in X 
+                and Y. Defaults to None (largest footprint extent).
+
+        Returns:
+            ToolPath: The tool path itself.
+        """
+        self.x_lim, self.y_lim = self._get_footprints(tool, lim_z)
+        self.lim_z = lim_z
+        
+        engaged = ~(np.isnan(self.x_lim[0]) | np.isnan(self.y_lim[0]))
+        # largest distance of a footprint boundary to its tool center
+        reach = (np.max(self.x_lim[1] - self.x, where=engaged, initial=0.0),
+                 np.max(self.y_lim[1] - self.y, where=engaged, initial=0.0))
+        if bucket_size is None:
+            bucket_size = (max(2 * reach[0], 1.0), max(2 * reach[1], 1.0))
+        
+        origin = (np.min(self.x, initial=0.0), np.min(self.y, initial=0.0))
+        bucket_x = np.floor((self.x - origin[0]) / bucket_size[0]).astype(np.int64)
+        bucket_y = np.floor((self.y - origin[1]) / bucket_size[1]).astype(np.int64)
+        num_x = int(np.max(bucket_x, initial=0)) + 1
+        keys = bucket_y * num_x + bucket_x
+        # positions that are never engaged are not indexed
+        keys[~engaged] = -1
+        order = np.argsort(keys, kind='stable')
+        
+        self._index = {'origin': origin, 'bucket_size': bucket_size, 
+                       'reach': reach, 'num_x': num_x, 
+                       'keys': keys[order], 'order': order}
+        return self
+
+    def engaged(self, tool, lim_z):
+        """Get the tool positions reaching below a height.
+
+        The bounding boxes of the index are used if they were computed for 
+        this height.
+
+        Args:
+            tool (tool class): Tool class providing `footprint` (or 
+                               `footprints` for all positions at once).
+            lim_z (float): Limiting height of the surface in z.
+
+        Returns:
+            array of bool: Tool positions engaged with a surface of this 
+                           height.
+        """
+        if self.lim_z == lim_z:
+            x_lim, y_lim = self.x_lim, self.y_lim
+        else:
+            x_lim, y_lim = self._get_footprints(tool, lim_z)
+        return ~(np.isnan(x_lim[0]) | np.isnan(y_lim[0]))
+
+    def print_not_engaged(self, tool, lim_z):
+        """Print the tool positions not reaching below a height.
+
+        Args:
+            tool (tool class): Tool class providing `footprint` (or 
+                               `footprints` for all positions at once).
+            lim_z (float): Limiting height of the surface in z.
+        """
+        engaged = self.engaged(tool, lim_z)
+        for tool_center in zip(self.x[~engaged], self.y[~engaged], 
+                               self.z[~engaged]):
+            print_not_engaged(*tool_center)
+
+    def query(self, x_range, y_range):
+        """Get the tool positions with footprints intersecting an area.
+
+        Args:
+            x_range (tuple of float): Lower and upper limit in X.
+            y_range (tuple of float): Lower and upper limit in Y.
+
+        Raises:
+            RuntimeError: Index has not been built.
+
+        Returns:
+            array of int: Indices of tool positions (in path order).
+        """
+        if self._index is None:
+            raise RuntimeError('index not built, call build_index first')
+        index = self._index
+        
+        # buckets of the tool centers that may reach the area
+        bucket_lo = [int(np.floor((limits[0] - reach - origin) / size))
+                     for limits, reach, origin, size 
+                     in zip((x_range, y_range), index['reach'], 
+                            index['origin'], index['bucket_size'])]
+        bucket_hi = [int(np.floor((limits[1] + reach - origin) / size))
+                     for limits, reach, origin, size 
+                     in zip((x_range, y_range), index['reach'], 
+                            index['origin'], index['bucket_size'])]
+        bucket_lo[0] = max(bucket_lo[0], 0)
+        bucket_hi[0] = min(bucket_hi[0], index['num_x'] - 1)
+        bucket_lo[1] = max(bucket_lo[1], 0)
+        if bucket_lo[0] > bucket_hi[0] or bucket_lo[1] > bucket_hi[1]:
+            return np.array([], dtype=np.int64)
+        
+        rows = np.arange(bucket_lo[1], bucket_hi[1] + 1) * index['num_x']
+        starts = np.searchsorted(index['keys'], rows + bucket_lo[0], side='left')
+        stops = np.searchsorted(index['keys'], rows + bucket_hi[0], side='right')
+        candidates = np.concatenate(
+            [index['order'][start:stop] for start, stop in zip(starts, stops)]
+            + [np.array([], dtype=np.int64)])
+        
+        # exact test of the bounding boxes
+        hit = (self.x_lim[0, candidates] <= x_range[1]) \
+            & (self.x_lim[1, candidates] >= x_range[0]) \
+            & (self.y_lim[0, candidates] <= y_range[1]) \
+            & (self.y_lim[1, candidates] >= y_range[0])
+        
+        return np.sort(candidates[hit])
+
+    def _get_footprints(self, tool, lim_z):
+        """Compute the footprint bounding boxes of all tool positions.
+
+        Args:
+            tool (tool class): Tool class providing `footprint` (or 
+                               `footprints` for all positions at once).
+            lim_z (float): Limiting height of the surface in z.
+
+        Returns:
+            array, array: Limits in X and Y (2 x positions, NaN if the tool 
+                          is not engaged).
+        """
+        if hasattr(tool, 'footprints'):
+            return tool.footprints([self.x, self.y, self.z], lim_z=lim_z)
+        
+        x_lims = np.full((2, self.size), np.nan)
+        y_lims = np.full((2, self.size), np.nan)
+        for k, tool_center in enumerate(zip(self.x, self.y, self.z)):
+            x_lim, y_lim = tool.footprint(tool_center, lim_z=lim_z)
+            if x_lim is not None and y_lim is not None:
+                x_lims[:, k] = x_lim
+                y_lims[:, k] = y_lim
+        return x_lims, y_lims
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+Cache of precomputed tool height maps on a regular grid.
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author: Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+from collections import OrderedDict
+
+import numpy as np
+
+from .helpers import get_grid_z
+
+
+class ToolStampCache:
+    """Bounded LRU cache of tool height maps ("stamps") on a regular grid.
+
+    If a tool is positioned at the same sub-pixel phase relative to a 
+    uniformly spaced grid, its height map is the same up to a shift by whole 
+    pixels and an offset by the tool position in Z. Stamps are therefore 
+    evaluated once for the tool at Z = `z_offset` and reused for all such 
+    positions. For tools providing their `apex_offset` this is the height 
+    with the apex at Z = 0, so adding the apex height reproduces the tool 
+    heights up to the rounding of the distances to the tool center (a few 
+    ulp), otherwise `z_offset` is 0.
+
+    Returns:
+        ToolStampCache: Cache of tool stamps.
+    """
+    tool = None
+    spacing = None
+    maxsize = None
+    z_offset = 0.0
+    hits = 0
+    misses = 0
+
+    def __init__(self, tool, spacing, maxsize=64):
+        """Create an empty cache.
+
+        Args:
+            tool (tool class): Tool class to evaluate.
+            spacing (tuple of float): Grid spacing in X and Y.
+            maxsize (int, optional): Maximum number of stamps kept. 
+                                     Defaults to 64.
+
+        Raises:
+            ValueError: maxsize is not positive.
+        """
+        if maxsize <= 0:
+            raise ValueError(f'maxsize has to be positive (is {maxsize})')
+        
+        self.tool = tool
+        self.spacing = spacing
+        self.maxsize = maxsize
+        self.z_offset = getattr(tool, 'apex_offset', 0.0)
+        self.hits = 0
+        self.misses = 0
+        self._stamps = OrderedDict()
+
+    def __len__(self):
+        return len(self._stamps)
+
+    def get(self, key, phase, extent):
+        """Get a tool stamp, evaluate it if it is not cached.
+
+        Args:
+            key (hashable): Key of the stamp (e.g. quantized phase and extent).
+            phase (tuple of float): Offset of the tool center from its anchor 
+                                    grid point in X and Y.
+            extent (tuple of tuples): First and last pixel of the stamp 
+                                      relative to the anchor grid point in 
+                                      Y (rows) and X (columns).
+
+        Returns:
+            array of float: Tool heights for a tool at Z = `z_offset`.
+        """
+        stamp = self._stamps.get(key)
+        if stamp is not None:
+            self.hits += 1
+            self._stamps.move_to_end(key)
+            return stamp
+
+        self.misses += 1
+        (row_first, row_last), (col_first, col_last) = extent
+        x_rel = np.arange(col_first, col_last + 1) * self.spacing[0]
+        y_rel = np.arange(row_first, row_last + 1) * self.spacing[1]
+        tool_pos = [phase[0], phase[1], self.z_offset]
+        stamp = get_grid_z(self.tool, x_rel, y_rel, tool_pos)
+        
+        self._stamps[key] = stamp
+        if len(self._stamps) > self.maxsize:
+            self._stamps.popitem(last=False)
+        
+        return stamp
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Reusable scratch buffers for the evaluation of tool heights.
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author: Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+import numpy as np
+
+
+class Workspace:
+    """Named scratch buffers reused for the tool heights of each position.
+
+    Each buffer is a flat array returned as a view of the requested shape. 
+    Buffers are allocated once for the largest footprint expected and only 
+    grow (at least doubling) if a larger footprint occurs, so consecutive 
+    tool positions are evaluated without allocating new arrays.
+
+    Returns:
+        Workspace: Scratch buffers.
+    """
+    size = None
+    dtype = None
+
+    def __init__(self, size=0, dtype=float):
+        """Create an empty workspace.
+
+        Args:
+            size (int, optional): Initial number of elements of each buffer. 
+                                  Defaults to 0.
+            dtype (data-type, optional): Data type of the buffers. 
+                                         Defaults to float.
+        """
+        self.size = int(size)
+        self.dtype = np.dtype(dtype)
+        self._buffers = {}
+
+    def get(self, name, shape):
+        """Get a buffer as an array of a given shape.
+
+        The content of the array is undefined and it is only valid until the
+        buffer is requested again.
+
+        Args:
+            name (str): Name of the buffer.
+            shape (tuple of int): Shape of the array.
+
+        Returns:
+            array: View of the buffer.
+        """
+        size = int(np.prod(shape))
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.size < size:
+            buffer = np.empty(max(size, self.size, 
+                                  2 * (0 if buffer is None else buffer.size)),
+                              dtype=self.dtype)
+            self._buffers[name] = buffer
+        
+        return buffer[:size].reshape(shape)
+
+    @property
+    def nbytes(self):
+        """int: Number of bytes of all buffers."""
+        return sum(buffer.nbytes for buffer in self._buffers.values())
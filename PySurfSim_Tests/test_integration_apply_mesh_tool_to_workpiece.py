@@ -28,10 +28,15 @@ along with this library; if not, write to the Free Software Foundation, Inc.,
 @version: 1.2
 @date:    2022-03-31
 """
+import contextlib
+import io
+import os
+import tempfile
 import unittest
 
 import numpy as np
-from PySurfSim import MeshToolFlyCut, apply_mesh_tool_to_workpiece, default_parameters
+from PySurfSim import (MeshToolFlyCut, apply_mesh_tool_to_workpiece, 
+                       default_parameters, gen_surface_mesh)
 
 
 class TestIntApplyMeshToolToWorkpiece(unittest.TestCase):
@@ -60,7 +65,223 @@ class TestIntApplyMeshToolToWorkpiece(unittest.TestCase):
         self.assertTrue(all(item.shape == new_mesh[0].shape 
                             for item in new_mesh),
                         'elements do not have the same shape')
+    
+    def test_kernels(self):
+        """ all kernels yield the same surface """
+        parameters = default_parameters().copy()
+        
+        surf_mesh = gen_surface_mesh(0.2e6, 0.1e6, 40.0, 100.0)
+        
+        tool_mesh = np.meshgrid(np.arange(4) * parameters['feed_x'] + 3.3, 
+                                np.arange(14) * parameters['raster_y'] + 1.7)
+        tool_mesh.append(np.ones(np.shape(tool_mesh[0])) * parameters['r_fly'])
+        
+        tool = MeshToolFlyCut(**parameters)
+        
+        new_mesh = apply_mesh_tool_to_workpiece(surf_mesh, tool_mesh, tool)
+        for kernel in ('separable', 'envelope', 'jit', 'jit_parallel'):
+            new_mesh_kernel = apply_mesh_tool_to_workpiece(
+                surf_mesh, tool_mesh, tool, kernel=kernel)
+            self.assertTrue(np.array_equal(new_mesh[2], new_mesh_kernel[2]),
+                            f'kernel {kernel} differs')
+        # stamps are evaluated at distances relative to the anchor pixel
+        new_mesh_kernel = apply_mesh_tool_to_workpiece(
+            surf_mesh, tool_mesh, tool, kernel='stamp')
+        self.assertTrue(np.allclose(new_mesh[2], new_mesh_kernel[2], 
+                                    rtol=0.0, atol=1e-12),
+                        'kernel stamp differs')
+        
+        with self.assertRaises(ValueError):
+            apply_mesh_tool_to_workpiece(surf_mesh, tool_mesh, tool, 
+                                         kernel='unknown')
+    
+    def test_in_place(self):
+        """ modification of the heights of the surface patch """
+        parameters = default_parameters().copy()
+        
+        tool_mesh = np.meshgrid(np.arange(4) * parameters['feed_x'] + 3.3, 
+                                np.arange(14) * parameters['raster_y'] + 1.7)
+        tool_mesh.append(np.ones(np.shape(tool_mesh[0])) * parameters['r_fly'])
+        tool = MeshToolFlyCut(**parameters)
+        
+        for regular in (False, True):
+            surface = gen_surface_mesh(0.2e6, 0.1e6, 40.0, 100.0, 
+                                       regular=regular)
+            surf_z = surface[2]
+            new_surface = apply_mesh_tool_to_workpiece(surface, tool_mesh, tool)
+            self.assertTrue(np.all(surf_z == 40.0))
+            
+            for kernel in ('mesh', 'separable', 'envelope', 'stamp'):
+                result = apply_mesh_tool_to_workpiece(
+                    surface, tool_mesh, tool, kernel=kernel, in_place=True)
+                self.assertIs(result[2], surf_z)
+                self.assertTrue(np.allclose(surf_z, new_surface[2], 
+                                            rtol=0.0, atol=1e-12))
+    
+    def test_cache_tiles(self):
+        """ processing cache tiles yields the same surface """
+        parameters = default_parameters().copy()
+        
+        tool_mesh = np.meshgrid(np.arange(4) * parameters['feed_x'] + 3.3, 
+                                np.arange(14) * parameters['raster_y'] + 1.7)
+        tool_mesh.append(np.ones(np.shape(tool_mesh[0])) * parameters['r_fly'])
+        tool = MeshToolFlyCut(**parameters)
+        
+        for regular in (False, True):
+            surface = gen_surface_mesh(0.2e6, 0.1e6, 40.0, 100.0, 
+                                       regular=regular)
+            for kernel in ('mesh', 'separable', 'envelope'):
+                new_surface = apply_mesh_tool_to_workpiece(
+                    surface, tool_mesh, tool, kernel=kernel)
+                for tile_size, tile_order in ((64, 'rows'), ((100, 30), 'rows'),
+                                              (64, 'hilbert')):
+                    new_surface_tiles = apply_mesh_tool_to_workpiece(
+                        surface, tool_mesh, tool, kernel=kernel, 
+                        tile_size=tile_size, tile_order=tile_order)
+                    self.assertTrue(
+                        np.array_equal(new_surface[2], new_surface_tiles[2]),
+                        f'tiles {tile_size} ({tile_order}) differ')
+        
+        with self.assertRaises(ValueError):
+            apply_mesh_tool_to_workpiece(surface, tool_mesh, tool, tile_size=0)
+        with self.assertRaises(ValueError):
+            apply_mesh_tool_to_workpiece(surface, tool_mesh, tool, 
+                                         tile_order='unknown')
+    
+    def test_float32(self):
+        """ surface and tool in float32 """
+        parameters = default_parameters().copy()
+        
+        tool_mesh = np.meshgrid(np.arange(4) * parameters['feed_x'] + 3.3, 
+                                np.arange(14) * parameters['raster_y'] + 1.7)
+        tool_mesh.append(np.ones(np.shape(tool_mesh[0])) * parameters['r_fly'])
+        
+        surface = gen_surface_mesh(0.2e6, 0.1e6, 40.0, 100.0, regular=True)
+        new_surface = apply_mesh_tool_to_workpiece(
+            surface, tool_mesh, MeshToolFlyCut(**parameters))
+        
+        surface = gen_surface_mesh(0.2e6, 0.1e6, 40.0, 100.0, regular=True, 
+                                   dtype=np.float32)
+        tool = MeshToolFlyCut(**parameters, dtype=np.float32)
+        for kernel in ('mesh', 'separable', 'envelope', 'stamp'):
+            new_surface_32 = apply_mesh_tool_to_workpiece(
+                surface, tool_mesh, tool, kernel=kernel)
+            self.assertEqual(new_surface_32.z.dtype, np.float32)
+            # below 1 pm
+            self.assertLess(np.max(np.abs(new_surface_32.z - new_surface.z)), 
+                            1e-3, f'kernel {kernel} differs')
+    
+    def test_batches(self):
+        """ batched application yields the same surface """
+        parameters = default_parameters().copy()
+        
+        surf_mesh = gen_surface_mesh(0.2e6, 0.1e6, 40.0, 100.0)
         
+        tool_mesh = np.meshgrid(np.arange(4) * parameters['feed_x'] + 3.3, 
+                                np.arange(14) * parameters['raster_y'] + 1.7)
+        tool_mesh.append(np.ones(np.shape(tool_mesh[0])) * parameters['r_fly'])
+        
+        tool = MeshToolFlyCut(**parameters)
+        
+        new_mesh = apply_mesh_tool_to_workpiece(surf_mesh, tool_mesh, tool)
+        for batch_size in (1, 5, 'row'):
+            new_mesh_batch = apply_mesh_tool_to_workpiece(
+                surf_mesh, tool_mesh, tool, batch_size=batch_size)
+            self.assertTrue(np.array_equal(new_mesh[2], new_mesh_batch[2]),
+                            f'batch size {batch_size} differs')
+        
+        # irregular mesh
+        surf_mesh[0][0, 0] = -1.0
+        new_mesh = apply_mesh_tool_to_workpiece(surf_mesh, tool_mesh, tool)
+        new_mesh_batch = apply_mesh_tool_to_workpiece(
+            surf_mesh, tool_mesh, tool, batch_size=7)
+        self.assertTrue(np.array_equal(new_mesh[2], new_mesh_batch[2]))
+        
+        with self.assertRaises(ValueError):
+            apply_mesh_tool_to_workpiece(surf_mesh, tool_mesh, tool, 
+                                         batch_size=0)
+        with self.assertRaises(ValueError):
+            apply_mesh_tool_to_workpiece(surf_mesh, tool_mesh, tool, 
+                                         kernel='envelope', batch_size=5)
+    
+    def test_out_of_core(self):
+        """ memory-mapped heights processed tile by tile """
+        parameters = default_parameters().copy()
+        
+        tool_mesh = np.meshgrid(np.arange(4) * parameters['feed_x'] + 3.3, 
+                                np.arange(14) * parameters['raster_y'] + 1.7)
+        tool_mesh.append(np.ones(np.shape(tool_mesh[0])) * parameters['r_fly'])
+        
+        tool = MeshToolFlyCut(**parameters)
+        
+        surface = gen_surface_mesh(0.2e6, 0.1e6, 40.0, 100.0, regular=True)
+        new_surface = apply_mesh_tool_to_workpiece(surface, tool_mesh, tool)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            surface_mm = gen_surface_mesh(
+                0.2e6, 0.1e6, 40.0, 100.0, 
+                filename=os.path.join(tmp_dir, 'surface.dat'))
+            self.assertIsInstance(surface_mm.z, np.memmap)
+            
+            for memory_limit in (None, 2**20, 2**14):
+                new_surface_mm = apply_mesh_tool_to_workpiece(
+                    surface_mm, tool_mesh, tool, memory_limit=memory_limit, 
+                    kernel='separable')
+                self.assertIsInstance(new_surface_mm.z, np.memmap)
+                self.assertTrue(np.array_equal(new_surface.z, new_surface_mm.z),
+                                f'memory limit {memory_limit} differs')
+            self.assertTrue(np.all(surface_mm.z == 40.0), 'input was modified')
+            
+            # in place
+            apply_mesh_tool_to_workpiece(surface_mm, tool_mesh, tool, 
+                                         out=surface_mm.z)
+            self.assertTrue(np.array_equal(new_surface.z, surface_mm.z))
+            del surface_mm, new_surface_mm
+        
+        # meshes in memory
+        surf_mesh = surface.to_mesh()
+        new_mesh = apply_mesh_tool_to_workpiece(surf_mesh, tool_mesh, tool, 
+                                                memory_limit=2**14)
+        self.assertTrue(np.array_equal(new_surface.z, new_mesh[2]))
+        
+        with self.assertRaises(ValueError):
+            apply_mesh_tool_to_workpiece(surf_mesh, tool_mesh, tool, 
+                                         memory_limit=0)
+    
+    def test_not_engaged(self):
+        """ positions above the surface are reported once """
+        parameters = default_parameters().copy()
+        
+        tool_mesh = np.meshgrid(np.arange(4) * parameters['feed_x'] + 3.3, 
+                                np.arange(14) * parameters['raster_y'] + 1.7)
+        tool_mesh.append(np.ones(np.shape(tool_mesh[0])) * parameters['r_fly'])
+        tool_mesh[2][0] += 100.0
+        tool = MeshToolFlyCut(**parameters)
+        
+        surface = gen_surface_mesh(0.2e6, 0.1e6, 40.0, 100.0, regular=True)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            apply_mesh_tool_to_workpiece(surface, tool_mesh, tool)
+        expected = sorted(output.getvalue().splitlines())
+        self.assertEqual(len(expected), 4)
+        
+        for options in ({'memory_limit': 2**14}, {'tile_size': 16}, 
+                        {'tile_size': 16, 'tile_order': 'hilbert'}, 
+                        {'memory_limit': 2**14, 'tile_size': 16}):
+            with self.subTest(**options):
+                output = io.StringIO()
+                with contextlib.redirect_stdout(output):
+                    apply_mesh_tool_to_workpiece(surface, tool_mesh, tool, 
+                                                 **options)
+                self.assertEqual(sorted(output.getvalue().splitlines()), 
+                                 expected)
+        
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            apply_mesh_tool_to_workpiece(surface, tool_mesh, tool, 
+                                         verbose=False)
+        self.assertEqual(output.getvalue(), '')
+
 
 if __name__ == '__main__':
     unittest.main()
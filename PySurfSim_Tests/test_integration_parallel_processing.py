@@ -33,9 +33,9 @@ from timeit import default_timer as timer
 
 import numpy as np
 from joblib import Parallel, delayed, parallel_backend
-from PySurfSim import (MeshToolFlyCut, apply_mesh_tool_to_workpiece,
-                       combine_surface, default_parameters, gen_surface_mesh,
-                       slice_surface)
+from PySurfSim import (MeshToolFlyCut, apply_mesh_tool_parallel,
+                       apply_mesh_tool_to_workpiece, combine_surface, 
+                       default_parameters, gen_surface_mesh, slice_surface)
 
 
 class TestParallelProcessing(unittest.TestCase):
@@ -110,6 +110,20 @@ class TestParallelProcessing(unittest.TestCase):
                 new_mesh_normal, new_mesh_parallel):
             self.assertTrue(np.array_equal(submesh_normal, submesh_parallel))
         
+        # %% shared memory execution
+        print('Calculating in parallel (shared memory)')
+        start_time_shared = timer()
+        new_mesh_shared = apply_mesh_tool_parallel(
+            self.surf_mesh, self.tool_mesh, self.tool, self.n_jobs, self.n_jobs,
+            n_jobs=self.n_jobs)
+        end_time_shared = timer()
+        dt_shared = end_time_shared - start_time_shared
+        print(f'Parallel execution (shared memory): {dt_shared:.2f} s')
+        
+        for submesh_normal, submesh_shared in zip(
+                new_mesh_normal, new_mesh_shared):
+            self.assertTrue(np.array_equal(submesh_normal, submesh_shared))
+        
         
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+Unit test for the parallel application of a meshed tool.
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author:  Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+import numpy as np
+from PySurfSim import (MeshToolFlyCut, RegularSurface, apply_mesh_tool_parallel,
+                       apply_mesh_tool_to_workpiece, default_parameters, 
+                       gen_surface_mesh)
+
+
+class TestApplyMeshToolParallel(unittest.TestCase):
+    """ Test cases for parallel tool application """
+    def setUp(self):
+        parameters = default_parameters().copy()
+        
+        self.tool_mesh = np.meshgrid(
+            np.arange(4) * parameters['feed_x'] + 3.3, 
+            np.arange(14) * parameters['raster_y'] + 1.7)
+        self.tool_mesh.append(
+            np.ones(np.shape(self.tool_mesh[0])) * parameters['r_fly'])
+        
+        self.tool = MeshToolFlyCut(**parameters)
+    
+    def test_regular_surface(self):
+        """ tiles of a regular surface in shared memory """
+        surface = gen_surface_mesh(0.2e6, 0.1e6, 40.0, 100.0, regular=True)
+        
+        new_surface = apply_mesh_tool_to_workpiece(
+            surface, self.tool_mesh, self.tool)
+        new_surface_parallel = apply_mesh_tool_parallel(
+            surface, self.tool_mesh, self.tool, 3, 4, n_jobs=2, 
+            kernel='separable')
+        
+        self.assertIsInstance(new_surface_parallel, RegularSurface)
+        self.assertTrue(np.array_equal(new_surface.z, new_surface_parallel.z))
+        self.assertTrue(np.all(surface.z == 40.0), 'input was modified')
+    
+    def test_mesh(self):
+        """ tiles of an irregular mesh in shared memory """
+        surf_mesh = gen_surface_mesh(0.2e6, 0.1e6, 40.0, 100.0)
+        surf_mesh[1][0, 0] = -1.0
+        
+        new_mesh = apply_mesh_tool_to_workpiece(
+            surf_mesh, self.tool_mesh, self.tool)
+        new_mesh_parallel = apply_mesh_tool_parallel(
+            surf_mesh, self.tool_mesh, self.tool, 2, 2, n_jobs=2)
+        
+        self.assertIsInstance(new_mesh_parallel, list)
+        self.assertTrue(np.array_equal(new_mesh[2], new_mesh_parallel[2]))
+
+    def test_in_place(self):
+        """ heights modified in place through shared memory """
+        surface = gen_surface_mesh(0.2e6, 0.1e6, 40.0, 100.0, regular=True)
+        new_surface = apply_mesh_tool_to_workpiece(
+            surface, self.tool_mesh, self.tool)
+        
+        for split in ['tiles', 'positions']:
+            with self.subTest(split=split):
+                surf_mesh = surface.to_mesh()
+                surf_z = surf_mesh[2]
+                result = apply_mesh_tool_parallel(
+                    surf_mesh, self.tool_mesh, self.tool, 2, 2, n_jobs=2, 
+                    split=split, in_place=True)
+                self.assertIs(result[2], surf_z)
+                self.assertTrue(np.array_equal(new_surface.z, surf_z))
+        
+        # memory-mapped heights are shared through their file
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            surface_mm = gen_surface_mesh(
+                0.2e6, 0.1e6, 40.0, 100.0, 
+                filename=os.path.join(tmp_dir, 'surface.dat'))
+            surf_z = surface_mm.z
+            apply_mesh_tool_parallel(surface_mm, self.tool_mesh, self.tool, 
+                                     2, 2, n_jobs=2, in_place=True)
+            self.assertIs(surface_mm.z, surf_z)
+            self.assertTrue(np.array_equal(new_surface.z, surf_z))
+            del surface_mm, surf_z
+    
+    def test_split_positions(self):
+        """ chunks of tool positions merged by minimum """
+        surface = gen_surface_mesh(0.2e6, 0.1e6, 40.0, 100.0, regular=True)
+        surf_mesh = surface.to_mesh()
+        
+        new_surface = apply_mesh_tool_to_workpiece(
+            surface, self.tool_mesh, self.tool)
+        for n_chunks in [1, 3, 5]:
+            with self.subTest(n_chunks=n_chunks):
+                new_surface_parallel = apply_mesh_tool_parallel(
+                    surface, self.tool_mesh, self.tool, n_jobs=2, 
+                    split='positions', n_chunks=n_chunks)
+                self.assertTrue(np.array_equal(new_surface.z, 
+                                               new_surface_parallel.z))
+        
+        new_mesh_parallel = apply_mesh_tool_parallel(
+            surf_mesh, self.tool_mesh, self.tool, n_jobs=2, split='positions')
+        self.assertTrue(np.array_equal(new_surface.z, new_mesh_parallel[2]))
+        self.assertTrue(np.all(surface.z == 40.0), 'input was modified')
+        
+        with self.assertRaises(ValueError):
+            apply_mesh_tool_parallel(surface, self.tool_mesh, self.tool, 
+                                     split='rows')
+
+    def test_threads(self):
+        """ tiles and chunks of tool positions in a thread pool """
+        surface = gen_surface_mesh(0.2e6, 0.1e6, 40.0, 100.0, regular=True)
+        surf_mesh = surface.to_mesh()
+        
+        new_surface = apply_mesh_tool_to_workpiece(
+            surface, self.tool_mesh, self.tool)
+        for split in ['tiles', 'positions']:
+            with self.subTest(split=split):
+                new_surface_threads = apply_mesh_tool_parallel(
+                    surface, self.tool_mesh, self.tool, 3, 2, n_jobs=3, 
+                    split=split, backend='threads')
+                self.assertTrue(np.array_equal(new_surface.z, 
+                                               new_surface_threads.z))
+                new_mesh_threads = apply_mesh_tool_parallel(
+                    surf_mesh, self.tool_mesh, self.tool, 3, 2, n_jobs=3, 
+                    split=split, backend='threads')
+                self.assertTrue(np.array_equal(new_surface.z, 
+                                               new_mesh_threads[2]))
+        self.assertTrue(np.all(surface.z == 40.0), 'input was modified')
+        self.assertTrue(np.all(surf_mesh[2] == 40.0), 'input was modified')
+        
+        with self.assertRaises(ValueError):
+            apply_mesh_tool_parallel(surface, self.tool_mesh, self.tool, 
+                                     backend='dask')
+    
+    def test_not_engaged(self):
+        """ positions above the surface are reported once """
+        surface = gen_surface_mesh(0.2e6, 0.1e6, 40.0, 100.0, regular=True)
+        self.tool_mesh[2][0] += 100.0
+        
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            apply_mesh_tool_to_workpiece(surface, self.tool_mesh, self.tool)
+        expected = sorted(output.getvalue().splitlines())
+        self.assertEqual(len(expected), 4)
+        
+        for split in ['tiles', 'positions']:
+            for backend in ['processes', 'threads']:
+                with self.subTest(split=split, backend=backend):
+                    output = io.StringIO()
+                    with contextlib.redirect_stdout(output):
+                        apply_mesh_tool_parallel(
+                            surface, self.tool_mesh, self.tool, 3, 2, 
+                            n_jobs=2, split=split, backend=backend, 
+                            tile_size=16)
+                    self.assertEqual(sorted(output.getvalue().splitlines()),
+                                     expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+Unit test for the application of tools with the basic tool interface.
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author:  Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+import unittest
+
+import numpy as np
+from PySurfSim import (ToolStampCache, apply_mesh_tool_parallel, 
+                       apply_mesh_tool_to_workpiece, gen_surface_mesh)
+
+
+class BallTool:
+    """ Ball-end tool providing only `get_z` and `footprint` """
+    def __init__(self, radius):
+        self.radius = radius
+    
+    def get_z(self, target_mesh, tool_pos):
+        """ heights of the ball below its center (inf outside) """
+        dist_sq = (target_mesh[0] - tool_pos[0])**2 \
+            + (target_mesh[1] - tool_pos[1])**2
+        return np.where(dist_sq < self.radius**2, 
+                        tool_pos[2] - np.sqrt(np.maximum(self.radius**2 
+                                                         - dist_sq, 0.0)),
+                        np.inf)
+    
+    def footprint(self, tool_pos, lim_z):
+        """ square around the circle cut at lim_z """
+        depth = lim_z - (tool_pos[2] - self.radius)
+        if depth <= 0:
+            return None, None
+        half = np.sqrt(self.radius**2 - max(self.radius - depth, 0.0)**2)
+        return ((tool_pos[0] - half, tool_pos[0] + half), 
+                (tool_pos[1] - half, tool_pos[1] + half))
+
+
+class TestUnitApplyMeshToolToWorkpiece(unittest.TestCase):
+    """ Test cases for tools with the basic interface """
+    def setUp(self):
+        self.surf_mesh = gen_surface_mesh(20e3, 10e3, 40.0, 100.0)
+        self.tool_mesh = np.meshgrid(np.arange(1e3, 20e3, 1.5e3), 
+                                     np.arange(1e3, 10e3, 2e3))
+        self.tool_mesh.append(np.full(np.shape(self.tool_mesh[0]), 1e3))
+        self.tool = BallTool(1e3)
+        
+        self.expected = self.surf_mesh[2].copy()
+        for tool_center in zip(*(np.ravel(part) for part in self.tool_mesh)):
+            self.expected = np.minimum(
+                self.expected, self.tool.get_z(self.surf_mesh, tool_center))
+    
+    def test_custom_tool(self):
+        """ tools without buffer arguments on all evaluation paths """
+        options = ({}, {'batch_size': 5}, {'batch_size': 'row'}, 
+                   {'kernel': 'separable'}, {'kernel': 'stamp'}, 
+                   {'kernel': 'stamp', 'tile_size': 32}, {'tile_size': 32}, 
+                   {'memory_limit': 2**16})
+        for kwargs in options:
+            with self.subTest(**kwargs):
+                new_mesh = apply_mesh_tool_to_workpiece(
+                    self.surf_mesh, self.tool_mesh, self.tool, **kwargs)
+                self.assertTrue(np.allclose(new_mesh[2], self.expected))
+        
+        new_mesh = apply_mesh_tool_parallel(self.surf_mesh, self.tool_mesh, 
+                                            self.tool, 2, 2, n_jobs=2, 
+                                            backend='threads')
+        self.assertTrue(np.allclose(new_mesh[2], self.expected))
+    
+    def test_options(self):
+        """ unknown and invalid options """
+        with self.assertRaises(TypeError):
+            apply_mesh_tool_to_workpiece(self.surf_mesh, self.tool_mesh, 
+                                         self.tool, tile_sizes=32)
+        with self.assertRaises(ValueError):
+            apply_mesh_tool_to_workpiece(self.surf_mesh, self.tool_mesh, 
+                                         self.tool, tile_order='columns')
+    
+    def test_stamp_cache(self):
+        """ stamps of tools without get_z_separable """
+        cache = ToolStampCache(self.tool, (40.0, 40.0))
+        stamp = cache.get('key', (10.0, -5.0), ((-2, 3), (-1, 4)))
+        x_rel = np.arange(-1, 5) * 40.0
+        y_rel = np.arange(-2, 4) * 40.0
+        self.assertEqual(stamp.shape, (6, 6))
+        self.assertTrue(np.array_equal(
+            stamp, self.tool.get_z(np.meshgrid(x_rel, y_rel), 
+                                   (10.0, -5.0, 0.0))))
+
+
+if __name__ == '__main__':
+    unittest.main()
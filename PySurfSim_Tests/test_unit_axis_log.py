@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+Unit test for machine axis logs.
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author:  Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+from PySurfSim import AxisLog, gen_tool_path
+
+
+class TestUnitAxisLog(unittest.TestCase):
+    """ Test Cases for machine axis logs """
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+        self.path = Path(self.tmp_dir.name)
+        self.times = np.linspace(0.0, 2.0, 2001)
+        self.samples = np.column_stack((self.times, 
+                                        0.1 * np.sin(10.0 * self.times), 
+                                        0.2 * np.cos(10.0 * self.times), 
+                                        0.05 * self.times))
+        with open(self.path / 'log.csv', 'w', encoding='utf-8') as fid:
+            fid.write('t,x,y,z\n')
+            np.savetxt(fid, self.samples, delimiter=',')
+        self.samples.tofile(self.path / 'log.bin')
+        np.save(self.path / 'log.npy', self.samples)
+    
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+    
+    def test_resample(self):
+        """ chunked reading and interpolation in all formats """
+        query = np.random.default_rng(0).uniform(-0.5, 2.5, (20, 30))
+        expected = np.interp(query, self.times, self.samples[:, 3]) * 1e3
+        for filename in ('log.csv', 'log.bin', 'log.npy'):
+            log = AxisLog(self.path / filename, columns=('t', 'x', 'y', 'z'), 
+                          unit='um', chunk_rows=100)
+            offsets = log.resample(query)
+            self.assertEqual(sorted(offsets), ['x', 'y', 'z'])
+            self.assertEqual(offsets['z'].shape, query.shape)
+            self.assertTrue(np.allclose(offsets['z'], expected), filename)
+        self.assertEqual(AxisLog(self.path / 'log.csv').columns, 
+                         ('t', 'x', 'y', 'z'))
+        
+        with self.assertRaises(ValueError):
+            list(log.stream([np.array([1.5]), np.array([0.5])]))
+        with self.assertRaises(ValueError):
+            AxisLog(self.path / 'log.bin', columns=('x', 'y'))
+        with self.assertRaises(ValueError):
+            AxisLog(self.path / 'log.csv', unit='in')
+    
+    def test_apply(self):
+        """ offsets at the contact times are streamed into the tool path """
+        log = AxisLog(self.path / 'log.bin', columns=('t', 'x', 'y', 'z'), 
+                      chunk_rows=64)
+        tool_mesh = gen_tool_path(1000.0, 10.0, 40.0, 20.0, 1e5)
+        chunks = gen_tool_path(1000.0, 10.0, 40.0, 20.0, 1e5, chunk_size=50)
+        times = 0.1 + np.arange(np.size(tool_mesh[0])) * 5e-3
+        
+        path = list(log.apply(chunks, period=5e-3, t_start=0.1))
+        
+        self.assertEqual(sum(len(chunk.x) for chunk in path), times.size)
+        for k in range(3):
+            self.assertTrue(np.allclose(
+                np.concatenate([chunk[k] for chunk in path]),
+                np.ravel(tool_mesh[k]) 
+                - np.interp(times, self.times, self.samples[:, k + 1])))
+        with self.assertRaises(ValueError):
+            log.apply(chunks)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -31,7 +31,8 @@ along with this library; if not, write to the Free Software Foundation, Inc.,
 import unittest
 
 import numpy as np
-from PySurfSim import combine_surface, pairwise
+from PySurfSim import (as_surface, combine_surface, get_tile_slices, pairwise, 
+                       slice_surface)
 
 
 class TestCombineSurface(unittest.TestCase):
@@ -77,6 +78,35 @@ class TestCombineSurface(unittest.TestCase):
         self.assertTrue(all(item.shape == (num_x, num_y)
                             for item in surf_mesh),
                         'elements are not arrays')
+        
+    def test_offsets(self):
+        """ patches are placed by their offsets regardless of their order """
+        x_vec = np.arange(0.0, 2000.0, 100.0)
+        y_vec = np.arange(0.0, 3000.0, 100.0)
+        surf_mesh_org = np.meshgrid(x_vec, y_vec)
+        surf_mesh_org.append(np.random.default_rng(0).normal(
+            40.0, 1.0, np.shape(surf_mesh_org[0])))
+        order = np.random.default_rng(1).permutation(12)
+        
+        sliced_surface = slice_surface(as_surface(surf_mesh_org), 4, 3)
+        shuffled = [sliced_surface[index] for index in order]
+        surf_mesh = combine_surface(shuffled, 4, 3)
+        self.assertEqual(surf_mesh.offset, (0, 0))
+        for part_org, part_combined in zip(surf_mesh_org, surf_mesh):
+            self.assertTrue(np.array_equal(part_org, part_combined))
+        self.assertFalse(np.shares_memory(surf_mesh.z, surf_mesh_org[2]))
+        self.assertIs(shuffled[0], sliced_surface[order[0]], 
+                      'input was reordered')
+        
+        tiles = get_tile_slices(np.shape(surf_mesh_org[2]), 4, 3)
+        sliced_surface = slice_surface(surf_mesh_org, 4, 3)
+        surf_mesh = combine_surface([sliced_surface[index] for index in order], 
+                                    4, 3, tiles=[tiles[index] for index in order])
+        for part_org, part_combined in zip(surf_mesh_org, surf_mesh):
+            self.assertTrue(np.array_equal(part_org, part_combined))
+        
+        with self.assertRaises(ValueError):
+            combine_surface(sliced_surface, 4, 3, tiles=tiles[:-1])
 
 
 if __name__ == '__main__':
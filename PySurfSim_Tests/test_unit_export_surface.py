@@ -29,11 +29,12 @@ along with this library; if not, write to the Free Software Foundation, Inc.,
 @date:    2022-03-31
 """
 import csv
+import tempfile
 import unittest
 from pathlib import Path
 
 import numpy as np
-from PySurfSim import export_surface
+from PySurfSim import RegularSurface, export_surface
 
 
 class TestUnitExportSurface(unittest.TestCase):
@@ -95,6 +96,40 @@ class TestUnitExportSurface(unittest.TestCase):
         self.assertEqual(len(y_vec), r_num['y'], 'wrong number of elements (y)')
         self.assertTrue(np.array_equal(surf_mesh_read, surf_mesh[2]),
                         'z values not equal')
+    
+    def test_export_blocks(self):
+        """ blocks of rows, parallel and memory-mapped export """
+        x_vec = np.arange(0.0, self.x_len + self.res, self.res)
+        y_vec = np.arange(0.0, self.y_len + self.res, self.res)
+        rng = np.random.default_rng(0)
+        surf_z = rng.normal(self.z_height, 1e3, (len(y_vec), len(x_vec)))
+        surf_z[0, :4] = [np.nan, -0.0, np.inf, 1e300]
+        surface = RegularSurface(x_vec, y_vec, surf_z)
+        
+        # reference: one value after the other
+        export_surface('test.asc', surface, block_size=1)
+        with open('test.asc', 'rb') as file:
+            content = file.read()
+        data = ''.join(''.join(f'{value:.8f}\t' for value in row) + '\r\n'
+                       for row in surf_z)
+        self.assertTrue(content.endswith(data.encode('utf-8')))
+        
+        for n_jobs, block_size in ((1, 2**20), (1, 25), (2, 25)):
+            export_surface('test.asc', surface, n_jobs=n_jobs, 
+                           block_size=block_size)
+            with open('test.asc', 'rb') as file:
+                self.assertEqual(content, file.read(), 
+                                 f'{n_jobs} jobs, blocks of {block_size} differ')
+        
+        with tempfile.TemporaryFile() as tmp_file:
+            surf_z_mm = np.memmap(tmp_file, dtype=float, mode='w+', 
+                                  shape=surf_z.shape)
+            surf_z_mm[...] = surf_z
+            export_surface('test.asc', RegularSurface(x_vec, y_vec, surf_z_mm),
+                           block_size=25)
+            del surf_z_mm
+        with open('test.asc', 'rb') as file:
+            self.assertEqual(content, file.read(), 'memory-mapped export differs')
         
 
 if __name__ == '__main__':
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+Unit test for the export of surfaces to binary height-map formats.
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author:  Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+import json
+import struct
+import unittest
+from pathlib import Path
+
+import numpy as np
+from PySurfSim import (RegularSurface, export_surface_gsf, export_surface_raw,
+                       export_surface_sdf)
+
+
+class TestUnitExportSurfaceBinary(unittest.TestCase):
+    """ Test Cases for exporting surfaces to binary formats """
+    def setUp(self):
+        self.files = [Path('test.sdf'), Path('test.gsf'), Path('test.raw'),
+                      Path('test.raw.json')]
+        self.tearDown()
+
+        x_vec = np.arange(0.0, 0.001e6 + 100, 100) + 50.0
+        y_vec = np.arange(0.0, 0.002e6 + 100, 100)
+        rng = np.random.default_rng(0)
+        self.surface = RegularSurface(
+            x_vec, y_vec, rng.normal(40.0, 1.0, (len(y_vec), len(x_vec))))
+
+    def tearDown(self):
+        for file in self.files:
+            if file.is_file():
+                file.unlink()
+
+    def test_export_sdf(self):
+        """ test export to binary BCR/SDF """
+        for dtype, data_type in (('<f8', 7), ('<f4', 3)):
+            export_surface_sdf('test.sdf', self.surface, dtype=dtype)
+            content = Path('test.sdf').read_bytes()
+
+            header = struct.unpack('<8s10s12s12sHHddddBBB', content[:81])
+            self.assertEqual(header[0], b'aBCR-1.0')
+            self.assertEqual(header[4:6], (11, 21))
+            self.assertAlmostEqual(header[6], 100e-9)
+            self.assertAlmostEqual(header[7], 100e-9)
+            self.assertEqual(header[11], data_type)
+            self.assertTrue(np.array_equal(
+                np.frombuffer(content[81:], dtype=dtype).reshape(21, 11),
+                self.surface.z.astype(dtype)))
+
+        with self.assertRaises(ValueError):
+            export_surface_sdf('test.sdf', self.surface, dtype='<i4')
+
+    def test_export_gsf(self):
+        """ test export to Gwyddion Simple Field """
+        export_surface_gsf('test.gsf', self.surface)
+        content = Path('test.gsf').read_bytes()
+
+        header = content.partition(b'\0')[0]
+        lines = header.decode('utf-8').splitlines()
+        self.assertEqual(lines[0], 'Gwyddion Simple Field 1.0')
+        fields = dict(line.split(' = ') for line in lines[1:])
+        self.assertEqual(int(fields['XRes']), 11)
+        self.assertEqual(int(fields['YRes']), 21)
+        self.assertEqual(float(fields['XReal']), 1100.0)
+        self.assertEqual(float(fields['XOffset']), 50.0)
+
+        data_start = len(content) - 11 * 21 * 4
+        self.assertEqual(data_start % 4, 0)
+        self.assertLessEqual(data_start - len(header), 4)
+        self.assertTrue(np.array_equal(
+            np.frombuffer(content[data_start:], dtype='<f4').reshape(21, 11),
+            self.surface.z.astype('<f4')))
+
+    def test_export_raw(self):
+        """ test export to raw binary with sidecar """
+        export_surface_raw('test.raw', self.surface)
+
+        with open('test.raw.json', 'r', encoding='utf-8') as file:
+            sidecar = json.load(file)
+        self.assertEqual(sidecar['shape'], [21, 11])
+        self.assertEqual(sidecar['x_offset'], 50.0)
+        self.assertEqual(sidecar['y_spacing'], 100.0)
+        self.assertTrue(np.array_equal(
+            np.fromfile('test.raw', dtype=sidecar['dtype']).reshape(
+                sidecar['shape']),
+            self.surface.z))
+
+        surf_mesh = self.surface.to_mesh()
+        surf_mesh[0][0, 1] = 0.0
+        with self.assertRaises(ValueError):
+            export_surface_raw('test.raw', surf_mesh)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Unit test for the generation of tool paths with offsets.
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author:  Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+import unittest
+
+import numpy as np
+from PySurfSim import (MeshToolFlyCut, ToolPath, apply_mesh_tool_to_workpiece, 
+                       default_parameters, gen_surface_mesh, gen_tool_path)
+
+
+class TestUnitGenToolPath(unittest.TestCase):
+    """ Test Cases for tool paths with offsets """
+    def setUp(self):
+        self.parameters = default_parameters().copy()
+        self.args = (0.2e6, self.parameters['feed_x'], 0.1e6, 
+                     self.parameters['raster_y'], self.parameters['r_fly'])
+        
+    def test_offsets(self):
+        """ offsets of all positions given as arrays or callables """
+        tool_mesh = gen_tool_path(*self.args, shift_x=3.3, shift_y=1.7)
+        num_y, num_x = np.shape(tool_mesh[0])
+        self.assertTrue(np.array_equal(tool_mesh[0][1], tool_mesh[0][0]))
+        self.assertAlmostEqual(tool_mesh[1][1, 0] - tool_mesh[1][0, 0], 
+                               self.parameters['raster_y'])
+        self.assertTrue(np.all(tool_mesh[2] == self.parameters['r_fly']))
+        
+        offsets = {'x': np.linspace(0.0, 1.0, num_x),
+                   'y': lambda x, y: 1e-6 * x,
+                   'z': np.random.default_rng(0).normal(0.0, 0.01, 
+                                                        (num_y, num_x))}
+        tool_mesh_offsets = gen_tool_path(*self.args, shift_x=3.3, 
+                                          shift_y=1.7, offsets=offsets)
+        self.assertTrue(np.allclose(tool_mesh[0] - tool_mesh_offsets[0], 
+                                    offsets['x']))
+        self.assertTrue(np.allclose(tool_mesh[1] - tool_mesh_offsets[1], 
+                                    1e-6 * tool_mesh[0]))
+        self.assertTrue(np.allclose(tool_mesh[2] - tool_mesh_offsets[2], 
+                                    offsets['z']))
+        
+        with self.assertRaises(ValueError):
+            gen_tool_path(*self.args, offsets={'z': np.zeros(num_x + 1)})
+        with self.assertRaises(ValueError):
+            gen_tool_path(0.2e6, 0.0, 0.1e6, 1.0, 1.0)
+        with self.assertRaises(ValueError):
+            gen_tool_path(*self.args, chunk_size=0)
+    
+    def test_chunks(self):
+        """ chunks of the tool path are applied like the whole tool path """
+        offsets = {'z': lambda x, y: 0.05 * np.sin(x / 1e4) * np.cos(y / 1e4)}
+        tool_mesh = gen_tool_path(*self.args, shift_x=3.3, offsets=offsets)
+        chunks = list(gen_tool_path(*self.args, shift_x=3.3, offsets=offsets, 
+                                    chunk_size=100))
+        
+        self.assertTrue(all(isinstance(chunk, ToolPath) for chunk in chunks))
+        self.assertTrue(all(len(chunk.x) <= 100 for chunk in chunks))
+        for k in range(3):
+            self.assertTrue(np.array_equal(
+                np.concatenate([chunk[k] for chunk in chunks]), 
+                np.ravel(tool_mesh[k])))
+        
+        tool = MeshToolFlyCut(**self.parameters)
+        surface = gen_surface_mesh(0.2e6, 0.1e6, 40.0, 100.0, regular=True)
+        new_surface = apply_mesh_tool_to_workpiece(surface, tool_mesh, tool)
+        for chunk in chunks:
+            surface = apply_mesh_tool_to_workpiece(surface, chunk, tool, 
+                                                   in_place=True)
+        self.assertTrue(np.array_equal(surface.z, new_surface.z))
+
+
+if __name__ == '__main__':
+    unittest.main()
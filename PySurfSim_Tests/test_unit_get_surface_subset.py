@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Unit test for extracting surface subsets.
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author:  Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+import unittest
+
+import numpy as np
+from PySurfSim import gen_surface_mesh, get_grid_axes, get_surface_subset
+
+
+class TestGetSurfaceSubset(unittest.TestCase):
+    """ Test cases for surface subsets """
+    def setUp(self):
+        self.surf_mesh = gen_surface_mesh(20e3, 10e3, 40.0, (100.0, 50.0))
+        
+    def test_grid_axes(self):
+        """ axes of a meshgrid are detected """
+        axes = get_grid_axes(self.surf_mesh)
+        
+        self.assertIsNotNone(axes)
+        self.assertTrue(np.array_equal(axes[0], self.surf_mesh[0][0, :]))
+        self.assertTrue(np.array_equal(axes[1], self.surf_mesh[1][:, 0]))
+        
+    def test_irregular_mesh(self):
+        """ distorted meshes are not treated as grid """
+        surf_mesh = [mesh_part.copy() for mesh_part in self.surf_mesh]
+        surf_mesh[0][3, 4] += 10.0
+        
+        self.assertIsNone(get_grid_axes(surf_mesh))
+    
+    def test_axes_lookup_equals_mask(self):
+        """ lookup on axes yields the same subsets as masking the mesh """
+        axes = get_grid_axes(self.surf_mesh)
+        rng = np.random.default_rng(1)
+        
+        limits = [((x_0, x_0 + d_x), (y_0, y_0 + d_y)) 
+                  for x_0, d_x, y_0, d_y in zip(
+                      rng.uniform(-2e3, 21e3, 50), rng.uniform(0.0, 5e3, 50),
+                      rng.uniform(-2e3, 11e3, 50), rng.uniform(0.0, 5e3, 50))]
+        # limits exactly on grid points
+        limits.append(((1000.0, 2000.0), (500.0, 550.0)))
+        # limits outside of the surface
+        limits.append(((30e3, 40e3), (0.0, 10e3)))
+        
+        for limit in limits:
+            subset_mask, selection_mask = get_surface_subset(
+                self.surf_mesh, limit)
+            subset_axes, selection_axes = get_surface_subset(
+                self.surf_mesh, limit, axes)
+            
+            self.assertEqual(selection_mask, selection_axes)
+            if subset_mask is not None:
+                for part_mask, part_axes in zip(subset_mask, subset_axes):
+                    self.assertTrue(np.array_equal(part_mask, part_axes))
+
+
+if __name__ == '__main__':
+    unittest.main()
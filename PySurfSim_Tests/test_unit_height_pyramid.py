@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Unit test for the pyramid of surface height maxima.
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author:  Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+import unittest
+
+import numpy as np
+from PySurfSim import HeightPyramid
+
+
+class TestUnitHeightPyramid(unittest.TestCase):
+    """ Test Cases for the height pyramid """
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.surf_z = rng.normal(40.0, 10.0, (101, 75))
+        self.pyramid = HeightPyramid(self.surf_z, tile_size=8)
+
+    def test_max(self):
+        """ global and local maxima """
+        self.assertEqual(len(self.pyramid.levels), 5)
+        self.assertEqual(self.pyramid.levels[0].shape, (13, 10))
+        self.assertEqual(self.pyramid.max(), np.max(self.surf_z))
+        
+        selection = (slice(17, 30), slice(60, 75))
+        local_z = self.pyramid.max(selection)
+        self.assertGreaterEqual(local_z, np.max(self.surf_z[selection]))
+        self.assertEqual(local_z, np.max(self.surf_z[16:32, 56:75]))
+        
+        with self.assertRaises(ValueError):
+            HeightPyramid(self.surf_z, tile_size=0)
+
+    def test_update(self):
+        """ incremental update of modified regions """
+        rng = np.random.default_rng(1)
+        for _ in range(20):
+            row, col = rng.integers(0, 75, 2)
+            selection = (slice(row, row + 27), slice(col, col + 9))
+            self.surf_z[selection] -= rng.uniform(0.0, 20.0)
+            self.pyramid.update(selection)
+        
+        expected = HeightPyramid(self.surf_z, tile_size=8)
+        for level, expected_level in zip(self.pyramid.levels, expected.levels):
+            self.assertTrue(np.array_equal(level, expected_level))
+        self.assertEqual(self.pyramid.max(), np.max(self.surf_z))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+Unit test for the import of surfaces from height-map files.
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author:  Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+import unittest
+from pathlib import Path
+
+import numpy as np
+from PySurfSim import (MeshToolFlyCut, RegularSurface, 
+                       apply_mesh_tool_to_workpiece, default_parameters, 
+                       export_surface, export_surface_gsf, export_surface_raw,
+                       export_surface_sdf, import_surface)
+
+
+class TestUnitImportSurface(unittest.TestCase):
+    """ Test Cases for importing surfaces """
+    def setUp(self):
+        self.files = [Path('test.asc'), Path('test.sdf'), Path('test.gsf'), 
+                      Path('test.raw'), Path('test.raw.json')]
+        self.tearDown()
+        
+        x_vec = np.arange(0.0, 0.001e6 + 100, 100)
+        y_vec = np.arange(0.0, 0.002e6 + 100, 100)
+        rng = np.random.default_rng(0)
+        self.surface = RegularSurface(
+            x_vec, y_vec, rng.normal(40.0, 1.0, (len(y_vec), len(x_vec))))
+
+    def tearDown(self):
+        for file in self.files:
+            if file.is_file():
+                file.unlink()
+
+    def _check_surface(self, surface, dtype=float):
+        self.assertIsInstance(surface, RegularSurface)
+        self.assertTrue(np.allclose(surface.x_axis, self.surface.x_axis))
+        self.assertTrue(np.allclose(surface.y_axis, self.surface.y_axis))
+        self.assertTrue(np.array_equal(surface.z, 
+                                       self.surface.z.astype(dtype)))
+
+    def test_import_ascii(self):
+        """ import of SPIP ASCII files """
+        export_surface('test.asc', self.surface)
+        
+        surface = import_surface('test.asc', block_rows=4)
+        self.assertTrue(np.allclose(surface.z, self.surface.z, 
+                                    rtol=0.0, atol=1e-8))
+        self.assertTrue(np.array_equal(surface.x_axis, self.surface.x_axis))
+        self.assertTrue(np.array_equal(surface.y_axis, self.surface.y_axis))
+        
+    def test_import_binary(self):
+        """ import of binary files, loaded and memory-mapped """
+        export_surface_sdf('test.sdf', self.surface)
+        export_surface_gsf('test.gsf', self.surface)
+        export_surface_raw('test.raw', self.surface)
+        
+        for filename, dtype in (('test.sdf', '<f8'), ('test.gsf', '<f4'), 
+                                ('test.raw', '<f8')):
+            with self.subTest(filename=filename):
+                self._check_surface(import_surface(filename), dtype)
+                surface = import_surface(filename, mmap=True)
+                self.assertIsInstance(surface.z, np.memmap)
+                self._check_surface(surface, dtype)
+                del surface
+        
+        with self.assertRaises(ValueError):
+            import_surface('test.sdf', file_format='gsf')
+        with self.assertRaises(ValueError):
+            import_surface('test.sdf', file_format='bmp')
+    
+    def test_apply(self):
+        """ imported surface as workpiece """
+        parameters = default_parameters().copy()
+        tool_mesh = np.meshgrid([500.0], [1000.0])
+        tool_mesh.append(np.ones(np.shape(tool_mesh[0])) 
+                         * (parameters['r_fly'] + 39.0))
+        tool = MeshToolFlyCut(**parameters)
+        
+        export_surface_raw('test.raw', self.surface)
+        new_surface = apply_mesh_tool_to_workpiece(
+            import_surface('test.raw'), tool_mesh, tool)
+        
+        self.assertTrue(np.array_equal(
+            new_surface.z, 
+            apply_mesh_tool_to_workpiece(self.surface, tool_mesh, tool).z))
+        self.assertTrue(np.any(new_surface.z < self.surface.z))
+
+
+if __name__ == '__main__':
+    unittest.main()
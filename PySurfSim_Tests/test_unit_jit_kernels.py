@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Unit test for the compiled kernels applying tool positions.
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author:  Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+import unittest
+
+import numpy as np
+from PySurfSim import (MeshToolFlyCut, apply_mesh_tool_to_workpiece, 
+                       default_parameters, gen_surface_mesh)
+from PySurfSim.jit_kernels import apply_positions
+
+
+class TestUnitJitKernels(unittest.TestCase):
+    """ Test Cases for the compiled kernels (plain Python without Numba) """
+    def setUp(self):
+        parameters = default_parameters().copy()
+        self.tool = MeshToolFlyCut(**parameters)
+        self.surface = gen_surface_mesh(0.06e6, 0.03e6, 40.0, 250.0, 
+                                        regular=True)
+        self.tool_mesh = np.meshgrid(
+            np.arange(3) * parameters['feed_x'] + 3.3, 
+            np.arange(6) * parameters['raster_y'] + 1.7)
+        self.tool_mesh.append(np.ones(np.shape(self.tool_mesh[0])) 
+                              * parameters['r_fly'] 
+                              + np.linspace(0.0, 30.0, self.tool_mesh[0].size)
+                              .reshape(self.tool_mesh[0].shape))
+        self.expected = apply_mesh_tool_to_workpiece(
+            self.surface, self.tool_mesh, self.tool, kernel='separable').z
+
+    def test_equivalence(self):
+        """ serial and parallel kernel equal the NumPy kernels """
+        self.assertEqual(self.tool.kernel_parameters, 
+                         (self.tool.r_fly, self.tool.delta_r_fly, 
+                          self.tool.r_eps))
+        positions = [np.ravel(position) for position in self.tool_mesh]
+        
+        for parallel, n_bands in ((False, None), (True, None), (True, 7)):
+            surf_z = self.surface.z.copy()
+            apply_positions(surf_z, (self.surface.x_axis, self.surface.y_axis),
+                            positions, self.tool.kernel_parameters, 
+                            np.max(surf_z), parallel=parallel, n_bands=n_bands)
+            self.assertTrue(np.array_equal(surf_z, self.expected))
+
+    def test_fallback(self):
+        """ float32 tools use the NumPy kernels """
+        tool = MeshToolFlyCut(**default_parameters(), dtype=np.float32)
+        new_surface = apply_mesh_tool_to_workpiece(
+            self.surface, self.tool_mesh, tool, kernel='jit')
+        self.assertTrue(np.array_equal(
+            new_surface.z, apply_mesh_tool_to_workpiece(
+                self.surface, self.tool_mesh, tool, kernel='separable').z))
+
+
+if __name__ == '__main__':
+    unittest.main()
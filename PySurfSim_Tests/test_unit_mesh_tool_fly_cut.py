@@ -52,6 +52,96 @@ class TestMeshToolFlyCut(unittest.TestCase):
 
         t_z = tool_mesh.get_z(surf_mesh, [70e3, 104e3, 60e6])
         self.assertEqual(t_z.shape, (210e3 / 100, 140e3 / 100))
+
+    def test_separable(self):
+        """ separable evaluation equals evaluation on the meshes """
+        x_vec = np.arange(0.0, 0.140e6, 100)
+        y_vec = np.arange(0.0, 0.210e6, 100)
+        surf_mesh = np.meshgrid(x_vec, y_vec)
+        
+        tool_mesh = MeshToolFlyCut(r_fly=80e6, delta_r_fly=0.1, r_eps=0.8e6)
+        tool_pos = [70e3 + 0.3, 104e3 - 0.7, 80e6]
+        
+        self.assertTrue(np.array_equal(
+            tool_mesh.get_z(surf_mesh, tool_pos),
+            tool_mesh.get_z_separable(x_vec, y_vec, tool_pos)))
+    
+    def test_out(self):
+        """ evaluation into preallocated arrays equals new arrays """
+        x_vec = np.arange(0.0, 0.140e6, 100)
+        y_vec = np.arange(0.0, 0.210e6, 100)
+        surf_mesh = np.meshgrid(x_vec, y_vec)
+        tool_pos = [70e3 + 0.3, 104e3 - 0.7, 80e6]
+        
+        for dtype in (np.float64, np.float32):
+            tool_mesh = MeshToolFlyCut(r_fly=80e6, delta_r_fly=0.1, 
+                                       r_eps=0.8e6, dtype=dtype)
+            out = np.empty(surf_mesh[0].shape, dtype=dtype)
+            work = [np.empty_like(out), np.empty_like(out)]
+            
+            t_z = tool_mesh.get_z(surf_mesh, tool_pos, out=out, work=work)
+            self.assertIs(t_z, out)
+            self.assertTrue(np.array_equal(
+                t_z, tool_mesh.get_z(surf_mesh, tool_pos)))
+            
+            t_z = tool_mesh.get_z_separable(x_vec, y_vec, tool_pos, out=out)
+            self.assertIs(t_z, out)
+            self.assertTrue(np.array_equal(
+                t_z, tool_mesh.get_z_separable(x_vec, y_vec, tool_pos)))
+    
+    def test_envelope(self):
+        """ envelope equals minimum of the tool heights within footprints """
+        x_vec = np.arange(0.0, 0.140e6, 100)
+        y_vec = np.arange(0.0, 0.020e6, 100)
+        
+        tool_mesh = MeshToolFlyCut(r_fly=60e6, delta_r_fly=0.1, r_eps=0.762e6)
+        pos_x = np.array([10e3, 45e3, 80e3, 115e3]) + 0.3
+        pos_y = 10e3
+        pos_z = 60e6
+        
+        expected = np.full((len(y_vec), len(x_vec)), np.inf)
+        x_lims = []
+        for x_m in pos_x:
+            x_lim, _ = tool_mesh.footprint([x_m, pos_y, pos_z], lim_z=40.0)
+            x_lims.append(x_lim)
+            cols = (x_vec >= x_lim[0]) & (x_vec <= x_lim[1])
+            expected[:, cols] = np.minimum(
+                expected[:, cols], 
+                tool_mesh.get_z_separable(x_vec[cols], y_vec, [x_m, pos_y, pos_z]))
+        
+        t_z = tool_mesh.get_z_envelope(x_vec, y_vec, [pos_x, pos_y, pos_z], 
+                                       np.transpose(x_lims))
+        
+        self.assertTrue(np.array_equal(t_z, expected))
+    
+    def test_precision(self):
+        """ heights relative to the apex without cancellation """
+        x_vec = np.arange(-0.1e6, 0.1e6, 100) + 0.3
+        y_vec = np.arange(-2e3, 2e3, 10) - 0.7
+        
+        tool_mesh = MeshToolFlyCut(r_fly=60e6, delta_r_fly=0.1, r_eps=0.762e6)
+        tool_pos = [0.0, 0.0, 60e6 + 0.1 + 40.0]
+        
+        # reference in extended precision (same radius as in float64)
+        r_fly = np.longdouble(60e6 + 0.1)
+        r_eps = np.longdouble(0.762e6)
+        x_ld = x_vec.astype(np.longdouble)
+        y_ld = y_vec.astype(np.longdouble)
+        expected = ((x_ld**2 / (r_fly + np.sqrt(r_fly**2 - x_ld**2)))[np.newaxis, :]
+                    + (y_ld**2 / (r_eps + np.sqrt(r_eps**2 - y_ld**2)))[:, np.newaxis]
+                    + (np.longdouble(tool_pos[2]) - r_fly))
+        
+        t_z = tool_mesh.get_z_separable(x_vec, y_vec, tool_pos)
+        self.assertEqual(t_z.dtype, np.float64)
+        self.assertLess(np.max(np.abs(t_z - expected)), 1e-12)
+        
+        # float32: below 4 ulp of the heights
+        tool_mesh = MeshToolFlyCut(r_fly=60e6, delta_r_fly=0.1, r_eps=0.762e6,
+                                   dtype=np.float32)
+        t_z = tool_mesh.get_z_separable(x_vec, y_vec, tool_pos)
+        self.assertEqual(t_z.dtype, np.float32)
+        self.assertTrue(np.all(np.abs(t_z - expected) 
+                               <= 4 * np.spacing(np.abs(t_z))))
         
 
 if __name__ == '__main__':
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Unit test for quantized surface heights.
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author:  Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+from PySurfSim import (MeshToolFlyCut, QuantizedHeights, RegularSurface, 
+                       apply_mesh_tool_to_workpiece, default_parameters, 
+                       export_surface, gen_surface_mesh)
+
+
+class TestUnitQuantizedHeights(unittest.TestCase):
+    """ Test Cases for quantized heights """
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.surf_z = rng.normal(40.0, 10.0, (21, 11))
+        
+    def test_quantize(self):
+        """ rounding to the quantum and range of the counts """
+        heights = QuantizedHeights.from_heights(self.surf_z, 1e-3)
+        
+        self.assertEqual(heights.counts.dtype, np.int32)
+        self.assertEqual(heights.shape, self.surf_z.shape)
+        self.assertEqual(heights.base, np.max(self.surf_z))
+        self.assertLessEqual(np.max(np.abs(heights[...] - self.surf_z)), 0.5e-3)
+        self.assertEqual(np.max(heights), heights[...].max())
+        self.assertTrue(np.array_equal(heights[3:5, 2], heights[...][3:5, 2]))
+        
+        heights[0, 0] = 12.3456
+        self.assertLessEqual(abs(heights[0, 0] - 12.3456), 0.5e-3)
+        
+        with self.assertRaises(ValueError):
+            QuantizedHeights.from_heights(self.surf_z, 1e-3, dtype=np.int16)
+        heights = QuantizedHeights.from_heights(self.surf_z, 1e-2, 
+                                                dtype=np.int16)
+        self.assertLessEqual(np.max(np.abs(heights[...] - self.surf_z)), 0.5e-2)
+        self.assertEqual(heights.nbytes, self.surf_z.nbytes // 4)
+        with self.assertRaises(ValueError):
+            QuantizedHeights(np.zeros((2, 2)))
+
+    def test_apply_and_export(self):
+        """ transparent dequantization for tool application and export """
+        parameters = default_parameters().copy()
+        tool_mesh = np.meshgrid(np.arange(4) * parameters['feed_x'] + 3.3, 
+                                np.arange(14) * parameters['raster_y'] + 1.7)
+        tool_mesh.append(np.ones(np.shape(tool_mesh[0])) * parameters['r_fly'])
+        tool = MeshToolFlyCut(**parameters)
+        
+        surface = gen_surface_mesh(0.2e6, 0.1e6, 40.0, 100.0, regular=True)
+        new_surface = apply_mesh_tool_to_workpiece(surface, tool_mesh, tool)
+        
+        surface_q = gen_surface_mesh(0.2e6, 0.1e6, 40.0, 100.0, quantum=1e-3)
+        self.assertIsInstance(surface_q.z, QuantizedHeights)
+        new_surface_q = apply_mesh_tool_to_workpiece(surface_q, tool_mesh, tool,
+                                                     kernel='separable')
+        self.assertIsInstance(new_surface_q.z, QuantizedHeights)
+        self.assertLessEqual(
+            np.max(np.abs(np.asarray(new_surface_q.z) - new_surface.z)), 0.5e-3)
+        self.assertTrue(np.all(np.asarray(surface_q.z) == 40.0), 
+                        'input was modified')
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir)
+            export_surface(path / 'quantized.asc', new_surface_q, block_size=500)
+            export_surface(path / 'dequantized.asc', RegularSurface(
+                *new_surface_q.axes, np.asarray(new_surface_q.z)))
+            self.assertEqual((path / 'quantized.asc').read_bytes(),
+                             (path / 'dequantized.asc').read_bytes())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+Unit test for reading NC programs.
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author:  Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+from PySurfSim import gen_tool_path, read_gcode
+
+PROGRAM = """%
+O1000 (FLY-CUT TEST)
+N10 G21 G90 G54
+N20 S1000 M3
+N30 G0 X0 Y0 Z1
+N40 G1 Z0 F100 ; plunge by 1 mm
+N50 X0.55
+N60 G91 X0.05
+N70 G90 G55 X1.0
+N80 G0 Z5
+M30
+%
+"""
+
+
+class TestUnitReadGcode(unittest.TestCase):
+    """ Test Cases for NC programs as tool paths """
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+        self.path = Path(self.tmp_dir.name)
+        with open(self.path / 'program.nc', 'w', encoding='utf-8') as fid:
+            fid.write(PROGRAM)
+    
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+    
+    def test_program(self):
+        """ moves, modes and work offsets in chunks of any size """
+        work_offsets = {'G54': (0.0, 0.0, 1e5), 'G55': (0.2e6, 0.0, 1e5)}
+        chunks = list(read_gcode(self.path / 'program.nc', 
+                                 work_offsets=work_offsets))
+        positions = np.column_stack([np.concatenate([chunk[k] for chunk in 
+                                                     chunks]) 
+                                     for k in range(3)])
+        
+        # feed per revolution 0.1 mm, rapid moves do not cut
+        self.assertTrue(np.allclose(positions[:10, 2], 
+                                    np.arange(1.0, 0.0, -0.1) * 1e6))
+        self.assertTrue(np.allclose(positions[9:15, 0], 
+                                    np.arange(0.0, 0.55, 0.1) * 1e6))
+        # phase carried over from X0.55 to the incremental move to X0.6
+        self.assertTrue(np.allclose(positions[15], (0.6e6, 0.0, 1e5)))
+        # G55 shifts X by 0.2 mm, the move ends at X1.2 mm
+        self.assertTrue(np.allclose(positions[16:, 0], 
+                                    np.arange(0.7, 1.25, 0.1) * 1e6))
+        self.assertTrue(np.all(positions[9:, 2] == 1e5))
+        self.assertEqual(len(positions), 22)
+        
+        for block_lines, chunk_size in ((1, None), (3, 2), (100, 4)):
+            chunks = list(read_gcode(self.path / 'program.nc', 
+                                     work_offsets=work_offsets, 
+                                     block_lines=block_lines, 
+                                     chunk_size=chunk_size))
+            if chunk_size is not None:
+                self.assertTrue(all(len(chunk.x) <= chunk_size 
+                                    for chunk in chunks))
+            self.assertTrue(np.array_equal(
+                np.column_stack([np.concatenate([chunk[k] for chunk in 
+                                                 chunks]) 
+                                 for k in range(3)]), positions))
+        
+        # G20 (inch) with a fixed spacing in nm
+        with open(self.path / 'inch.nc', 'w', encoding='utf-8') as fid:
+            fid.write('G20 G90 G0 X0 Y0 Z0\nG1 X1\n')
+        chunks = list(read_gcode(self.path / 'inch.nc', spacing=0.5e6))
+        self.assertEqual(len(chunks[0].x), 50)
+        self.assertAlmostEqual(chunks[0].x[-1], 25e6)
+        
+        # cutting move in the first block starts at the work origin
+        with open(self.path / 'first.nc', 'w', encoding='utf-8') as fid:
+            fid.write('G1 X1 F0.25 S1\n')
+        chunks = list(read_gcode(self.path / 'first.nc', 
+                                 work_offsets={'G54': (0.0, 0.0, 1e5)}))
+        self.assertTrue(np.allclose(chunks[0].x, 
+                                    np.arange(0.25, 1.1, 0.25) * 1e6))
+        self.assertTrue(np.all(chunks[0].z == 1e5))
+    
+    def test_raster(self):
+        """ raster program is read like the generated tool path """
+        feed, raster = 50.0, 1000.0
+        tool_mesh = gen_tool_path(2000.0, feed, 4000.0, raster, 1e5)
+        with open(self.path / 'raster.nc', 'w', encoding='utf-8') as fid:
+            fid.write('G21 G90 G54\nS10000 F0.5\n')
+            for y_pos in np.arange(5) * raster / 1e6:
+                fid.write(f'G0 X{-feed / 1e6:.6f} Y{y_pos:.6f} Z0\n'
+                          'G1 X0.002\n')
+        
+        chunks = list(read_gcode(self.path / 'raster.nc', chunk_size=30,
+                                 work_offsets={'G54': (0.0, 0.0, 1e5)}))
+        for k in range(3):
+            self.assertTrue(np.allclose(
+                np.concatenate([chunk[k] for chunk in chunks]), 
+                np.ravel(tool_mesh[k])))
+    
+    def test_errors(self):
+        """ unsupported moves and missing parameters """
+        with open(self.path / 'circle.nc', 'w', encoding='utf-8') as fid:
+            fid.write('G21 G90 S1000 F100\nG1 X1\nG2 X2 Y1 I1 J0\n')
+        with self.assertRaises(ValueError):
+            list(read_gcode(self.path / 'circle.nc'))
+        with open(self.path / 'feed.nc', 'w', encoding='utf-8') as fid:
+            fid.write('G21 G90\nG1 X1\n')
+        with self.assertRaises(ValueError):
+            list(read_gcode(self.path / 'feed.nc'))
+        for block, message in (('G1 X1.2.3', 'malformed number'), 
+                               ('G1 X--1', 'malformed number'), 
+                               ('G1 X', 'malformed number'), 
+                               ('#1=2', 'unsupported syntax')):
+            with open(self.path / 'words.nc', 'w', encoding='utf-8') as fid:
+                fid.write(f'G21 G90 S1000 F100\n{block}\nG1 X2\n')
+            with self.assertRaisesRegex(ValueError, message) as context:
+                list(read_gcode(self.path / 'words.nc'))
+            self.assertIn(repr(block), str(context.exception))
+        with self.assertRaises(ValueError):
+            read_gcode(self.path / 'program.nc', work_offsets={'G53': (0, 0, 0)})
+        with self.assertRaises(ValueError):
+            read_gcode(self.path / 'program.nc', spacing=0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
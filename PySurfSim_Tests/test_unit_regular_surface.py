@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+Unit test for surfaces on regular grids.
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author:  Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+import filecmp
+import unittest
+from pathlib import Path
+
+import numpy as np
+from PySurfSim import (MeshToolFlyCut, RegularSurface, 
+                       apply_mesh_tool_to_workpiece, combine_surface, 
+                       default_parameters, export_surface, gen_surface_mesh, 
+                       slice_surface)
+
+
+class TestRegularSurface(unittest.TestCase):
+    """ Test cases for surfaces on regular grids """
+    def setUp(self):
+        self.surf_mesh = gen_surface_mesh(40e3, 30e3, 40.0, 100.0)
+        self.surface = gen_surface_mesh(40e3, 30e3, 40.0, 100.0, regular=True)
+        
+    def tearDown(self):
+        for filename in ('test_mesh.asc', 'test_regular.asc'):
+            if Path(filename).is_file():
+                Path(filename).unlink()
+
+    def test_views(self):
+        """ X and Y are views on the axes and equal the meshgrid """
+        self.assertIsInstance(self.surface, RegularSurface)
+        self.assertEqual(len(self.surface), 3)
+        for part_mesh, part_regular in zip(self.surf_mesh, self.surface):
+            self.assertTrue(np.array_equal(part_mesh, part_regular))
+        self.assertTrue(np.shares_memory(self.surface[0], self.surface.x_axis))
+        self.assertTrue(np.shares_memory(self.surface[1], self.surface.y_axis))
+        self.assertFalse(self.surface[0].flags.writeable)
+        
+    def test_from_mesh(self):
+        """ conversion from meshgrids """
+        surface = RegularSurface.from_mesh(self.surf_mesh)
+        
+        self.assertTrue(np.shares_memory(surface.z, self.surf_mesh[2]))
+        self.assertTrue(np.array_equal(surface.x_axis, self.surface.x_axis))
+        self.assertTrue(np.array_equal(surface.y_axis, self.surface.y_axis))
+        with self.assertRaises(ValueError):
+            RegularSurface.from_mesh([self.surf_mesh[1], self.surf_mesh[0], 
+                                      self.surf_mesh[2]])
+    
+    def test_apply(self):
+        """ tool application yields the same heights as for meshgrids """
+        parameters = default_parameters().copy()
+        tool = MeshToolFlyCut(**parameters)
+        tool_mesh = np.meshgrid([0.0, 20e3, 40e3], [5e3, 13e3, 21e3])
+        tool_mesh.append(np.ones(np.shape(tool_mesh[0])) * parameters['r_fly'])
+        
+        new_mesh = apply_mesh_tool_to_workpiece(self.surf_mesh, tool_mesh, tool)
+        new_surface = apply_mesh_tool_to_workpiece(self.surface, tool_mesh, tool)
+        
+        self.assertIsInstance(new_surface, RegularSurface)
+        self.assertTrue(np.array_equal(new_mesh[2], new_surface.z))
+        self.assertTrue(np.all(self.surface.z == 40.0), 'input was modified')
+
+    def test_slice_and_combine(self):
+        """ slicing and combination keep the surface """
+        surface_slices = slice_surface(self.surface, 4, 3)
+        
+        self.assertTrue(all(isinstance(thisslice, RegularSurface) 
+                            for thisslice in surface_slices))
+        # offsets locate the patches within the surface
+        for thisslice in surface_slices:
+            row, col = thisslice.offset
+            self.assertEqual(self.surface.y_axis[row], thisslice.y_axis[0])
+            self.assertEqual(self.surface.x_axis[col], thisslice.x_axis[0])
+        self.assertEqual(surface_slices[0].spacing, (100.0, 100.0))
+        
+        combined = combine_surface(surface_slices[::-1], 4, 3)
+        
+        self.assertIsInstance(combined, RegularSurface)
+        for part_org, part_combined in zip(self.surface, combined):
+            self.assertTrue(np.array_equal(part_org, part_combined))
+    
+    def test_export(self):
+        """ export is identical to the export of meshgrids """
+        export_surface('test_mesh.asc', self.surf_mesh)
+        export_surface('test_regular.asc', self.surface)
+        
+        self.assertTrue(filecmp.cmp('test_mesh.asc', 'test_regular.asc', 
+                                    shallow=False))
+
+
+if __name__ == '__main__':
+    unittest.main()
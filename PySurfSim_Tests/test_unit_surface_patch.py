@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Unit test for surface patches given by meshes.
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author:  Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+import unittest
+
+import numpy as np
+from PySurfSim import (MeshToolFlyCut, SurfacePatch, 
+                       apply_mesh_tool_to_workpiece, as_surface, 
+                       default_parameters, gen_surface_mesh, slice_surface)
+
+
+class TestUnitSurfacePatch(unittest.TestCase):
+    """ Test Cases for surface patches """
+    def setUp(self):
+        self.surf_mesh = gen_surface_mesh(40e3, 30e3, 40.0, 100.0)
+        self.patch = as_surface(self.surf_mesh)
+
+    def test_adapter(self):
+        """ meshes are referenced and the metadata derived without copies """
+        self.assertIsInstance(self.patch, SurfacePatch)
+        self.assertIs(as_surface(self.patch), self.patch)
+        self.assertEqual(len(self.patch), 3)
+        for part_mesh, part_patch in zip(self.surf_mesh, self.patch):
+            self.assertIs(part_mesh, part_patch)
+        
+        self.assertEqual(self.patch.shape, self.surf_mesh[2].shape)
+        self.assertEqual(self.patch.origin, (0.0, 0.0))
+        self.assertEqual(self.patch.spacing, (100.0, 100.0))
+        self.assertEqual(self.patch.offset, (0, 0))
+        with self.assertRaises(AttributeError):
+            self.patch.metadata = None
+        with self.assertRaises(ValueError):
+            SurfacePatch(self.surf_mesh[0], self.surf_mesh[1], 
+                         self.surf_mesh[2][1:])
+        
+        # meshes that are not rectilinear
+        mesh_x = self.surf_mesh[0] + 0.1 * self.surf_mesh[1]
+        patch = SurfacePatch(mesh_x, self.surf_mesh[1], self.surf_mesh[2])
+        self.assertIsNone(patch.axes)
+        self.assertIsNone(patch.spacing)
+
+    def test_slice_and_apply(self):
+        """ patches keep their offsets and tool application their type """
+        patches = slice_surface(self.patch, 3, 2)
+        for patch in patches:
+            row, col = patch.offset
+            self.assertTrue(np.shares_memory(patch.z, self.surf_mesh[2]))
+            self.assertEqual(patch.z[0, 0], 
+                             self.surf_mesh[2][row, col])
+            self.assertEqual(patch.origin, (self.surf_mesh[0][row, col],
+                                            self.surf_mesh[1][row, col]))
+        self.assertEqual(patches[4].subset(
+            (slice(2, None), slice(3, 5))).offset, 
+            (patches[4].offset[0] + 2, patches[4].offset[1] + 3))
+        
+        parameters = default_parameters().copy()
+        tool = MeshToolFlyCut(**parameters)
+        tool_mesh = np.meshgrid([0.0, 20e3, 40e3], [5e3, 13e3, 21e3])
+        tool_mesh.append(np.ones(np.shape(tool_mesh[0])) * parameters['r_fly'])
+        new_patch = apply_mesh_tool_to_workpiece(self.patch, tool_mesh, tool)
+        
+        self.assertIsInstance(new_patch, SurfacePatch)
+        self.assertIs(new_patch.x, self.patch.x)
+        self.assertTrue(np.array_equal(
+            new_patch.z, 
+            apply_mesh_tool_to_workpiece(self.surf_mesh, tool_mesh, tool)[2]))
+
+
+if __name__ == '__main__':
+    unittest.main()
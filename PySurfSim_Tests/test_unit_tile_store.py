@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""
+Unit test for the tile store of surfaces.
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author:  Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+from PySurfSim import (MeshToolFlyCut, RegularSurface, TileStore, 
+                       apply_mesh_tool_to_workpiece, combine_surface, 
+                       default_parameters, export_surface, slice_surface)
+
+
+class TestUnitTileStore(unittest.TestCase):
+    """ Test Cases for the tile store """
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name)
+        
+        x_vec = np.arange(0.0, 0.02e6 + 100, 100)
+        y_vec = np.arange(0.0, 0.01e6 + 100, 100)
+        rng = np.random.default_rng(0)
+        self.surface = RegularSurface(
+            x_vec, y_vec, rng.normal(40.0, 1.0, (len(y_vec), len(x_vec))))
+    
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+    
+    def test_store(self):
+        """ write, reopen and read a tile store """
+        store = slice_surface(self.surface, 3, 2, store=self.path / 'store')
+        
+        self.assertIsInstance(store, TileStore)
+        self.assertEqual(store.n_tiles, 6)
+        self.assertEqual(store.shape, self.surface.shape)
+        
+        store = TileStore(self.path / 'store')
+        for index, tile in enumerate(store.tiles):
+            self.assertTrue(np.array_equal(store.read_tile(index).z, 
+                                           self.surface.z[tile]))
+            self.assertEqual(store.get_limits(index), 
+                             (np.min(self.surface.z[tile]), 
+                              np.max(self.surface.z[tile])))
+        
+        self.assertTrue(np.array_equal(store.z[10:40, 150:], 
+                                       self.surface.z[10:40, 150:]))
+        self.assertTrue(np.array_equal(store.z[-1], self.surface.z[-1]))
+        self.assertTrue(np.array_equal(np.asarray(store.z), self.surface.z))
+        
+        combined = combine_surface(store, 3, 2)
+        self.assertTrue(np.array_equal(combined.z, self.surface.z))
+        self.assertTrue(np.array_equal(combined.x_axis, self.surface.x_axis))
+        
+        for patch, patch_mem in zip(slice_surface(store, 2, 2), 
+                                    slice_surface(self.surface, 2, 2)):
+            self.assertTrue(np.array_equal(patch.z, patch_mem.z))
+        
+        with self.assertRaises(ValueError):
+            TileStore.create(self.path / 'store', *self.surface.axes, 
+                             store.tiles)
+        with self.assertRaises(ValueError):
+            combine_surface(store, 2, 2)
+        
+        # tile by tile into a memory-mapped file
+        combined = combine_surface(store, 3, 2, 
+                                   out=self.path / 'combined.dat')
+        self.assertIsInstance(combined.z, np.memmap)
+        self.assertTrue(np.array_equal(combined.z, self.surface.z))
+        del combined
+        with self.assertRaises(ValueError):
+            combine_surface(store, 3, 2, out=np.empty((2, 2)))
+    
+    def test_flush(self):
+        """ manifest written once for several tiles """
+        tiles = [(slice(0, 60), slice(None)), (slice(60, None), slice(None))]
+        store = TileStore.create(self.path / 'store', *self.surface.axes, 
+                                 tiles)
+        with store:
+            for index, tile in enumerate(tiles):
+                store.write_tile(index, self.surface.z[tile])
+                self.assertEqual(
+                    TileStore(self.path / 'store').get_limits(index), 
+                    (None, None))
+        self.assertEqual(TileStore(self.path / 'store').get_limits(1), 
+                         (np.min(self.surface.z[tiles[1]]), 
+                          np.max(self.surface.z[tiles[1]])))
+        
+        store.write_tile(0, self.surface.z[tiles[0]] - 1.0, flush=False)
+        self.assertEqual(TileStore(self.path / 'store').get_limits(0)[1], 
+                         np.max(self.surface.z[tiles[0]]))
+        store.flush()
+        self.assertEqual(TileStore(self.path / 'store').get_limits(0)[1], 
+                         np.max(self.surface.z[tiles[0]]) - 1.0)
+    
+    def test_quantized(self):
+        """ tiles stored as counts of a height quantum """
+        # range of about 100 nm exceeds int16 counts of 1 pm
+        surface = self.surface.with_z((self.surface.z - 40.0) * 20.0 + 40.0)
+        store = TileStore.from_surface(self.path / 'store', surface, 
+                                       [(slice(0, 60), slice(None)), 
+                                        (slice(60, None), slice(None))],
+                                       compressed=False, quantum=1e-3)
+        
+        self.assertEqual(store.quantum, 1e-3)
+        self.assertEqual(np.load(self.path / 'store' / 'tile_00000.npy').dtype, 
+                         np.int32)
+        self.assertLessEqual(
+            np.max(np.abs(np.asarray(store.z) - surface.z)), 0.5e-3)
+        
+        store.write_tile(0, np.full((60, 201), 40.0) - self.surface.x_axis * 1e-4)
+        self.assertEqual(np.load(self.path / 'store' / 'tile_00000.npy').dtype, 
+                         np.int16)
+        self.assertEqual(store.get_limits(0), (38.0, 40.0))
+        self.assertLessEqual(np.max(np.abs(
+            store.read_tile(0).z - (40.0 - self.surface.x_axis * 1e-4))), 0.5e-3)
+    
+    def test_apply_and_export(self):
+        """ apply a tool and export tile by tile """
+        parameters = default_parameters().copy()
+        tool_mesh = np.meshgrid(np.arange(4) * parameters['feed_x'] + 3.3, 
+                                np.arange(4) * parameters['raster_y'] + 1.7)
+        tool_mesh.append(np.ones(np.shape(tool_mesh[0])) 
+                         * (parameters['r_fly'] + 38.0))
+        tool = MeshToolFlyCut(**parameters)
+        
+        new_surface = apply_mesh_tool_to_workpiece(self.surface, tool_mesh, tool)
+        
+        store = TileStore.from_surface(self.path / 'store', self.surface, 
+                                       [(slice(0, 60), slice(None)), 
+                                        (slice(60, None), slice(None))],
+                                       compressed=False)
+        new_store = apply_mesh_tool_to_workpiece(store, tool_mesh, tool, 
+                                                 out=self.path / 'result')
+        self.assertTrue(np.array_equal(np.asarray(new_store.z), new_surface.z))
+        self.assertTrue(np.array_equal(np.asarray(store.z), self.surface.z))
+        
+        apply_mesh_tool_to_workpiece(store, tool_mesh, tool)
+        self.assertTrue(np.array_equal(
+            np.asarray(TileStore(self.path / 'store').z), new_surface.z))
+        
+        export_surface(self.path / 'surface.asc', new_surface)
+        export_surface(self.path / 'store.asc', new_store, block_size=500)
+        self.assertEqual((self.path / 'surface.asc').read_bytes(),
+                         (self.path / 'store.asc').read_bytes())
+    
+    def test_apply_incomplete(self):
+        """ apply a tool to a store with tiles not written yet """
+        parameters = default_parameters().copy()
+        tool_mesh = np.meshgrid(np.arange(4) * parameters['feed_x'] + 3.3, 
+                                np.arange(4) * parameters['raster_y'] + 1.7)
+        tool_mesh.append(np.ones(np.shape(tool_mesh[0])) 
+                         * (parameters['r_fly'] + 38.0))
+        tool = MeshToolFlyCut(**parameters)
+        
+        new_surface = apply_mesh_tool_to_workpiece(self.surface, tool_mesh, tool)
+        
+        tiles = [(slice(0, 60), slice(None)), (slice(60, None), slice(None))]
+        store = TileStore.create(self.path / 'store', *self.surface.axes, 
+                                 tiles)
+        self.assertEqual(store.get_limits(0), (None, None))
+        new_store = apply_mesh_tool_to_workpiece(store, tool_mesh, tool, 
+                                                 out=self.path / 'empty')
+        self.assertFalse(new_store.is_written(0))
+        
+        store.write_tile(0, self.surface.z[tiles[0]])
+        # limits missing in the manifest are taken from the tile
+        store.manifest['tiles'][0]['min'] = None
+        store.manifest['tiles'][0]['max'] = None
+        new_store = apply_mesh_tool_to_workpiece(store, tool_mesh, tool, 
+                                                 out=self.path / 'result')
+        self.assertTrue(new_store.is_written(0))
+        self.assertFalse(new_store.is_written(1))
+        self.assertTrue(np.array_equal(new_store.read_tile(0).z, 
+                                       new_surface.z[tiles[0]]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+Unit test for tool paths with spatial index.
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author:  Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+import unittest
+
+import numpy as np
+from PySurfSim import (MeshToolFlyCut, ToolPath, apply_mesh_tool_to_workpiece, 
+                       default_parameters, gen_surface_mesh, slice_surface)
+
+
+class TestToolPath(unittest.TestCase):
+    """ Test cases for tool paths """
+    def setUp(self):
+        self.parameters = default_parameters().copy()
+        
+        self.tool_mesh = np.meshgrid(
+            np.arange(6) * self.parameters['feed_x'] + 3.3, 
+            np.arange(26) * self.parameters['raster_y'] + 1.7)
+        self.tool_mesh.append(
+            np.ones(np.shape(self.tool_mesh[0])) * self.parameters['r_fly'])
+        # some positions that are never engaged
+        self.tool_mesh[2][3, :] += 100.0
+        
+        self.tool = MeshToolFlyCut(**self.parameters)
+        self.tool_path = ToolPath.from_mesh(self.tool_mesh)
+    
+    def test_columns(self):
+        """ positions are stored in flattened order """
+        self.assertEqual(self.tool_path.size, self.tool_mesh[0].size)
+        for part_mesh, part_path in zip(self.tool_mesh, self.tool_path):
+            self.assertTrue(np.array_equal(part_mesh.flatten(), part_path))
+        with self.assertRaises(ValueError):
+            ToolPath([0.0, 1.0], [0.0], [0.0])
+    
+    def test_footprints(self):
+        """ vectorized footprints equal single footprints """
+        x_lim, y_lim = self.tool.footprints(self.tool_path, lim_z=40.0)
+        
+        for k, tool_center in enumerate(zip(*self.tool_path)):
+            fp_x, fp_y = self.tool.footprint(tool_center, lim_z=40.0)
+            if fp_x is None:
+                self.assertTrue(np.all(np.isnan(x_lim[:, k])))
+            else:
+                self.assertEqual(tuple(x_lim[:, k]), fp_x)
+                self.assertEqual(tuple(y_lim[:, k]), fp_y)
+    
+    def test_query(self):
+        """ query yields the positions with intersecting footprints """
+        with self.assertRaises(RuntimeError):
+            self.tool_path.query((0.0, 1.0), (0.0, 1.0))
+        
+        self.tool_path.build_index(self.tool, 40.0, bucket_size=(20e3, 5e3))
+        x_lim, y_lim = self.tool.footprints(self.tool_path, lim_z=40.0)
+        
+        rng = np.random.default_rng(7)
+        for x_0, y_0 in zip(rng.uniform(-0.1e6, 0.5e6, 40), 
+                            rng.uniform(-0.05e6, 0.25e6, 40)):
+            x_range = (x_0, x_0 + 25e3)
+            y_range = (y_0, y_0 + 12e3)
+            expected = np.flatnonzero((x_lim[0] <= x_range[1]) 
+                                      & (x_lim[1] >= x_range[0])
+                                      & (y_lim[0] <= y_range[1]) 
+                                      & (y_lim[1] >= y_range[0]))
+            
+            self.assertTrue(np.array_equal(
+                self.tool_path.query(x_range, y_range), expected))
+    
+    def test_apply_to_patches(self):
+        """ patches only see the tool positions reaching them """
+        surface = gen_surface_mesh(0.4e6, 0.2e6, 40.0, 100.0, regular=True)
+        self.tool_path.build_index(self.tool, 40.0)
+        
+        for patch in slice_surface(surface, 4, 4):
+            new_patch = apply_mesh_tool_to_workpiece(
+                patch, self.tool_mesh, self.tool, kernel='envelope')
+            new_patch_path = apply_mesh_tool_to_workpiece(
+                patch, self.tool_path, self.tool, kernel='envelope')
+            
+            self.assertTrue(np.array_equal(new_patch.z, new_patch_path.z))
+
+
+if __name__ == '__main__':
+    unittest.main()
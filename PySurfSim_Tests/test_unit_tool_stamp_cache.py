@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Unit test for the tool stamp cache.
+
+Copyright (C) 2026  Lars Schönemann
+
+This library is free software; you can redistribute it and/or modify 
+it under the terms of the GNU Lesser General Public License as published by 
+the Free Software Foundation; either version 2.1 of the License, or 
+(at your option) any later version.
+
+This library is distributed in the hope that it will be useful, 
+but WITHOUT ANY WARRANTY; without even the implied warranty of 
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the 
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License 
+along with this library; if not, write to the Free Software Foundation, Inc., 
+51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+
+@author:  Dr.-Ing. Lars Schönemann
+@contact: schoenemann@iwt.uni-bremen.de
+@address: LFM Laboratory for Precision Machining
+          Leibniz-Institut für Werkstofforientierte Technologien IWT
+          Badgasteiner Straße 2
+          28359 Bremen
+          Germany
+@version: 1.3
+@date:    2026-10-17
+"""
+import unittest
+
+import numpy as np
+from PySurfSim import MeshToolFlyCut, ToolStampCache, default_parameters
+
+
+class TestToolStampCache(unittest.TestCase):
+    """ Test cases for the tool stamp cache """
+    def setUp(self):
+        self.tool = MeshToolFlyCut(**default_parameters())
+        self.cache = ToolStampCache(self.tool, (100.0, 50.0), maxsize=2)
+        
+    def test_stamp(self):
+        """ stamp equals the tool at Z = z_offset shifted by whole pixels """
+        extent = ((-4, 4), (-10, 10))
+        stamp = self.cache.get('a', (30.0, -10.0), extent)
+        
+        x_vec = np.arange(-10, 11) * 100.0 + 5e3
+        y_vec = np.arange(-4, 5) * 50.0 + 2e3
+        t_z = self.tool.get_z(np.meshgrid(x_vec, y_vec), 
+                              [5e3 + 30.0, 2e3 - 10.0, 60e6])
+        
+        self.assertEqual(stamp.shape, (9, 21))
+        self.assertTrue(np.allclose(stamp + (60e6 - self.cache.z_offset), t_z, 
+                                    rtol=0.0, atol=1e-6))
+    
+    def test_lru(self):
+        """ stamps are reused and least recently used stamps are dropped """
+        extent = ((-1, 1), (-1, 1))
+        stamp_a = self.cache.get('a', (0.0, 0.0), extent)
+        self.cache.get('b', (10.0, 0.0), extent)
+        
+        self.assertIs(self.cache.get('a', (0.0, 0.0), extent), stamp_a)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+        
+        # 'b' is least recently used
+        self.cache.get('c', (20.0, 0.0), extent)
+        self.assertEqual(len(self.cache), 2)
+        self.assertIs(self.cache.get('a', (0.0, 0.0), extent), stamp_a)
+        self.cache.get('b', (10.0, 0.0), extent)
+        self.assertEqual(self.cache.misses, 4)
+        
+    def test_maxsize(self):
+        """ cache size has to be positive """
+        with self.assertRaises(ValueError):
+            ToolStampCache(self.tool, (100.0, 50.0), maxsize=0)
+
+
+if __name__ == '__main__':
+    unittest.main()